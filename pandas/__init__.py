@@ -62,6 +62,7 @@ from pandas.core.api import (
     UInt16Dtype,
     UInt32Dtype,
     UInt64Dtype,
+    StringDtype,
     CategoricalDtype,
     PeriodDtype,
     IntervalDtype,
@@ -107,6 +108,7 @@ from pandas.core.api import (
     unique,
     value_counts,
     NamedAgg,
+    combine_partials,
     array,
     Categorical,
     set_eng_float_format,
@@ -124,7 +126,7 @@ from pandas.core.sparse.api import (
 from pandas.tseries.api import infer_freq
 from pandas.tseries import offsets
 
-from pandas.core.computation.api import eval
+from pandas.core.computation.api import compile_expr, eval
 
 from pandas.core.reshape.api import (
     concat,
@@ -167,6 +169,7 @@ from pandas.io.api import (
     read_sql_query,
     read_sql_table,
     # misc
+    read_blocks,
     read_clipboard,
     read_parquet,
     read_feather,
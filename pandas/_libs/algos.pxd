@@ -1,6 +1,14 @@
+from numpy cimport int64_t, uint64_t
+
 from pandas._libs.util cimport numeric
 
 
+ctypedef fused masked_int_t:
+    # the values of IntegerArray, widened to 64 bits
+    int64_t
+    uint64_t
+
+
 cdef inline Py_ssize_t swap(numeric *a, numeric *b) nogil:
     cdef:
         numeric t
@@ -222,6 +222,94 @@ def kth_smallest(numeric[:] a, Py_ssize_t k) -> numeric:
     return a[k]
 
 
+# ----------------------------------------------------------------------
+# Reductions of integer values with a mask of missing values
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def masked_reduce(ndarray[masked_int_t] values, const uint8_t[:] mask,
+                  str how, bint skipna=True, Py_ssize_t min_count=0,
+                  Py_ssize_t ddof=1):
+    """
+    Reduce integer values, skipping those where mask is set, without casting
+    them to float.
+
+    Parameters
+    ----------
+    values : ndarray[int64 or uint64]
+    mask : ndarray[uint8]
+        1 where the values are missing.
+    how : {'sum', 'min', 'max', 'mean', 'var'}
+    skipna : bool, default True
+        If False, the result is missing if any value is.
+    min_count : int, default 0
+        The result of 'sum' is missing if fewer values are observed.
+    ddof : int, default 1
+        Delta degrees of freedom of 'var'.
+
+    Returns
+    -------
+    int, float or None
+        An int for 'sum', 'min' and 'max', where sums wrap around on
+        overflow like numpy integer arithmetic, and a float for 'mean' and
+        'var'. None if the result is missing.
+    """
+    cdef:
+        Py_ssize_t i, N = len(values), nobs = 0
+        int op
+        masked_int_t val, acc = 0
+        float64_t fval, total = 0, mean = 0, ssqdm = 0, oldmean
+        bint missing = False
+
+    try:
+        op = ["sum", "min", "max", "mean", "var"].index(how)
+    except ValueError:
+        raise ValueError("Unsupported reduction: {how}".format(how=how))
+
+    if len(mask) != N:
+        raise ValueError("values and mask must have the same length")
+
+    with nogil:
+        for i in range(N):
+            if mask[i]:
+                if not skipna:
+                    missing = True
+                    break
+                continue
+
+            val = values[i]
+            nobs += 1
+            if op == 0:
+                # unsigned arithmetic wraps around for signed values too
+                acc = <masked_int_t>(<uint64_t>acc + <uint64_t>val)
+            elif op == 1:
+                if nobs == 1 or val < acc:
+                    acc = val
+            elif op == 2:
+                if nobs == 1 or val > acc:
+                    acc = val
+            elif op == 3:
+                total += <float64_t>val
+            else:
+                fval = <float64_t>val
+                oldmean = mean
+                mean += (fval - oldmean) / nobs
+                ssqdm += (fval - mean) * (fval - oldmean)
+
+    if missing:
+        return None
+
+    if op == 0:
+        return acc if nobs >= min_count else None
+    elif op == 1 or op == 2:
+        return acc if nobs else None
+    elif op == 3:
+        return total / nobs if nobs else None
+    return ssqdm / (nobs - ddof) if nobs > ddof else None
+
+
 # ----------------------------------------------------------------------
 # Pairwise correlation/covariance
 
@@ -16,7 +16,7 @@ from pandas._libs.util cimport numeric, get_nat
 
 from pandas._libs.algos cimport (swap, TiebreakEnumType, TIEBREAK_AVERAGE,
                                  TIEBREAK_MIN, TIEBREAK_MAX, TIEBREAK_FIRST,
-                                 TIEBREAK_DENSE)
+                                 TIEBREAK_DENSE, masked_int_t)
 from pandas._libs.algos import (take_2d_axis1_float64_float64,
                                 groupsort_indexer, tiebreakers)
 
@@ -683,6 +683,109 @@ group_ohlc_float32 = _group_ohlc['float']
 group_ohlc_float64 = _group_ohlc['double']
 
 
+cdef enum BinAggregation:
+    BIN_FIRST
+    BIN_LAST
+    BIN_MIN
+    BIN_MAX
+    BIN_SUM
+    BIN_MEAN
+    BIN_COUNT
+
+bin_aggregations = {
+    'first': BIN_FIRST,
+    'last': BIN_LAST,
+    'min': BIN_MIN,
+    'max': BIN_MAX,
+    'sum': BIN_SUM,
+    'mean': BIN_MEAN,
+    'count': BIN_COUNT,
+}
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+@cython.cdivision(True)
+def group_agg_bins(float64_t[:, :] out,
+                   const float64_t[:, :] values,
+                   const int64_t[:] bins,
+                   const int64_t[:] hows):
+    """
+    Compute several aggregations of the contiguous bins of sorted values in
+    a single pass, like group_ohlc does for open, high, low and close.
+
+    Parameters
+    ----------
+    out : array
+        Array of shape (len(bins), K * len(hows)) to store the aggregations
+        in, those of column k of values in columns k * len(hows) onwards.
+    values : array
+        Array of shape (K, N) of the values, one row per column, skipping
+        NaN.
+    bins : int64 array
+        End position of each bin in the values, as built by BinGrouper.
+    hows : int64 array
+        The codes of the aggregations in bin_aggregations. 'sum' of a bin
+        without values is 0, 'count' is 0 and the others are NaN.
+    """
+    cdef:
+        Py_ssize_t i, j, k, col, start, end
+        Py_ssize_t K, N, H = len(hows), ngroups = len(bins)
+        int64_t nobs
+        float64_t val, first, last, vmin, vmax, total, res
+
+    K, N = (<object>values).shape
+
+    if out.shape[0] != ngroups or out.shape[1] != K * H:
+        raise ValueError('Output array must have shape '
+                         '(len(bins), len(values) * len(hows))')
+    if ngroups and (bins[ngroups - 1] > N or bins[0] < 0):
+        raise ValueError('bins must end within the values')
+
+    with nogil:
+        for k in range(K):
+            start = 0
+            for j in range(ngroups):
+                end = bins[j]
+
+                nobs = 0
+                total = 0
+                first = last = vmin = vmax = NAN
+                for i in range(start, end):
+                    val = values[k, i]
+                    if val != val:
+                        continue
+
+                    nobs += 1
+                    if nobs == 1:
+                        first = vmin = vmax = val
+                    elif val < vmin:
+                        vmin = val
+                    elif val > vmax:
+                        vmax = val
+                    last = val
+                    total += val
+
+                for col in range(H):
+                    if hows[col] == BIN_FIRST:
+                        res = first
+                    elif hows[col] == BIN_LAST:
+                        res = last
+                    elif hows[col] == BIN_MIN:
+                        res = vmin
+                    elif hows[col] == BIN_MAX:
+                        res = vmax
+                    elif hows[col] == BIN_SUM:
+                        res = total
+                    elif hows[col] == BIN_MEAN:
+                        res = total / nobs if nobs else NAN
+                    else:
+                        res = nobs
+                    out[j, k * H + col] = res
+
+                start = end
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def group_quantile(ndarray[float64_t] out,
@@ -788,5 +891,258 @@ def group_quantile(ndarray[float64_t] out,
             grp_start += grp_sz
 
 
+# ----------------------------------------------------------------------
+# Kernels for integer values with a mask of missing values (IntegerArray)
+
+cdef enum MaskedReduction:
+    MASKED_ADD
+    MASKED_MIN
+    MASKED_MAX
+    MASKED_FIRST
+    MASKED_LAST
+
+masked_reductions = {
+    'add': MASKED_ADD,
+    'min': MASKED_MIN,
+    'max': MASKED_MAX,
+    'first': MASKED_FIRST,
+    'last': MASKED_LAST,
+}
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_reduce_masked(masked_int_t[:] out,
+                        uint8_t[:] out_mask,
+                        int64_t[:] counts,
+                        ndarray[masked_int_t] values,
+                        const uint8_t[:] mask,
+                        const int64_t[:] labels,
+                        str how,
+                        Py_ssize_t min_count=-1):
+    """
+    Reduce the integer values of each group, skipping those where mask is
+    set, without casting them to float.
+
+    Parameters
+    ----------
+    out : array
+        Array to store the result of each group in.
+    out_mask : array
+        Set to 1 where the result of a group is missing.
+    counts : array
+        Incremented by the number of rows of each group.
+    values : array
+        Values to reduce.
+    mask : array
+        1 where the values are missing.
+    labels : int64 array
+        Labels to group by.
+    how : {'add', 'min', 'max', 'first', 'last'}
+    min_count : int, default -1
+        The result of a group with fewer observed values is missing. The
+        result of 'min', 'max', 'first' and 'last' is missing if there are
+        none.
+
+    Notes
+    -----
+    Sums wrap around on overflow, like numpy integer arithmetic.
+    """
+    cdef:
+        Py_ssize_t i, N = len(values), ncounts = len(counts)
+        int64_t lab
+        MaskedReduction op = masked_reductions[how]
+        masked_int_t val
+        int64_t[:] nobs
+
+    if len(labels) != N:
+        raise AssertionError("len(index) != len(labels)")
+
+    nobs = np.zeros(ncounts, dtype=np.int64)
+    if op != MASKED_ADD:
+        min_count = max(min_count, 1)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            if mask[i]:
+                continue
+
+            val = values[i]
+            nobs[lab] += 1
+            if nobs[lab] == 1:
+                out[lab] = val
+            elif op == MASKED_ADD:
+                # unsigned arithmetic wraps around for signed values too
+                out[lab] = <masked_int_t>(<uint64_t>out[lab] + <uint64_t>val)
+            elif op == MASKED_MIN:
+                if val < out[lab]:
+                    out[lab] = val
+            elif op == MASKED_MAX:
+                if val > out[lab]:
+                    out[lab] = val
+            elif op == MASKED_LAST:
+                out[lab] = val
+
+        for i in range(ncounts):
+            out_mask[i] = nobs[i] < min_count
+            if nobs[i] == 0:
+                out[i] = 0
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+@cython.cdivision(True)
+def group_mean_masked(float64_t[:] out,
+                      int64_t[:] counts,
+                      ndarray[masked_int_t] values,
+                      const uint8_t[:] mask,
+                      const int64_t[:] labels):
+    """
+    Mean of the integer values of each group, skipping those where mask is
+    set. Groups without values get NaN.
+    """
+    cdef:
+        Py_ssize_t i, N = len(values), ncounts = len(counts)
+        int64_t lab
+        int64_t[:] nobs
+
+    if len(labels) != N:
+        raise AssertionError("len(index) != len(labels)")
+
+    nobs = np.zeros(ncounts, dtype=np.int64)
+    out[:] = 0.0
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            if not mask[i]:
+                nobs[lab] += 1
+                out[lab] += <float64_t>values[i]
+
+        for i in range(ncounts):
+            if nobs[i] == 0:
+                out[i] = NaN
+            else:
+                out[i] /= nobs[i]
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+@cython.cdivision(True)
+def group_var_masked(float64_t[:] out,
+                     int64_t[:] counts,
+                     ndarray[masked_int_t] values,
+                     const uint8_t[:] mask,
+                     const int64_t[:] labels,
+                     Py_ssize_t ddof=1):
+    """
+    Variance of the integer values of each group, skipping those where mask
+    is set. Groups with no more than ddof values get NaN.
+    """
+    cdef:
+        Py_ssize_t i, N = len(values), ncounts = len(counts)
+        int64_t lab
+        float64_t val, oldmean
+        int64_t[:] nobs
+        float64_t[:] mean
+
+    if len(labels) != N:
+        raise AssertionError("len(index) != len(labels)")
+
+    nobs = np.zeros(ncounts, dtype=np.int64)
+    mean = np.zeros(ncounts, dtype=np.float64)
+    out[:] = 0.0
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            if not mask[i]:
+                val = <float64_t>values[i]
+                nobs[lab] += 1
+                oldmean = mean[lab]
+                mean[lab] += (val - oldmean) / nobs[lab]
+                out[lab] += (val - mean[lab]) * (val - oldmean)
+
+        for i in range(ncounts):
+            if nobs[i] <= ddof:
+                out[i] = NaN
+            else:
+                out[i] /= (nobs[i] - ddof)
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_cumsum_masked(masked_int_t[:] out,
+                        uint8_t[:] out_mask,
+                        ndarray[masked_int_t] values,
+                        const uint8_t[:] mask,
+                        const int64_t[:] labels,
+                        int ngroups,
+                        bint skipna=True):
+    """
+    Cumulative sum of the integer values in row groups `labels`, skipping
+    those where mask is set.
+
+    Parameters
+    ----------
+    out : array
+        Array to store cumsum in.
+    out_mask : array
+        Set to 1 where the cumsum is missing: at missing values, rows
+        without a group, and after a missing value if not skipna.
+    values : array
+        Values to take cumsum of.
+    mask : array
+        1 where the values are missing.
+    labels : int64 array
+        Labels to group by.
+    ngroups : int
+        Number of groups, larger than all entries of `labels`.
+    skipna : bool
+        If true, ignore missing values in `values`.
+    """
+    cdef:
+        Py_ssize_t i, N = len(values)
+        int64_t lab
+        masked_int_t[:] accum
+        uint8_t[:] accum_mask
+
+    accum = np.zeros(ngroups, dtype=np.asarray(values).dtype)
+    accum_mask = np.zeros(ngroups, dtype=np.uint8)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                out[i] = 0
+                out_mask[i] = 1
+                continue
+
+            if mask[i]:
+                if not skipna:
+                    accum_mask[lab] = 1
+                out[i] = 0
+                out_mask[i] = 1
+                continue
+
+            accum[lab] = <masked_int_t>(<uint64_t>accum[lab] +
+                                        <uint64_t>values[i])
+            out[i] = accum[lab]
+            out_mask[i] = accum_mask[lab]
+
+
 # generated from template
 include "groupby_helper.pxi"
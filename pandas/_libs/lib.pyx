@@ -916,7 +916,7 @@ _TYPE_MAP = {
     'complex64': 'complex',
     'complex128': 'complex',
     'c': 'complex',
-    'string': 'bytes',
+    'string': 'string',
     'S': 'bytes',
     'U': 'string',
     'bool': 'boolean',
@@ -2345,6 +2345,42 @@ def to_object_array_tuples(rows: object):
     return result
 
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def fill_columns_from_rows(list rows, ndarray[object, ndim=2] out) -> None:
+    """
+    Transpose a list of rows into the columns of a preallocated object array.
+
+    Parameters
+    ----------
+    rows : list of sequences
+        N rows of K values each, e.g. as returned by a DBAPI2 cursor.
+    out : 2-d object array (K, M), with M >= N
+        Column ``j`` of the rows is written to ``out[j, :N]``.
+    """
+    cdef:
+        Py_ssize_t i, j, n, k
+        tuple row
+
+    n = len(rows)
+    k = out.shape[0]
+
+    if n > out.shape[1]:
+        raise ValueError("out holds {cap} rows, got {n}"
+                         .format(cap=out.shape[1], n=n))
+
+    for i in range(n):
+        if type(rows[i]) is tuple:
+            row = rows[i]
+        else:
+            row = tuple(rows[i])
+        if len(row) != k:
+            raise ValueError("{k} columns expected, row {i} has {got}"
+                             .format(k=k, i=i, got=len(row)))
+        for j in range(k):
+            out[j, i] = row[j]
+
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def fast_multiget(dict mapping, ndarray keys, default=np.nan):
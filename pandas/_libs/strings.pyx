@@ -0,0 +1,341 @@
+"""
+Kernels for StringArray, which stores strings as a single contiguous UTF-8
+buffer ``data`` plus ``offsets`` into it: element ``i`` is the byte range
+``data[offsets[i]:offsets[i + 1]]``. Missing elements are handled by the
+caller through a separate mask (their byte range is empty).
+"""
+import cython
+from cython import Py_ssize_t
+
+from cpython.unicode cimport PyUnicode_DecodeUTF8
+from libc.string cimport memchr, memcmp
+
+import numpy as np
+cimport numpy as cnp
+from numpy cimport ndarray, int64_t, uint8_t, uint64_t
+cnp.import_array()
+
+
+cdef inline bint is_char_start(uint8_t byte) nogil:
+    # UTF-8 continuation bytes have the form 0b10xxxxxx
+    return (byte & 0xC0) != 0x80
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def decode(const uint8_t[:] data, const int64_t[:] offsets,
+           const uint8_t[:] mask, object na_value):
+    """
+    Materialize the strings as an object ndarray, with ``na_value`` where
+    ``mask`` is set.
+    """
+    cdef:
+        Py_ssize_t i, n = len(offsets) - 1
+        ndarray[object] result = np.empty(n, dtype=object)
+        const char *buf = ""
+
+    if len(data):
+        buf = <const char *>&data[0]
+
+    for i in range(n):
+        if mask[i]:
+            result[i] = na_value
+        else:
+            result[i] = PyUnicode_DecodeUTF8(buf + offsets[i],
+                                             offsets[i + 1] - offsets[i],
+                                             NULL)
+    return result
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def str_len(const uint8_t[:] data, const int64_t[:] offsets):
+    """
+    Number of characters (not bytes) of each string.
+    """
+    cdef:
+        Py_ssize_t i, j, n = len(offsets) - 1
+        int64_t count
+        ndarray[int64_t] result = np.empty(n, dtype=np.int64)
+
+    with nogil:
+        for i in range(n):
+            count = 0
+            for j in range(offsets[i], offsets[i + 1]):
+                count += is_char_start(data[j])
+            result[i] = count
+    return result
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def str_startswith(const uint8_t[:] data, const int64_t[:] offsets,
+                   bytes pat):
+    cdef:
+        Py_ssize_t i, n = len(offsets) - 1
+        Py_ssize_t k = len(pat)
+        const char *p = pat
+        const char *buf
+        ndarray[uint8_t, cast=True] result = np.ones(n, dtype=bool)
+
+    if k == 0:
+        return result
+    if not len(data):
+        return np.zeros(n, dtype=bool)
+    buf = <const char *>&data[0]
+
+    with nogil:
+        for i in range(n):
+            result[i] = (offsets[i + 1] - offsets[i] >= k and
+                         memcmp(buf + offsets[i], p, k) == 0)
+    return result
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def str_endswith(const uint8_t[:] data, const int64_t[:] offsets,
+                 bytes pat):
+    cdef:
+        Py_ssize_t i, n = len(offsets) - 1
+        Py_ssize_t k = len(pat)
+        const char *p = pat
+        const char *buf
+        ndarray[uint8_t, cast=True] result = np.ones(n, dtype=bool)
+
+    if k == 0:
+        return result
+    if not len(data):
+        return np.zeros(n, dtype=bool)
+    buf = <const char *>&data[0]
+
+    with nogil:
+        for i in range(n):
+            result[i] = (offsets[i + 1] - offsets[i] >= k and
+                         memcmp(buf + offsets[i + 1] - k, p, k) == 0)
+    return result
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def str_contains(const uint8_t[:] data, const int64_t[:] offsets,
+                 bytes pat):
+    """
+    Whether each string contains the literal ``pat`` (a substring search,
+    not a regular expression).
+    """
+    cdef:
+        Py_ssize_t i, n = len(offsets) - 1
+        Py_ssize_t k = len(pat)
+        const char *p = pat
+        const char *buf
+        const char *pos
+        const char *last
+        ndarray[uint8_t, cast=True] result = np.ones(n, dtype=bool)
+
+    if k == 0:
+        return result
+    if not len(data):
+        return np.zeros(n, dtype=bool)
+    buf = <const char *>&data[0]
+
+    with nogil:
+        for i in range(n):
+            result[i] = False
+            pos = buf + offsets[i]
+            # last position at which a match can start
+            last = buf + offsets[i + 1] - k
+            while pos <= last:
+                pos = <const char *>memchr(pos, p[0], last - pos + 1)
+                if pos == NULL:
+                    break
+                if memcmp(pos, p, k) == 0:
+                    result[i] = True
+                    break
+                pos += 1
+    return result
+
+
+cdef inline Py_ssize_t adjust_index(Py_ssize_t index, Py_ssize_t length,
+                                    Py_ssize_t step) nogil:
+    # same clipping as PySlice_AdjustIndices
+    if index < 0:
+        index += length
+        if index < 0:
+            index = -1 if step < 0 else 0
+    elif index >= length:
+        index = length - 1 if step < 0 else length
+    return index
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def str_slice(const uint8_t[:] data, const int64_t[:] offsets,
+              object start, object stop, Py_ssize_t step):
+    """
+    Apply the slice ``[start:stop:step]`` to the characters of each string.
+
+    Returns
+    -------
+    tuple of (data, offsets)
+    """
+    cdef:
+        Py_ssize_t i, j, c, nchars, length, total = 0
+        Py_ssize_t n = len(offsets) - 1
+        Py_ssize_t cstart = 0, cstop = 0, begin, end
+        bint has_start = start is not None
+        bint has_stop = stop is not None
+        ndarray[int64_t] starts
+        ndarray[uint8_t] result
+        ndarray[int64_t] result_offsets = np.empty(n + 1, dtype=np.int64)
+
+    if has_start:
+        cstart = start
+    if has_stop:
+        cstop = stop
+
+    # the result is never longer than the input
+    result = np.empty(offsets[n] - offsets[0], dtype=np.uint8)
+    # byte position of every character of a string, plus its end
+    starts = np.empty(result.shape[0] + 1, dtype=np.int64)
+
+    result_offsets[0] = 0
+    with nogil:
+        for i in range(n):
+            nchars = 0
+            for j in range(offsets[i], offsets[i + 1]):
+                if is_char_start(data[j]):
+                    starts[nchars] = j
+                    nchars += 1
+            starts[nchars] = offsets[i + 1]
+
+            if step > 0:
+                begin = adjust_index(cstart, nchars, step) if has_start else 0
+                end = adjust_index(cstop, nchars, step) if has_stop else nchars
+            else:
+                begin = (adjust_index(cstart, nchars, step) if has_start
+                         else nchars - 1)
+                end = adjust_index(cstop, nchars, step) if has_stop else -1
+
+            if step == 1:
+                if begin < end:
+                    length = starts[end] - starts[begin]
+                    for j in range(length):
+                        result[total + j] = data[starts[begin] + j]
+                    total += length
+            else:
+                c = begin
+                while (step > 0 and c < end) or (step < 0 and c > end):
+                    for j in range(starts[c], starts[c + 1]):
+                        result[total] = data[j]
+                        total += 1
+                    c += step
+            result_offsets[i + 1] = total
+
+    return result[:total], result_offsets
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def ascii_case(const uint8_t[:] data, bint upper):
+    """
+    Convert ASCII letters to upper or lower case; other bytes are left
+    unchanged.
+    """
+    cdef:
+        Py_ssize_t i, n = len(data)
+        uint8_t byte
+        ndarray[uint8_t] result = np.empty(n, dtype=np.uint8)
+
+    with nogil:
+        for i in range(n):
+            byte = data[i]
+            if upper and 97 <= byte <= 122:
+                byte -= 32
+            elif not upper and 65 <= byte <= 90:
+                byte += 32
+            result[i] = byte
+    return result
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take(const uint8_t[:] data, const int64_t[:] offsets,
+         const int64_t[:] indexer):
+    """
+    Gather the strings at ``indexer``; -1 gives an empty string.
+
+    Returns
+    -------
+    tuple of (data, offsets)
+    """
+    cdef:
+        Py_ssize_t i, j, idx, total = 0
+        Py_ssize_t n = len(indexer)
+        ndarray[uint8_t] result
+        ndarray[int64_t] result_offsets = np.empty(n + 1, dtype=np.int64)
+
+    result_offsets[0] = 0
+    with nogil:
+        for i in range(n):
+            idx = indexer[i]
+            if idx != -1:
+                total += offsets[idx + 1] - offsets[idx]
+            result_offsets[i + 1] = total
+
+    result = np.empty(total, dtype=np.uint8)
+    total = 0
+    with nogil:
+        for i in range(n):
+            idx = indexer[i]
+            if idx == -1:
+                continue
+            for j in range(offsets[idx], offsets[idx + 1]):
+                result[total] = data[j]
+                total += 1
+    return result, result_offsets
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def hash_strings(const uint8_t[:] data, const int64_t[:] offsets):
+    """
+    64-bit FNV-1a hash of the bytes of each string.
+    """
+    cdef:
+        Py_ssize_t i, j, n = len(offsets) - 1
+        uint64_t h
+        ndarray[uint64_t] result = np.empty(n, dtype=np.uint64)
+
+    with nogil:
+        for i in range(n):
+            h = 14695981039346656037ULL
+            for j in range(offsets[i], offsets[i + 1]):
+                h = (h ^ data[j]) * 1099511628211ULL
+            result[i] = h
+    return result
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def strings_equal(const uint8_t[:] data, const int64_t[:] offsets,
+                  const int64_t[:] left, const int64_t[:] right):
+    """
+    Whether the strings at positions ``left[i]`` and ``right[i]`` are equal.
+    """
+    cdef:
+        Py_ssize_t i, length, n = len(left)
+        const char *buf
+        ndarray[uint8_t, cast=True] result = np.ones(n, dtype=bool)
+
+    if not len(data):
+        return result
+    buf = <const char *>&data[0]
+
+    with nogil:
+        for i in range(n):
+            length = offsets[left[i] + 1] - offsets[left[i]]
+            result[i] = (
+                length == offsets[right[i] + 1] - offsets[right[i]] and
+                memcmp(buf + offsets[left[i]], buf + offsets[right[i]],
+                       length) == 0)
+    return result
@@ -38,6 +38,16 @@ cdef inline int int_max(int a, int b): return a if a >= b else b
 cdef inline int int_min(int a, int b): return a if a <= b else b
 
 
+cdef inline bint window_restarts(int64_t s, int64_t e, int64_t prev_s,
+                                 int64_t prev_e) nogil:
+    """
+    whether the window [s, e) has to be computed from scratch, rather than
+    by adding to & removing from the previous window [prev_s, prev_e);
+    this is the case if it moved backwards or doesn't overlap with it
+    """
+    return s < prev_s or e < prev_e or s >= prev_e
+
+
 # Cython implementations of rolling sum, mean, variance, skewness,
 # other statistical moment functions
 #
@@ -295,6 +305,215 @@ cdef class VariableWindowIndexer(WindowIndexer):
                     end[i] -= 1
 
 
+cdef class BoundsWindowIndexer(WindowIndexer):
+    """
+    create a window indexer object from the start & end of
+    every window, that point to offsets in the values
+
+    the windows are computed by adding to & removing from the previous
+    window while they move forward, and from scratch otherwise
+
+    Parameters
+    ----------
+    start: array-like
+        start offset (including) of each window
+    end: array-like
+        end offset (not including) of each window
+    win: int64_t, optional
+        nominal window size, min periods is checked against the larger of
+        win and the size of the largest window
+    """
+    cdef:
+        readonly int64_t window
+
+    def __init__(self, object start, object end, object win=None):
+
+        self.is_variable = 1
+        self.minp = 0
+        self.start = np.asarray(start, dtype=np.int64)
+        self.end = np.asarray(end, dtype=np.int64)
+        self.N = len(self.start)
+
+        if (self.start.ndim != 1 or self.end.ndim != 1 or
+                len(self.end) != self.N):
+            raise ValueError("start and end of the windows must be 1d "
+                             "arrays of the same length")
+        if self.N and ((self.start < 0).any() or
+                       (self.end < self.start).any() or
+                       (self.end > self.N).any()):
+            raise ValueError("the windows must satisfy "
+                             "0 <= start <= end <= number of values")
+
+        # max window size
+        self.win = (self.end - self.start).max() if self.N else 0
+        self.window = self.win if win is None else max(win, self.win)
+
+    def get_data(self, minp=None, floor=None):
+        # the bounds are shared by all of the columns and functions, only
+        # the min periods differ between the calls
+        minp = _check_minp(self.window, minp, self.N, floor=floor)
+        return (self.start, self.end, <int64_t>self.N,
+                <int64_t>self.win, <int64_t>minp,
+                self.is_variable)
+
+
+cdef class GroupedWindowIndexer(BoundsWindowIndexer):
+    """
+    create a window indexer object for values that are sorted by group,
+    that has start & end, that point to offsets in the values; the windows
+    of all of the groups are computed in a single pass and never extend
+    past the start of the group of their row
+
+    the windows of consecutive rows only ever move forward or restart at
+    the first row of a group, so the variable window routines can compute
+    all of the groups in a single call
+
+    Parameters
+    ----------
+    group_ends: ndarray
+        end offset (not including) of each group in the sorted values
+    win: int64_t
+        window size, or the window offset if index is passed
+    left_closed: bint
+        left endpoint closedness
+    right_closed: bint
+        right endpoint closedness
+    index: ndarray, optional
+        index of the sorted values, if the window is an offset
+    """
+    def __init__(self, const int64_t[:] group_ends, int64_t win,
+                 bint left_closed, bint right_closed, ndarray index=None):
+
+        self.is_variable = 1
+        self.window = win
+        self.N = group_ends[len(group_ends) - 1] if len(group_ends) else 0
+        self.minp = 0
+
+        self.start = np.empty(self.N, dtype='int64')
+        self.end = np.empty(self.N, dtype='int64')
+
+        if index is None:
+            self.build_fixed(group_ends, win)
+        else:
+            self.build_variable(group_ends, index, win, left_closed,
+                                right_closed)
+
+        # max window size
+        self.win = (self.end - self.start).max() if self.N else 0
+
+    def build_fixed(self, const int64_t[:] group_ends, int64_t win):
+
+        cdef:
+            int64_t[:] start, end
+            int64_t group_start = 0, group_end
+            Py_ssize_t i, k
+
+        start = self.start
+        end = self.end
+
+        with nogil:
+
+            for k in range(len(group_ends)):
+                group_end = group_ends[k]
+                for i in range(group_start, group_end):
+                    start[i] = max(i - win + 1, group_start)
+                    end[i] = i + 1
+                group_start = group_end
+
+    def build_variable(self, const int64_t[:] group_ends,
+                       const int64_t[:] index, int64_t win,
+                       bint left_closed, bint right_closed):
+
+        cdef:
+            int64_t[:] start, end
+            int64_t start_bound, end_bound, group_start = 0, group_end
+            Py_ssize_t i, j, k
+
+        start = self.start
+        end = self.end
+
+        with nogil:
+
+            for k in range(len(group_ends)):
+                group_end = group_ends[k]
+
+                # same as VariableWindowIndexer.build, restarted at the
+                # first row of every group
+                for i in range(group_start, group_end):
+                    if i == group_start:
+                        start[i] = i
+                        end[i] = i + 1 if right_closed else i
+                        continue
+
+                    end_bound = index[i]
+                    start_bound = index[i] - win
+
+                    # left endpoint is closed
+                    if left_closed:
+                        start_bound -= 1
+
+                    # advance the start bound until we are
+                    # within the constraint
+                    start[i] = i
+                    for j in range(start[i - 1], i):
+                        if index[j] > start_bound:
+                            start[i] = j
+                            break
+
+                    # end bound is previous end
+                    # or current index
+                    if index[end[i - 1]] <= end_bound:
+                        end[i] = i + 1
+                    else:
+                        end[i] = end[i - 1]
+
+                    # right endpoint is open
+                    if not right_closed:
+                        end[i] -= 1
+
+                group_start = group_end
+
+
+def _get_closed(closed, index):
+    """
+    return the left & right endpoint closedness of the window
+
+    if windows is variable, default is 'right', otherwise default is 'both'
+    """
+    assert closed is None or closed in ['right', 'left', 'both', 'neither']
+
+    if closed is None:
+        closed = 'right' if index is not None else 'both'
+
+    return closed in ['left', 'both'], closed in ['right', 'both']
+
+
+def get_grouped_window_indexer(group_ends, win, index, closed):
+    """
+    return a GroupedWindowIndexer for values sorted by group
+
+    Parameters
+    ----------
+    group_ends: 1d int64 ndarray
+        end offset (not including) of each group in the sorted values
+    win: integer, window size or offset
+    index: 1d ndarray, optional
+        index to the sorted values, if win is an offset
+    closed: string, default None
+        {'right', 'left', 'both', 'neither'}
+        window endpoint closedness. Defaults to 'right' if index
+        is passed and to 'both' otherwise
+
+    Returns
+    -------
+    GroupedWindowIndexer, to be passed as the index to the rolling
+    functions
+    """
+    left_closed, right_closed = _get_closed(closed, index)
+    return GroupedWindowIndexer(group_ends, win, left_closed, right_closed,
+                                index)
+
+
 def get_window_indexer(values, win, minp, index, closed,
                        floor=None, use_mock=True):
     """
@@ -330,17 +549,13 @@ def get_window_indexer(values, win, minp, index, closed,
         bint left_closed = False
         bint right_closed = False
 
-    assert closed is None or closed in ['right', 'left', 'both', 'neither']
-
-    # if windows is variable, default is 'right', otherwise default is 'both'
-    if closed is None:
-        closed = 'right' if index is not None else 'both'
-
-    if closed in ['right', 'both']:
-        right_closed = True
+    # the windows were computed up front, e.g. for all of the groups
+    # or by a custom indexer
+    if isinstance(index, BoundsWindowIndexer):
+        assert len(values) == (<BoundsWindowIndexer>index).N
+        return index.get_data(minp, floor=floor)
 
-    if closed in ['left', 'both']:
-        left_closed = True
+    left_closed, right_closed = _get_closed(closed, index)
 
     if index is not None:
         indexer = VariableWindowIndexer(values, win, minp, left_closed,
@@ -378,7 +593,7 @@ def roll_count(ndarray[float64_t] values, int64_t win, int64_t minp,
             s = start[i]
             e = end[i]
 
-            if i == 0:
+            if i == 0 or window_restarts(s, e, start[i - 1], end[i - 1]):
 
                 # setup
                 count_x = 0.0
@@ -473,7 +688,7 @@ def roll_sum(ndarray[float64_t] values, int64_t win, int64_t minp,
                 s = start[i]
                 e = end[i]
 
-                if i == 0:
+                if i == 0 or window_restarts(s, e, start[i - 1], end[i - 1]):
 
                     # setup
                     sum_x = 0.0
@@ -592,11 +807,12 @@ def roll_mean(ndarray[float64_t] values, int64_t win, int64_t minp,
                 s = start[i]
                 e = end[i]
 
-                if i == 0:
+                if i == 0 or window_restarts(s, e, start[i - 1], end[i - 1]):
 
                     # setup
                     sum_x = 0.0
                     nobs = 0
+                    neg_ct = 0
                     for j in range(s, e):
                         val = values[j]
                         add_mean(val, &nobs, &sum_x, &neg_ct)
@@ -735,8 +951,9 @@ def roll_var(ndarray[float64_t] values, int64_t win, int64_t minp,
 
                 # Over the first window, observations can only be added
                 # never removed
-                if i == 0:
+                if i == 0 or window_restarts(s, e, start[i - 1], end[i - 1]):
 
+                    nobs = mean_x = ssqdm_x = 0
                     for j in range(s, e):
                         add_var(values[j], &nobs, &mean_x, &ssqdm_x)
 
@@ -890,8 +1107,10 @@ def roll_skew(ndarray[float64_t] values, int64_t win, int64_t minp,
 
                 # Over the first window, observations can only be added
                 # never removed
-                if i == 0:
+                if i == 0 or window_restarts(s, e, start[i - 1], end[i - 1]):
 
+                    nobs = 0
+                    x = xx = xxx = 0
                     for j in range(s, e):
                         val = values[j]
                         add_skew(val, &nobs, &x, &xx, &xxx)
@@ -1034,8 +1253,10 @@ def roll_kurt(ndarray[float64_t] values, int64_t win, int64_t minp,
 
                 # Over the first window, observations can only be added
                 # never removed
-                if i == 0:
+                if i == 0 or window_restarts(s, e, start[i - 1], end[i - 1]):
 
+                    nobs = 0
+                    x = xx = xxx = xxxx = 0
                     for j in range(s, e):
                         add_kurt(values[j], &nobs, &x, &xx, &xxx, &xxxx)
 
@@ -1113,7 +1334,15 @@ def roll_median_c(ndarray[float64_t] values, int64_t win, int64_t minp,
             s = start[i]
             e = end[i]
 
-            if i == 0:
+            if i == 0 or window_restarts(s, e, start[i - 1], end[i - 1]):
+
+                # clear the previous window
+                if i > 0:
+                    for j in range(start[i - 1], end[i - 1]):
+                        val = values[j]
+                        if notnan(val):
+                            skiplist_remove(sl, val)
+                            nobs -= 1
 
                 # setup
                 for j in range(s, e):
@@ -1279,15 +1508,13 @@ cdef _roll_min_max_variable(ndarray[numeric] values,
                             bint is_max):
     cdef:
         numeric ai
-        int64_t i, close_offset, curr_win_size
+        int64_t i, j, k, s, e
         Py_ssize_t nobs = 0
         deque Q[int64_t]  # min/max always the front
-        deque W[int64_t]  # track the whole window for nobs compute
         ndarray[float64_t, ndim=1] output
 
     output = np.empty(N, dtype=float)
     Q = deque[int64_t]()
-    W = deque[int64_t]()
 
     with nogil:
 
@@ -1296,60 +1523,41 @@ cdef _roll_min_max_variable(ndarray[numeric] values,
         # The original impl didn't deal with variable window sizes
         # So the code was optimized for that
 
-        for i from starti[0] <= i < endi[0]:
-            ai = init_mm(values[i], &nobs, is_max)
+        for i in range(N):
+            s = starti[i]
+            e = endi[i]
 
-            # Discard previous entries if we find new min or max
-            if is_max:
-                while not Q.empty() and ((ai >= values[Q.back()]) or
-                                         values[Q.back()] != values[Q.back()]):
-                    Q.pop_back()
-            else:
-                while not Q.empty() and ((ai <= values[Q.back()]) or
-                                         values[Q.back()] != values[Q.back()]):
-                    Q.pop_back()
-            Q.push_back(i)
-            W.push_back(i)
-
-        # if right is open then the first window is empty
-        close_offset = 0 if endi[0] > starti[0] else 1
-        # first window's size
-        curr_win_size = endi[0] - starti[0]
-
-        for i in range(endi[0], endi[N-1]):
-            if not Q.empty() and curr_win_size > 0:
-                output[i-1+close_offset] = calc_mm(
-                    minp, nobs, values[Q.front()])
+            if i == 0 or window_restarts(s, e, starti[i - 1], endi[i - 1]):
+                Q.clear()
+                nobs = 0
+                k = s
             else:
-                output[i-1+close_offset] = NaN
+                # values that left the window
+                for j in range(starti[i - 1], s):
+                    remove_mm(values[j], &nobs)
+                k = endi[i - 1]
 
-            ai = init_mm(values[i], &nobs, is_max)
+            for j in range(k, e):
+                ai = init_mm(values[j], &nobs, is_max)
 
-            # Discard previous entries if we find new min or max
-            if is_max:
-                while not Q.empty() and ((ai >= values[Q.back()]) or
-                                         values[Q.back()] != values[Q.back()]):
-                    Q.pop_back()
-            else:
-                while not Q.empty() and ((ai <= values[Q.back()]) or
-                                         values[Q.back()] != values[Q.back()]):
-                    Q.pop_back()
+                # Discard previous entries if we find new min or max
+                if is_max:
+                    while not Q.empty() and ((ai >= values[Q.back()]) or
+                                             values[Q.back()] != values[Q.back()]):
+                        Q.pop_back()
+                else:
+                    while not Q.empty() and ((ai <= values[Q.back()]) or
+                                             values[Q.back()] != values[Q.back()]):
+                        Q.pop_back()
+                Q.push_back(j)
 
-            # Maintain window/nobs retention
-            curr_win_size = endi[i + close_offset] - starti[i + close_offset]
-            while not Q.empty() and Q.front() <= i - curr_win_size:
+            while not Q.empty() and Q.front() < s:
                 Q.pop_front()
-            while not W.empty() and W.front() <= i - curr_win_size:
-                remove_mm(values[W.front()], &nobs)
-                W.pop_front()
-
-            Q.push_back(i)
-            W.push_back(i)
 
-        if not Q.empty() and curr_win_size > 0:
-            output[N-1] = calc_mm(minp, nobs, values[Q.front()])
-        else:
-            output[N-1] = NaN
+            if not Q.empty():
+                output[i] = calc_mm(minp, nobs, values[Q.front()])
+            else:
+                output[i] = NaN
 
     return output
 
@@ -1507,7 +1715,15 @@ def roll_quantile(ndarray[float64_t, cast=True] values, int64_t win,
             s = start[i]
             e = end[i]
 
-            if i == 0:
+            if i == 0 or window_restarts(s, e, start[i - 1], end[i - 1]):
+
+                # clear the previous window
+                if i > 0:
+                    for j in range(start[i - 1], end[i - 1]):
+                        val = values[j]
+                        if notnan(val):
+                            skiplist_remove(skiplist, val)
+                            nobs -= 1
 
                 # setup
                 for j in range(s, e):
@@ -1759,7 +1975,7 @@ def _roll_weighted_sum_mean(float64_t[:] values, float64_t[:] weights,
 
 
 def ewma(float64_t[:] vals, float64_t com,
-         int adjust, int ignore_na, int minp):
+         int adjust, int ignore_na, int minp, float64_t[:] state=None):
     """
     Compute exponentially-weighted moving average using center-of-mass.
 
@@ -1770,6 +1986,10 @@ def ewma(float64_t[:] vals, float64_t com,
     adjust: int
     ignore_na: int
     minp: int
+    state : ndarray (float64 type), optional
+        The weighted average, old weight and number of observations left
+        by the values preceding ``vals``, updated in place. The initial
+        state is ``[NaN, 1., 0.]``.
 
     Returns
     -------
@@ -1782,6 +2002,9 @@ def ewma(float64_t[:] vals, float64_t com,
         float64_t alpha, old_wt_factor, new_wt, weighted_avg, old_wt, cur
         Py_ssize_t i, nobs
 
+    if state is not None and len(state) != 3:
+        raise ValueError("state must hold 3 values")
+
     if N == 0:
         return output
 
@@ -1791,13 +2014,16 @@ def ewma(float64_t[:] vals, float64_t com,
     old_wt_factor = 1. - alpha
     new_wt = 1. if adjust else alpha
 
-    weighted_avg = vals[0]
-    is_observation = (weighted_avg == weighted_avg)
-    nobs = int(is_observation)
-    output[0] = weighted_avg if (nobs >= minp) else NaN
-    old_wt = 1.
+    if state is None:
+        weighted_avg = NaN
+        old_wt = 1.
+        nobs = 0
+    else:
+        weighted_avg = state[0]
+        old_wt = state[1]
+        nobs = <Py_ssize_t>state[2]
 
-    for i in range(1, N):
+    for i in range(N):
         cur = vals[i]
         is_observation = (cur == cur)
         nobs += int(is_observation)
@@ -1821,6 +2047,11 @@ def ewma(float64_t[:] vals, float64_t com,
 
         output[i] = weighted_avg if (nobs >= minp) else NaN
 
+    if state is not None:
+        state[0] = weighted_avg
+        state[1] = old_wt
+        state[2] = nobs
+
     return output
 
 
@@ -0,0 +1,2 @@
+"""Public API for Rolling Window Indexers"""
+from pandas.core.window.indexers import BaseIndexer  # noqa: F401
@@ -22,9 +22,10 @@ from pandas.core.arrays.integer import (
     UInt32Dtype,
     UInt64Dtype,
 )
+from pandas.core.arrays.string_ import StringDtype
 from pandas.core.construction import array
 
-from pandas.core.groupby import Grouper, NamedAgg
+from pandas.core.groupby import Grouper, NamedAgg, combine_partials
 
 # DataFrame needs to be imported after NamedAgg to avoid a circular import
 from pandas.core.frame import DataFrame  # isort:skip
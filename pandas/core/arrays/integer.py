@@ -4,13 +4,15 @@ import warnings
 
 import numpy as np
 
-from pandas._libs import lib
+from pandas._libs import algos as libalgos, lib
 from pandas.compat import set_function_name
 from pandas.util._decorators import cache_readonly
 
 from pandas.core.dtypes.base import ExtensionDtype
 from pandas.core.dtypes.cast import astype_nansafe
 from pandas.core.dtypes.common import (
+    ensure_int64,
+    ensure_uint64,
     is_bool_dtype,
     is_float,
     is_float_dtype,
@@ -19,6 +21,7 @@ from pandas.core.dtypes.common import (
     is_list_like,
     is_object_dtype,
     is_scalar,
+    is_unsigned_integer_dtype,
 )
 from pandas.core.dtypes.dtypes import register_extension_dtype
 from pandas.core.dtypes.generic import ABCDataFrame, ABCIndexClass, ABCSeries
@@ -232,6 +235,10 @@ def coerce_to_array(values, dtype, mask=None, copy=False):
     return values, mask
 
 
+# reductions computed on the integers and the mask by libalgos.masked_reduce
+_masked_reductions = {"sum", "min", "max", "mean", "var", "std"}
+
+
 class IntegerArray(ExtensionArray, ExtensionOpsMixin):
     """
     Array of integer (optional missing) values.
@@ -638,6 +645,28 @@ class IntegerArray(ExtensionArray, ExtensionOpsMixin):
         data = self._data
         mask = self._mask
 
+        if name in _masked_reductions:
+            # reduce the integers directly, which keeps the precision of
+            # values beyond 2**53 and avoids a float copy of the data
+            if is_unsigned_integer_dtype(data):
+                data = ensure_uint64(data)
+            else:
+                data = ensure_int64(data)
+            how = "var" if name == "std" else name
+            result = libalgos.masked_reduce(
+                data,
+                mask.view(np.uint8),
+                how,
+                skipna=skipna,
+                min_count=kwargs.get("min_count", 0),
+                ddof=kwargs.get("ddof", 1),
+            )
+            if result is None:
+                return self._na_value
+            if name == "std":
+                result = np.sqrt(result)
+            return result
+
         # coerce to a nan-aware float if needed
         if mask.any():
             data = self._data.astype("float64")
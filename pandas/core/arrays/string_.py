@@ -0,0 +1,524 @@
+import operator
+from typing import Type
+
+import numpy as np
+
+from pandas._libs import lib, strings as libstrings
+from pandas.compat import set_function_name
+
+from pandas.core.dtypes.base import ExtensionDtype
+from pandas.core.dtypes.cast import astype_nansafe
+from pandas.core.dtypes.common import is_integer, is_object_dtype
+from pandas.core.dtypes.dtypes import register_extension_dtype
+from pandas.core.dtypes.generic import ABCDataFrame, ABCIndexClass, ABCSeries
+from pandas.core.dtypes.missing import isna
+
+from pandas.core import ops
+from pandas.core.algorithms import _factorize_array, take
+from pandas.core.arrays import ExtensionArray, ExtensionOpsMixin
+
+
+@register_extension_dtype
+class StringDtype(ExtensionDtype):
+    """
+    Extension dtype for string data.
+
+    .. versionadded:: 1.0.0
+
+    .. warning::
+
+       StringDtype is considered experimental. The implementation and
+       parts of the API may change without warning.
+
+    Examples
+    --------
+    >>> pd.StringDtype()
+    StringDtype
+    """
+
+    name = "string"
+    type = str  # type: Type
+    kind = "O"
+    na_value = np.nan
+
+    def __repr__(self):
+        return "StringDtype"
+
+    @classmethod
+    def construct_array_type(cls):
+        """Return the array type associated with this dtype
+
+        Returns
+        -------
+        type
+        """
+        return StringArray
+
+    def __from_arrow__(self, array):
+        """
+        Construct a StringArray from a pyarrow (Chunked)Array of strings,
+        without copying the character data.
+        """
+        import pyarrow
+
+        if isinstance(array, pyarrow.Array):
+            chunks = [array]
+        else:
+            chunks = array.chunks
+
+        results = []
+        for arr in chunks:
+            validity, offsets, data = arr.buffers()
+            offset_type = "int64" if arr.type == pyarrow.large_string() else "int32"
+            offsets = np.frombuffer(offsets, dtype=offset_type)
+            offsets = offsets[arr.offset : arr.offset + len(arr) + 1]
+            data = np.frombuffer(data, dtype=np.uint8) if data is not None else None
+            if data is None:
+                data = np.array([], dtype=np.uint8)
+            mask = np.asarray(arr.is_null())
+            results.append(StringArray(data, offsets.astype(np.int64), mask))
+
+        if not results:
+            return StringArray._from_sequence([])
+        elif len(results) == 1:
+            return results[0]
+        return StringArray._concat_same_type(results)
+
+
+class StringArray(ExtensionArray, ExtensionOpsMixin):
+    """
+    Extension array for string data.
+
+    .. versionadded:: 1.0.0
+
+    .. warning::
+
+       StringArray is considered experimental. The implementation and
+       parts of the API may change without warning.
+
+    Unlike an object-dtype ndarray of Python strings, a StringArray keeps
+    all of its strings in one contiguous buffer. It is represented with 3
+    numpy arrays:
+
+    - data: a uint8 array holding the UTF-8 encoded strings back to back
+    - offsets: an int64 array of length ``n + 1``, string ``i`` being
+      ``data[offsets[i]:offsets[i + 1]]``
+    - mask: a boolean array holding a mask on the data, True is missing
+
+    Common methods of the ``.str`` accessor (such as ``len``,
+    ``contains``, ``startswith``, ``endswith``, ``slice``, ``lower`` and
+    ``upper``) as well as factorization operate on this buffer directly.
+
+    To construct a StringArray from a sequence of strings, use
+    :func:`pandas.array` with ``dtype="string"``.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        A 1-d uint8 array of UTF-8 encoded bytes.
+    offsets : numpy.ndarray
+        A 1-d int64 array of offsets into `data`, one longer than the
+        array.
+    mask : numpy.ndarray
+        A 1-d boolean-dtype array indicating missing values.
+    copy : bool, default False
+        Whether to copy `data`, `offsets` and `mask`.
+
+    Attributes
+    ----------
+    None
+
+    Methods
+    -------
+    None
+
+    Returns
+    -------
+    StringArray
+
+    Examples
+    --------
+    >>> pd.array(['This is', 'some text', None, 'data.'], dtype="string")
+    <StringArray>
+    ['This is', 'some text', nan, 'data.']
+    Length: 4, dtype: string
+
+    >>> pd.Series(["a", "bb", None], dtype="string").str.len()
+    0    1.0
+    1    2.0
+    2    NaN
+    dtype: float64
+    """
+
+    def __init__(self, data, offsets, mask, copy=False):
+        if not (isinstance(data, np.ndarray) and data.dtype == np.uint8):
+            raise TypeError(
+                "data should be a uint8 numpy array. Use pd.array(..., "
+                "dtype='string') to construct a StringArray from strings"
+            )
+        if not (isinstance(offsets, np.ndarray) and offsets.dtype == np.int64):
+            raise TypeError("offsets should be an int64 numpy array")
+        if not (isinstance(mask, np.ndarray) and mask.dtype == np.bool_):
+            raise TypeError("mask should be a boolean numpy array")
+        if len(offsets) != len(mask) + 1:
+            raise ValueError("offsets should be one longer than mask")
+
+        if copy:
+            data = data.copy()
+            offsets = offsets.copy()
+            mask = mask.copy()
+
+        self._data = data
+        self._offsets = offsets
+        self._mask = mask
+        self._dtype = StringDtype()
+
+    @classmethod
+    def _from_sequence(cls, scalars, dtype=None, copy=False):
+        if isinstance(scalars, (ABCSeries, ABCIndexClass)):
+            scalars = scalars.array
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+
+        values = np.asarray(scalars, dtype=object)
+        if values.ndim != 1:
+            raise ValueError("StringArray requires a 1-d sequence")
+
+        mask = np.asarray(isna(values), dtype=bool)
+        valid = values[~mask]
+        if not lib.is_string_array(valid, skipna=False) and len(valid):
+            raise ValueError(
+                "StringArray requires a sequence of strings or missing values"
+            )
+
+        encoded = [x.encode("utf-8") for x in valid]
+        lengths = np.zeros(len(values), dtype=np.int64)
+        lengths[~mask] = [len(x) for x in encoded]
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+        return cls(data, offsets, mask)
+
+    @classmethod
+    def _from_sequence_of_strings(cls, strings, dtype=None, copy=False):
+        return cls._from_sequence(strings, dtype=dtype, copy=copy)
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls._from_sequence(values)
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    def __len__(self):
+        return len(self._mask)
+
+    def __getitem__(self, item):
+        if is_integer(item):
+            if item < 0:
+                item += len(self)
+            if self._mask[item]:
+                return self.dtype.na_value
+            start, stop = self._offsets[item], self._offsets[item + 1]
+            return self._data[start:stop].tobytes().decode("utf-8")
+
+        if isinstance(item, slice) and item.step in (None, 1):
+            # shares the data buffer
+            start, stop, _ = item.indices(len(self))
+            stop = max(start, stop)
+            return type(self)(
+                self._data, self._offsets[start : stop + 1], self._mask[start:stop]
+            )
+
+        indexer = np.arange(len(self))[item]
+        return self.take(indexer)
+
+    def __setitem__(self, key, value):
+        values = self._to_object()
+        if isinstance(value, type(self)):
+            value = value._to_object()
+        values[key] = value
+        result = self._from_sequence(values)
+        self._data, self._offsets, self._mask = (
+            result._data,
+            result._offsets,
+            result._mask,
+        )
+
+    def _to_object(self, na_value=np.nan):
+        """
+        Materialize as an object ndarray of Python strings.
+        """
+        return libstrings.decode(
+            self._data, self._offsets, self._mask.view(np.uint8), na_value
+        )
+
+    def __array__(self, dtype=None):
+        return self._to_object()
+
+    def __iter__(self):
+        return iter(self._to_object())
+
+    def __arrow_array__(self, type=None):
+        """
+        Convert to a pyarrow large_string array, sharing the data and offsets
+        buffers.
+        """
+        import pyarrow as pa
+
+        offsets = self._offsets
+        if offsets[0] != 0:
+            offsets = offsets - offsets[0]
+        data = self._data[self._offsets[0] : self._offsets[-1]]
+        validity = None
+        if self._mask.any():
+            validity = pa.py_buffer(np.packbits(~self._mask, bitorder="little"))
+        return pa.Array.from_buffers(
+            pa.large_string(),
+            len(self),
+            [validity, pa.py_buffer(offsets), pa.py_buffer(data)],
+            null_count=int(self._mask.sum()),
+        )
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes + self._offsets.nbytes + self._mask.nbytes
+
+    def isna(self):
+        return self._mask
+
+    @property
+    def _na_value(self):
+        return np.nan
+
+    def take(self, indexer, allow_fill=False, fill_value=None):
+        # validate and normalize the indexer to positions, -1 for fill
+        indexer = take(
+            np.arange(len(self), dtype=np.int64),
+            indexer,
+            allow_fill=allow_fill,
+            fill_value=-1,
+        )
+        fill_mask = indexer == -1
+
+        data, offsets = libstrings.take(self._data, self._offsets, indexer)
+        mask = fill_mask
+        if len(self):
+            mask = mask | self._mask.take(indexer)
+        result = type(self)(data, offsets, mask)
+
+        if allow_fill and not isna(fill_value) and fill_mask.any():
+            result[fill_mask] = fill_value
+        return result
+
+    def view(self, dtype=None):
+        if dtype is not None:
+            raise NotImplementedError(dtype)
+        # setting values replaces the buffers rather than writing into them,
+        # so a view shares the attributes of this array to observe that
+        result = object.__new__(type(self))
+        result.__dict__ = self.__dict__
+        return result
+
+    def copy(self):
+        data = self._data[self._offsets[0] : self._offsets[-1]].copy()
+        offsets = self._offsets - self._offsets[0]
+        return type(self)(data, offsets, self._mask.copy())
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        datas = [x._data[x._offsets[0] : x._offsets[-1]] for x in to_concat]
+        sizes = np.cumsum([0] + [len(x) for x in datas])
+        offsets = [
+            x._offsets[:-1] - x._offsets[0] + size for x, size in zip(to_concat, sizes)
+        ]
+        offsets.append(np.array([sizes[-1]], dtype=np.int64))
+        return cls(
+            np.concatenate(datas),
+            np.concatenate(offsets).astype(np.int64, copy=False),
+            np.concatenate([x._mask for x in to_concat]),
+        )
+
+    def astype(self, dtype, copy=True):
+        if isinstance(dtype, str) and dtype == "string":
+            dtype = self.dtype
+        if isinstance(dtype, StringDtype):
+            return self.copy() if copy else self
+        if is_object_dtype(dtype):
+            return self._to_object()
+        return astype_nansafe(self._to_object(), dtype, copy=False)
+
+    def _values_for_argsort(self):
+        return self._to_object()
+
+    def _values_for_factorize(self):
+        return self._to_object(), np.nan
+
+    def factorize(self, na_sentinel=-1):
+        # factorize the hashes of the strings, then check that every string
+        # equals the first one with the same hash
+        valid = np.flatnonzero(~self._mask)
+        hashes = libstrings.hash_strings(self._data, self._offsets)[valid]
+        labels, _ = _factorize_array(hashes)
+
+        if len(labels):
+            seen = np.maximum.accumulate(labels)
+            first = np.flatnonzero(np.r_[True, labels[1:] > seen[:-1]])
+        else:
+            first = np.array([], dtype=np.int64)
+        equal = libstrings.strings_equal(
+            self._data,
+            self._offsets,
+            valid,
+            valid[first].take(labels).astype(np.int64, copy=False),
+        )
+        if not equal.all():
+            # hash collision
+            return super().factorize(na_sentinel=na_sentinel)
+
+        codes = np.full(len(self), na_sentinel, dtype=labels.dtype)
+        codes[valid] = labels
+        return codes, self.take(valid[first])
+
+    def unique(self):
+        codes, _ = self.factorize()
+        # position of the first occurrence of every value, missing included
+        codes[self._mask] = codes.max() + 1 if len(codes) else 0
+        _, first = np.unique(codes, return_index=True)
+        return self.take(np.sort(first))
+
+    def value_counts(self, dropna=True):
+        from pandas import Series
+
+        return Series(self._to_object()).value_counts(dropna=dropna)
+
+    def _reduce(self, name, skipna=True, **kwargs):
+        if name in ["min", "max"]:
+            values = self._to_object()[~self._mask]
+            if not skipna and self._mask.any() or not len(values):
+                return np.nan
+            return getattr(values, name)()
+        raise TypeError(
+            "cannot perform {name} with type {dtype}".format(
+                name=name, dtype=self.dtype
+            )
+        )
+
+    # ------------------------------------------------------------------
+    # string methods operating on the buffer
+
+    def _is_ascii(self):
+        return not (self._data[self._offsets[0] : self._offsets[-1]] >= 128).any()
+
+    def _str_len(self):
+        return libstrings.str_len(self._data, self._offsets)
+
+    def _str_contains(self, pat):
+        return libstrings.str_contains(self._data, self._offsets, pat.encode("utf-8"))
+
+    def _str_startswith(self, pat):
+        return libstrings.str_startswith(self._data, self._offsets, pat.encode("utf-8"))
+
+    def _str_endswith(self, pat):
+        return libstrings.str_endswith(self._data, self._offsets, pat.encode("utf-8"))
+
+    def _str_slice(self, start=None, stop=None, step=None):
+        if step is None:
+            step = 1
+        if step == 0:
+            raise ValueError("slice step cannot be zero")
+        data, offsets = libstrings.str_slice(
+            self._data, self._offsets, start, stop, step
+        )
+        return type(self)(data, offsets, self._mask.copy())
+
+    def _str_case(self, upper):
+        if not self._is_ascii():
+            f = str.upper if upper else str.lower
+            values = self._to_object()
+            valid = ~self._mask
+            values[valid] = [f(x) for x in values[valid]]
+            return self._from_sequence(values)
+
+        data = libstrings.ascii_case(self._data, upper)
+        return type(self)(data, self._offsets.copy(), self._mask.copy())
+
+    # ------------------------------------------------------------------
+    # comparisons
+
+    @classmethod
+    def _create_comparison_method(cls, op):
+        def cmp_method(self, other):
+            if isinstance(other, (ABCDataFrame, ABCSeries, ABCIndexClass)):
+                # Rely on pandas to unbox and dispatch to us.
+                return NotImplemented
+
+            valid = ~self._mask
+            if isinstance(other, str) and op in (operator.eq, operator.ne):
+                pat = other.encode("utf-8")
+                lengths = np.diff(self._offsets)
+                result = (lengths == len(pat)) & libstrings.str_startswith(
+                    self._data, self._offsets, pat
+                )
+                if op is operator.ne:
+                    result = ~result
+            else:
+                values = self._to_object()
+                if isinstance(other, StringArray):
+                    other = other._to_object()
+                if not lib.is_scalar(other):
+                    other = np.asarray(other, dtype=object)
+                    if len(other) != len(self):
+                        raise ValueError("Lengths must match to compare")
+                    valid = valid & ~isna(other)
+                    other = other[valid]
+                elif isna(other):
+                    valid = np.zeros(len(self), dtype=bool)
+                result = np.zeros(len(self), dtype=bool)
+                with np.errstate(all="ignore"):
+                    result[valid] = op(values[valid], other)
+
+            # missing values compare unequal to everything
+            result[~valid] = op is operator.ne
+            return result
+
+        name = "__{name}__".format(name=op.__name__)
+        return set_function_name(cmp_method, name, cls)
+
+    @classmethod
+    def _create_arithmetic_method(cls, op):
+        def arithmetic_method(self, other):
+            if isinstance(other, (ABCDataFrame, ABCSeries, ABCIndexClass)):
+                return NotImplemented
+
+            if op not in (operator.add, ops.radd):
+                raise TypeError(
+                    "unsupported operand type(s) for {op}: 'StringArray'".format(
+                        op=op.__name__
+                    )
+                )
+
+            valid = ~self._mask
+            if isinstance(other, StringArray):
+                other = other._to_object()
+            if not lib.is_scalar(other):
+                other = np.asarray(other, dtype=object)
+                if len(other) != len(self):
+                    raise ValueError("Lengths must match")
+                valid = valid & ~isna(other)
+                other = other[valid]
+            elif isna(other):
+                valid = np.zeros(len(self), dtype=bool)
+
+            result = np.full(len(self), np.nan, dtype=object)
+            result[valid] = op(self._to_object()[valid], other)
+            return self._from_sequence(result)
+
+        name = "__{name}__".format(name=op.__name__)
+        return set_function_name(arithmetic_method, name, cls)
+
+
+StringArray._add_arithmetic_ops()
+StringArray._add_comparison_ops()
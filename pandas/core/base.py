@@ -683,6 +683,16 @@ class IndexOpsMixin:
         """
         return True
 
+    @property
+    def _external_values(self):
+        """
+        The internal values handed out by ``array`` and ``to_numpy``.
+        """
+        # As a mixin, we depend on the mixing class having _values.
+        # Special mixin syntax may be developed in the future:
+        # https://github.com/python/typing/issues/246
+        return self._values  # type: ignore
+
     @property
     def shape(self):
         """
@@ -868,10 +878,7 @@ class IndexOpsMixin:
         [a, b, a]
         Categories (2, object): [a, b]
         """
-        # As a mixin, we depend on the mixing class having _values.
-        # Special mixin syntax may be developed in the future:
-        # https://github.com/python/typing/issues/246
-        result = self._values  # type: ignore
+        result = self._external_values
 
         if is_datetime64_ns_dtype(result.dtype):
             from pandas.arrays import DatetimeArray
@@ -979,7 +986,7 @@ class IndexOpsMixin:
             # a bit out of scope for the DatetimeArray PR.
             dtype = "object"
 
-        result = np.asarray(self._values, dtype=dtype)
+        result = np.asarray(self._external_values, dtype=dtype)
         # TODO(GH-24345): Avoid potential double copy
         if copy:
             result = result.copy()
@@ -1,3 +1,3 @@
 # flake8: noqa
 
-from pandas.core.computation.eval import eval
+from pandas.core.computation.eval import compile_expr, eval
@@ -4,6 +4,7 @@ Engine classes for :func:`~pandas.eval`
 
 import abc
 
+from pandas.core.computation import numba_
 from pandas.core.computation.align import _align, _reconstruct_object
 from pandas.core.computation.ops import UndefinedVariableError, _mathops, _reductions
 
@@ -147,4 +148,29 @@ class PythonEngine(AbstractEngine):
         pass
 
 
-_engines = {"numexpr": NumExprEngine, "python": PythonEngine}
+class NumbaEngine(AbstractEngine):
+    """
+    Evaluate an expression in a single loop compiled with numba.
+
+    The expression is lowered to the body of a loop over the elements of its
+    aligned operands, so that it is computed in one pass without intermediate
+    arrays. Compiled loops are cached by the structure of the expression.
+    Expressions the loop cannot compute, e.g. on object dtypes, are evaluated
+    in Python space.
+    """
+
+    has_neg_frac = False
+
+    def __init__(self, expr):
+        super().__init__(expr)
+
+    def evaluate(self):
+        if not numba_.can_lower(self.expr.terms):
+            return self.expr()
+        return super().evaluate()
+
+    def _evaluate(self):
+        return numba_.evaluate_terms(self.expr.terms)
+
+
+_engines = {"numexpr": NumExprEngine, "python": PythonEngine, "numba": NumbaEngine}
@@ -4,6 +4,7 @@
 Top level ``eval`` module.
 """
 
+import ast
 import tokenize
 import warnings
 
@@ -205,7 +206,7 @@ def eval(
         ``'python'`` parser to retain strict Python semantics.  See the
         :ref:`enhancing performance <enhancingperf.eval>` documentation for
         more details.
-    engine : string or None, default 'numexpr', {'python', 'numexpr'}
+    engine : string or None, default 'numexpr', {'python', 'numexpr', 'numba'}
 
         The engine used to evaluate the expression. Supported engines are
 
@@ -215,6 +216,12 @@ def eval(
                          with large frames.
         - ``'python'``: Performs operations as if you had ``eval``'d in top
                         level python. This engine is generally not that useful.
+        - ``'numba'``: Computes the expression in a single loop compiled
+                       with numba, including comparisons of datetime
+                       columns, which the ``numexpr`` engine evaluates in
+                       Python space.
+
+          .. versionadded:: 1.0.0
 
         More backends may be available in the future.
 
@@ -282,15 +289,18 @@ def eval(
     See the :ref:`enhancing performance <enhancingperf.eval>` documentation for
     more details.
     """
-    from pandas.core.computation.expr import Expr
+    from pandas.core.computation.expr import Expr, _expr_cache
 
     inplace = validate_bool_kwarg(inplace, "inplace")
 
     if isinstance(expr, str):
         _check_expression(expr)
         exprs = [e.strip() for e in expr.splitlines() if e.strip() != ""]
+        # string expressions are parsed through the expression cache
+        parse = _expr_cache.get
     else:
         exprs = [expr]
+        parse = Expr
     multi_line = len(exprs) > 1
 
     if multi_line and target is None:
@@ -319,7 +329,9 @@ def eval(
             target=target,
         )
 
-        parsed_expr = Expr(expr, engine=engine, parser=parser, env=env, truediv=truediv)
+        parsed_expr = parse(
+            expr, engine=engine, parser=parser, env=env, truediv=truediv
+        )
 
         # construct the engine and evaluate the parsed expression
         eng = _engines[engine]
@@ -378,3 +390,149 @@ def eval(
     # We want to exclude `inplace=None` as being False.
     if inplace is False:
         return target if target_modified else ret
+
+
+class CompiledExpr:
+    """
+    An expression validated once and evaluated repeatedly.
+
+    Returned by :func:`compile_expr`.
+    """
+
+    def __init__(self, expr, parser="pandas", engine=None, truediv=True):
+        self.expr = expr
+        self.parser = parser
+        self.engine = engine
+        self.truediv = truediv
+
+    def __repr__(self):
+        return "{klass}({expr!r}, parser={parser!r}, engine={engine!r})".format(
+            klass=type(self).__name__,
+            expr=self.expr,
+            parser=self.parser,
+            engine=self.engine,
+        )
+
+    def _update_kwargs(self, kwargs):
+        kwargs["level"] = kwargs.pop("level", 0) + 1
+        kwargs["parser"] = self.parser
+        kwargs["engine"] = self.engine
+        kwargs["truediv"] = self.truediv
+        return kwargs
+
+    def __call__(self, data=None, inplace=False, **kwargs):
+        """
+        Evaluate the expression.
+
+        Parameters
+        ----------
+        data : DataFrame, optional
+            Evaluate the expression with :meth:`DataFrame.eval` on `data`,
+            otherwise with :func:`pandas.eval`.
+        inplace : bool, default False
+            If the expression contains an assignment, whether to perform the
+            operation inplace.
+        **kwargs
+            Passed to :meth:`DataFrame.eval` or :func:`pandas.eval`, e.g.
+            ``local_dict``, ``resolvers`` or ``target``.
+
+        Returns
+        -------
+        ndarray, numeric scalar, DataFrame, Series
+        """
+        kwargs = self._update_kwargs(kwargs)
+        if data is None:
+            return eval(self.expr, inplace=inplace, **kwargs)
+        return data.eval(self.expr, inplace=inplace, **kwargs)
+
+    def query(self, data, inplace=False, **kwargs):
+        """
+        Query the columns of a DataFrame with the expression.
+
+        Parameters
+        ----------
+        data : DataFrame
+        inplace : bool, default False
+            Whether the query should modify `data` or return a modified copy.
+        **kwargs
+            Passed to :meth:`DataFrame.query`.
+
+        Returns
+        -------
+        DataFrame
+        """
+        kwargs = self._update_kwargs(kwargs)
+        return data.query(self.expr, inplace=inplace, **kwargs)
+
+
+def compile_expr(expr, parser="pandas", engine=None, truediv=True):
+    """
+    Compile an expression for repeated evaluation.
+
+    The expression, parser and engine are validated once. Evaluating the
+    compiled expression reuses the parsed expression of a previous
+    evaluation with the same column dtypes from the expression cache (see
+    the ``compute.eval_cache_size`` option).
+
+    .. versionadded:: 1.0.0
+
+    Parameters
+    ----------
+    expr : str
+        The expression to compile.
+    parser : {'pandas', 'python'}, default 'pandas'
+        The parser to use to construct the syntax tree from the expression.
+    engine : {'python', 'numexpr', 'numba'}, optional
+        The engine used to evaluate the expression. By default ``numexpr``
+        is used if it is installed, ``python`` otherwise.
+    truediv : bool, default True
+        Whether to use true division.
+
+    Returns
+    -------
+    CompiledExpr
+        Callable evaluating the expression like :meth:`DataFrame.eval` when
+        passed a DataFrame, like :func:`pandas.eval` otherwise. Its ``query``
+        method filters a DataFrame like :meth:`DataFrame.query`.
+
+    Raises
+    ------
+    SyntaxError
+        If the expression is not valid.
+
+    See Also
+    --------
+    eval : Evaluate a Python expression as a string.
+    DataFrame.eval : Evaluate a string describing operations on columns.
+    DataFrame.query : Query the columns of a DataFrame with an expression.
+
+    Examples
+    --------
+    >>> expr = pd.compile_expr("a > 1 and b < @limit")
+    >>> df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    >>> limit = 6
+    >>> expr.query(df)
+       a  b
+    1  2  5
+    >>> expr(df)
+    0    False
+    1     True
+    2    False
+    dtype: bool
+    """
+    from pandas.core.computation.expr import _parsers
+
+    if not isinstance(expr, str):
+        raise ValueError(
+            "expr must be a string to be compiled, {0} given".format(type(expr))
+        )
+    _check_expression(expr)
+    engine = _check_engine(engine)
+    _check_parser(parser)
+
+    preparser = _parsers[parser](None, engine, parser).preparser
+    for line in expr.splitlines():
+        if line.strip():
+            ast.parse(preparser(line.strip()))
+
+    return CompiledExpr(expr, parser=parser, engine=engine, truediv=truediv)
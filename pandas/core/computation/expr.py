@@ -2,15 +2,21 @@
 """
 
 import ast
+from collections import OrderedDict
 from functools import partial, reduce
 from io import StringIO
 import itertools as it
 import operator
+import threading
 import tokenize
 from typing import Type
 
 import numpy as np
 
+from pandas._config import get_option
+
+from pandas.core.dtypes.generic import ABCDataFrame
+
 import pandas as pd
 from pandas.core import common as com
 from pandas.core.computation.common import (
@@ -35,7 +41,7 @@ from pandas.core.computation.ops import (
     _unary_ops_syms,
     is_term,
 )
-from pandas.core.computation.scope import Scope
+from pandas.core.computation.scope import _DEFAULT_GLOBALS, Scope
 
 import pandas.io.formats.printing as printing
 
@@ -423,6 +429,9 @@ class BaseExprVisitor(ast.NodeVisitor):
         self.parser = parser
         self.preparser = preparser
         self.assigner = None
+        # whether a call was evaluated while parsing, making the
+        # resulting terms depend on the values of the data
+        self.evaluated_calls = False
 
     def visit(self, node, **kwargs):
         if isinstance(node, str):
@@ -515,8 +524,11 @@ class BaseExprVisitor(ast.NodeVisitor):
         # [1,2] in a + 2 * b
         # in that case a + 2 * b will be evaluated using numexpr, and the "in"
         # call will be evaluated using isin (in python space)
+        # numba loops cannot compute these operations, so they are evaluated
+        # entirely in python space
+        engine = "python" if self.engine == "numba" else self.engine
         return binop.evaluate(
-            self.env, self.engine, self.parser, self.term_type, eval_in_python
+            self.env, engine, self.parser, self.term_type, eval_in_python
         )
 
     def _maybe_evaluate_binop(
@@ -536,14 +548,14 @@ class BaseExprVisitor(ast.NodeVisitor):
                 " '{lhs}' and '{rhs}'".format(op=res.op, lhs=lhs.type, rhs=rhs.type)
             )
 
-        if self.engine != "pytables":
+        if self.engine not in ("pytables", "numba"):
             if (
                 res.op in _cmp_ops_syms
                 and getattr(lhs, "is_datetime", False)
                 or getattr(rhs, "is_datetime", False)
             ):
                 # all date ops must be done in python bc numexpr doesn't work
-                # well with NaT
+                # well with NaT, numba loops handle NaT like numpy
                 return self._maybe_eval(res, self.binary_ops)
 
         if res.op in eval_in_python:
@@ -729,6 +741,7 @@ class BaseExprVisitor(ast.NodeVisitor):
                 if key.arg:
                     kwargs[key.arg] = self.visit(key.value).value
 
+            self.evaluated_calls = True
             return self.const_type(res(*new_args, **kwargs), self.env)
 
     def translate_In(self, op):
@@ -814,10 +827,19 @@ class Expr:
     env : Scope, optional, default None
     truediv : bool, optional, default True
     level : int, optional, default 2
+    terms : Term or Op, optional
+        The already parsed terms of `expr`, bound to `env`.
     """
 
     def __init__(
-        self, expr, engine="numexpr", parser="pandas", env=None, truediv=True, level=0
+        self,
+        expr,
+        engine="numexpr",
+        parser="pandas",
+        env=None,
+        truediv=True,
+        level=0,
+        terms=None,
     ):
         self.expr = expr
         self.env = env or Scope(level=level + 1)
@@ -825,7 +847,7 @@ class Expr:
         self.parser = parser
         self.env.scope["truediv"] = truediv
         self._visitor = _parsers[parser](self.env, self.engine, self.parser)
-        self.terms = self.parse()
+        self.terms = self.parse() if terms is None else terms
 
     @property
     def assigner(self):
@@ -853,3 +875,173 @@ class Expr:
 
 
 _parsers = {"python": PythonExprVisitor, "pandas": PandasExprVisitor}
+
+
+def _copy_terms(terms, unbind=False):
+    """
+    Copy a tree of terms, optionally dropping the values of the named
+    terms and the scope they were resolved in.
+    """
+    # Term.__new__ requires the arguments of the constructor
+    new = object.__new__(type(terms))
+    new.__dict__.update(terms.__dict__)
+    if isinstance(terms, Op):
+        new.operands = tuple(_copy_terms(term, unbind) for term in terms.operands)
+        if isinstance(new, BinOp):
+            new.lhs, new.rhs = new.operands
+        elif isinstance(new, UnaryOp):
+            (new.operand,) = new.operands
+    elif unbind:
+        new.env = None
+        if not isinstance(new, Constant):
+            new.value = None
+    return new
+
+
+def _bind_terms(terms, env):
+    """
+    Resolve the named terms of a copied tree in `env`, redoing the
+    conversions the operators apply to their operands on construction.
+    """
+    if isinstance(terms, Op):
+        for term in terms.operands:
+            _bind_terms(term, env)
+        if isinstance(terms, BinOp):
+            terms.convert_values()
+        if isinstance(terms, Div):
+            terms.cast_values()
+    else:
+        terms.env = env
+        if not isinstance(terms, Constant):
+            terms.value = terms._resolve_name()
+    return terms
+
+
+def _describe(value):
+    """
+    What the parsed terms of an expression depend on about a value.
+    """
+    if isinstance(value, ABCDataFrame):
+        return type(value), tuple(value.dtypes)
+    dtype = getattr(value, "dtype", None)
+    if dtype is None:
+        return type(value)
+    return type(value), getattr(value, "ndim", None), dtype
+
+
+class _ExprCache:
+    """
+    LRU cache of parsed expressions.
+
+    Parsed expressions are keyed by the text of the expression, the
+    parsing options and the type and dtype(s) of every name referenced by
+    the expression. A hit copies the cached terms and resolves their names
+    in the new scope instead of parsing the expression again.
+
+    Expressions whose parsing evaluated part of them (indexing, attribute
+    access, method calls, ...) depend on the values of the data and are
+    never cached.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._names = OrderedDict()
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._names.clear()
+            self._entries.clear()
+
+    def trim(self, maxsize):
+        with self._lock:
+            for cache in [self._names, self._entries]:
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+
+    def _put(self, cache, key, value, maxsize):
+        with self._lock:
+            cache[key] = value
+            while len(cache) > maxsize:
+                cache.popitem(last=False)
+
+    def _get_names(self, base, expr, parser, maxsize):
+        with self._lock:
+            names = self._names.get(base)
+            if names is not None:
+                self._names.move_to_end(base)
+                return names
+
+        clean = _parsers[parser](None, None, parser).preparser(expr)
+        names = {}
+        for node in ast.walk(ast.parse(clean)):
+            if isinstance(node, ast.Name):
+                name = node.id
+                is_local = name.startswith(_LOCAL_TAG) or name in _DEFAULT_GLOBALS
+                names[name.replace(_LOCAL_TAG, "")] = is_local
+        names = tuple(names.items())
+
+        self._put(self._names, base, names, maxsize)
+        return names
+
+    def get(self, expr, engine="numexpr", parser="pandas", env=None, truediv=True):
+        """
+        Parse `expr` in `env`, reusing the terms of a previous parse when
+        possible.
+
+        Returns
+        -------
+        Expr
+        """
+        maxsize = get_option("compute.eval_cache_size")
+        if not maxsize:
+            return Expr(expr, engine=engine, parser=parser, env=env, truediv=truediv)
+
+        base = (expr, engine, parser, truediv, env.target is None)
+        try:
+            names = self._get_names(base, expr, parser, maxsize)
+        except SyntaxError:
+            # raise the same error as parsing the expression does
+            return Expr(expr, engine=engine, parser=parser, env=env, truediv=truediv)
+
+        signature = []
+        for name, is_local in names:
+            try:
+                value = env.resolve(name, is_local=is_local)
+            except UndefinedVariableError:
+                signature.append(None)
+            else:
+                signature.append(_describe(value))
+        key = base + (tuple(signature),)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is not None:
+            template, assigner = entry
+            terms = _bind_terms(_copy_terms(template), env)
+            parsed = Expr(
+                expr,
+                engine=engine,
+                parser=parser,
+                env=env,
+                truediv=truediv,
+                terms=terms,
+            )
+            parsed._visitor.assigner = assigner
+            return parsed
+
+        ntemps = env.ntemps
+        parsed = Expr(expr, engine=engine, parser=parser, env=env, truediv=truediv)
+        if env.ntemps == ntemps and not parsed._visitor.evaluated_calls:
+            entry = _copy_terms(parsed.terms, unbind=True), parsed.assigner
+            self._put(self._entries, key, entry, maxsize)
+        return parsed
+
+
+_expr_cache = _ExprCache()
@@ -0,0 +1,238 @@
+""" numba engine for :func:`~pandas.eval` """
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from pandas._libs.tslibs import Timedelta, Timestamp
+from pandas.compat._optional import import_optional_dependency
+
+from pandas.core.computation.ops import (
+    BinOp,
+    MathCall,
+    UnaryOp,
+    _arith_ops_syms,
+    _bool_ops_syms,
+    _cmp_ops_syms,
+    is_term,
+)
+from pandas.core.util.numba_ import get_kernel
+
+# "in" and "not in" are always evaluated in Python space while parsing
+_lowered_ops = frozenset(_arith_ops_syms + _bool_ops_syms + _cmp_ops_syms) - {
+    "in",
+    "not in",
+}
+
+# dtype kinds of the operands and of the result a kernel can compute
+_operand_kinds = "biufcmM"
+_result_kinds = "biufc"
+
+_scalar_types = (
+    bool,
+    int,
+    float,
+    complex,
+    np.bool_,
+    np.number,
+    datetime,
+    timedelta,
+    np.datetime64,
+    np.timedelta64,
+)
+
+
+def _dtype_kind(typ) -> Optional[str]:
+    try:
+        return np.dtype(typ).kind
+    except TypeError:
+        return None
+
+
+def can_lower(terms) -> bool:
+    """
+    Whether the (unaligned) terms of an expression can be computed by a
+    loop kernel.
+    """
+    if _dtype_kind(terms.return_type) not in _result_kinds:
+        return False
+
+    has_array = False
+    stack = [terms]
+    while stack:
+        node = stack.pop()
+        if is_term(node):
+            if node.is_scalar:
+                if not isinstance(node.value, _scalar_types):
+                    return False
+            elif _dtype_kind(node.type) not in _operand_kinds:
+                return False
+            else:
+                has_array = True
+        elif isinstance(node, BinOp):
+            if node.op not in _lowered_ops:
+                return False
+            stack.extend(node.operands)
+        elif isinstance(node, (UnaryOp, MathCall)):
+            stack.extend(node.operands)
+        else:
+            return False
+
+    # expressions of scalars are not worth a kernel
+    return has_array
+
+
+def _to_scalar(value):
+    # datetimelike arrays are passed in nanoseconds
+    if isinstance(value, (datetime, np.datetime64)):
+        return Timestamp(value).to_datetime64()
+    if isinstance(value, (timedelta, np.timedelta64)):
+        return Timedelta(value).to_timedelta64()
+    return value
+
+
+def lower_terms(terms, vectorized: bool = False) -> Tuple[str, List]:
+    """
+    Lower an aligned tree of terms to a Python expression.
+
+    Parameters
+    ----------
+    terms : Term or Op
+    vectorized : bool, default False
+        Whether the expression computes the whole result with numpy
+        operations on the arrays, instead of its element ``i``.
+
+    Returns
+    -------
+    body : str
+        The expression, in which the argument ``k`` is named ``a{k}`` if it
+        is an array and ``s{k}`` otherwise.
+    args : list
+        The values of the terms: an ndarray for an array operand, a scalar
+        otherwise. Named terms used several times are passed once, constants
+        are passed as arguments so that the expression does not depend on
+        their values.
+    """
+    names = {}  # type: Dict
+    args = []  # type: List
+    index = "" if vectorized else "[i]"
+
+    def lower(node) -> str:
+        if is_term(node):
+            key = node.name if isinstance(node.name, str) else id(node)
+            if key not in names:
+                if node.is_scalar:
+                    names[key] = "s{0}".format(len(args))
+                    args.append(_to_scalar(node.value))
+                else:
+                    names[key] = "a{0}{1}".format(len(args), index)
+                    args.append(np.asarray(getattr(node.value, "values", node.value)))
+            return names[key]
+
+        operands = [lower(operand) for operand in node.operands]
+        if isinstance(node, MathCall):
+            if node.op == "where" and not vectorized:
+                return "({1} if {0} else {2})".format(*operands)
+            return "np.{0}({1})".format(node.op, ", ".join(operands))
+        if isinstance(node, UnaryOp):
+            (operand,) = operands
+            if node.op == "~" and node.operand.return_type == np.bool_:
+                if not vectorized:
+                    return "(not {0})".format(operand)
+            return "({0}{1})".format(node.op, operand)
+        return "({0} {1} {2})".format(operands[0], node.op, operands[1])
+
+    return lower(terms), args
+
+
+def kernel_source(body: str, args: List) -> str:
+    """
+    The source of ``kernel(out, *args)``, computing the element-wise
+    expression ``body`` for every element ``i`` of the flat ``out`` array.
+    """
+    params = ", ".join(
+        "a{0}".format(k) if isinstance(arg, np.ndarray) else "s{0}".format(k)
+        for k, arg in enumerate(args)
+    )
+    return (
+        "def kernel(out, {params}):\n"
+        "    for i in loop_range(len(out)):\n"
+        "        out[i] = {body}\n"
+    ).format(params=params, body=body)
+
+
+def exec_kernel_source(source: str, loop_range: Callable = range) -> Callable:
+    """
+    Define the Python function of a kernel from its source.
+    """
+    namespace = {"np": np, "loop_range": loop_range}
+    exec(source, namespace)
+    return namespace["kernel"]
+
+
+def make_eval_kernel(
+    source: str, args: Tuple, nogil: bool, parallel: bool, nopython: bool
+) -> Callable:
+    """
+    Compile the kernel defined by ``source`` with numba.
+
+    Division by zero and invalid operations give inf and NaN, as in numpy,
+    instead of raising.
+    """
+    numba = import_optional_dependency("numba")
+
+    if parallel:
+        loop_range = numba.prange
+    else:
+        loop_range = range
+
+    kernel = exec_kernel_source(source, loop_range)
+    return numba.jit(
+        nopython=nopython, nogil=nogil, parallel=parallel, error_model="numpy"
+    )(kernel)
+
+
+def get_eval_kernel(
+    source: str, engine_kwargs: Optional[Dict[str, bool]] = None
+) -> Callable:
+    """
+    Return the compiled kernel defined by ``source``, compiling it on first
+    use.
+    """
+    return get_kernel(make_eval_kernel, source, (), engine_kwargs)
+
+
+def _result_dtype(terms, args: List) -> np.dtype:
+    """
+    The dtype numpy gives the result of the terms, found by computing them
+    with numpy on empty arrays.
+    """
+    body, _ = lower_terms(terms, vectorized=True)
+    namespace = {"np": np}
+    for k, arg in enumerate(args):
+        if isinstance(arg, np.ndarray):
+            namespace["a{0}".format(k)] = arg[:0]
+        else:
+            namespace["s{0}".format(k)] = arg
+    return np.asarray(eval(body, namespace)).dtype
+
+
+def evaluate_terms(terms) -> np.ndarray:
+    """
+    Compute an aligned tree of terms with a single loop kernel.
+    """
+    body, args = lower_terms(terms)
+
+    arrays = [arg for arg in args if isinstance(arg, np.ndarray)]
+    shape = arrays[0].shape
+    if len(shape) != 1 or any(arr.shape != shape for arr in arrays):
+        # 2-dimensional or broadcast operands are passed flattened
+        arrays = np.broadcast_arrays(*arrays)
+        shape = arrays[0].shape
+        flat = iter(np.ascontiguousarray(arr).ravel() for arr in arrays)
+        args = [next(flat) if isinstance(arg, np.ndarray) else arg for arg in args]
+
+    out = np.empty(int(np.prod(shape)), dtype=_result_dtype(terms, args))
+    kernel = get_eval_kernel(kernel_source(body, args))
+    kernel(out, *args)
+    return out.reshape(shape)
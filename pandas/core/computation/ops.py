@@ -43,8 +43,9 @@ _unary_math_ops = (
     "ceil",
 )
 _binary_math_ops = ("arctan2",)
+_ternary_math_ops = ("where",)
 
-_mathops = _unary_math_ops + _binary_math_ops
+_mathops = _unary_math_ops + _binary_math_ops + _ternary_math_ops
 
 
 _LOCAL_TAG = "__pd_eval_local_"
@@ -497,6 +498,13 @@ class Div(BinOp):
                 " '{1}' and '{2}'".format(self.op, lhs.return_type, rhs.return_type)
             )
 
+        self.cast_values()
+
+    def cast_values(self):
+        """
+        Cast the operands to float64, unless they already are float32
+        or float64.
+        """
         # do not upcast float32s to float64 un-necessarily
         acceptable_dtypes = [np.float32, np.float_]
         _cast_inplace(com.flatten(self), acceptable_dtypes, np.float_)
@@ -569,6 +577,15 @@ class MathCall(Op):
         operands = map(str, self.operands)
         return pprint_thing("{0}({1})".format(self.op, ",".join(operands)))
 
+    @property
+    def return_type(self):
+        if self.op == "where":
+            # the condition does not take part in the type of the result
+            return _result_type_many(
+                *(operand.return_type for operand in self.operands[1:])
+            )
+        return super().return_type
+
 
 class FuncNode:
     def __init__(self, name):
@@ -50,6 +50,27 @@ def use_numexpr_cb(key):
     expressions.set_use_numexpr(cf.get_option(key))
 
 
+groupby_threads_doc = """
+: int
+    Number of threads used to run the cythonized groupby aggregation
+    kernels over slabs of columns of wide numeric frames.
+    Values of 0 or 1 disable threading, the default is 1
+"""
+
+eval_cache_size_doc = """
+: int
+    Number of parsed expressions kept in the cache used by :func:`pandas.eval`,
+    :meth:`DataFrame.eval` and :meth:`DataFrame.query`.
+    A value of 0 disables the cache, the default is 128
+"""
+
+
+def eval_cache_size_cb(key):
+    from pandas.core.computation import expr
+
+    expr._expr_cache.trim(cf.get_option(key))
+
+
 with cf.config_prefix("compute"):
     cf.register_option(
         "use_bottleneck",
@@ -61,6 +82,16 @@ with cf.config_prefix("compute"):
     cf.register_option(
         "use_numexpr", True, use_numexpr_doc, validator=is_bool, cb=use_numexpr_cb
     )
+    cf.register_option(
+        "groupby_threads", 1, groupby_threads_doc, validator=is_nonnegative_int
+    )
+    cf.register_option(
+        "eval_cache_size",
+        128,
+        eval_cache_size_doc,
+        validator=is_nonnegative_int,
+        cb=eval_cache_size_cb,
+    )
 #
 # options from the "display" namespace
 
@@ -465,6 +496,21 @@ with cf.config_prefix("mode"):
     )
 
 
+copy_on_write_doc = """
+: bool
+    If True, deep copies of the data share the memory of the original
+    until either of them is modified in place, which copies it first.
+    Copies of a part of the data are always made eagerly. Shared memory
+    stays marked as such until it is freed, so the remaining object
+    copies it on its first in-place modification even once the copies
+    are gone. The arrays handed out by .values, .array and to_numpy are
+    read-only while their memory is shared.
+"""
+
+with cf.config_prefix("mode"):
+    cf.register_option("copy_on_write", False, copy_on_write_doc, validator=is_bool)
+
+
 # Set up the io.excel specific reader configuration.
 reader_engine_doc = """
 : string
@@ -2129,6 +2129,31 @@ class DataFrame(NDFrame):
 
         to_feather(self, fname)
 
+    def to_blocks(self, path):
+        """
+        Write out the DataFrame in the native block format.
+
+        Each block of the DataFrame is written to the file as an aligned raw
+        buffer, so that :func:`read_blocks` can memory-map numeric and
+        datetimelike columns without copying them.
+
+        .. versionadded:: 1.0.0
+
+        Parameters
+        ----------
+        path : str
+            File path.
+
+        See Also
+        --------
+        read_blocks : Load a DataFrame from the native block format.
+        DataFrame.to_pickle : Pickle (serialize) object to file.
+        DataFrame.to_feather : Write out the binary feather-format.
+        """
+        from pandas.io.blocks import to_blocks
+
+        to_blocks(self, path)
+
     def to_parquet(
         self,
         fname,
@@ -3082,6 +3107,10 @@ class DataFrame(NDFrame):
             If label pair is contained, will be reference to calling DataFrame,
             otherwise a new object.
         """
+        if self._data.copy_shared_values():
+            # the cached columns view the shared values
+            self._clear_item_cache()
+
         try:
             if takeable is True:
                 series = self._iget_item_cache(col)
@@ -6637,6 +6666,7 @@ class DataFrame(NDFrame):
         see_also=_agg_summary_and_see_also_doc,
         examples=_agg_examples_doc,
         versionadded="\n.. versionadded:: 0.20.0\n",
+        engine="",
         **_shared_doc_kwargs
     )
     @Appender(_shared_docs["aggregate"])
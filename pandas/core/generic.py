@@ -2601,11 +2601,16 @@ class NDFrame(PandasObject, SelectionMixin):
             keys should be the column names and the values should be the
             SQLAlchemy types or strings for the sqlite3 legacy mode. If a
             scalar is provided, it will be applied to all columns.
-        method : {None, 'multi', callable}, optional
+        method : {None, 'multi', 'copy', callable}, optional
             Controls the SQL insertion clause used:
 
             * None : Uses standard SQL ``INSERT`` clause (one per row).
             * 'multi': Pass multiple values in a single ``INSERT`` clause.
+            * 'copy': Stream the rows as CSV into the bulk loader of the
+              database (``COPY ... FROM STDIN`` for PostgreSQL with
+              psycopg2). Other databases use the ``None`` method.
+
+              .. versionadded:: 1.0.0
             * callable with signature ``(pd_table, conn, keys, data_iter)``.
 
             Details and a sample callable implementation can be found in the
@@ -3103,6 +3108,7 @@ class NDFrame(PandasObject, SelectionMixin):
         doublequote: bool_t = True,
         escapechar: Optional[str] = None,
         decimal: Optional[str] = ".",
+        num_threads: Optional[int] = None,
     ) -> Optional[str]:
         r"""
         Write object to a comma-separated values (csv) file.
@@ -3190,6 +3196,13 @@ class NDFrame(PandasObject, SelectionMixin):
         decimal : str, default '.'
             Character recognized as decimal separator. E.g. use ',' for
             European data.
+        num_threads : int, optional
+            Number of threads used to format chunks of `chunksize` rows
+            concurrently. The chunks are still written in order, by a single
+            thread, so writing and compressing the output overlaps with
+            formatting the following chunks.
+
+            .. versionadded:: 1.0.0
 
         Returns
         -------
@@ -3243,6 +3256,7 @@ class NDFrame(PandasObject, SelectionMixin):
             doublequote=doublequote,
             escapechar=escapechar,
             decimal=decimal,
+            num_threads=num_threads,
         )
         formatter.save()
 
@@ -5064,7 +5078,7 @@ class NDFrame(PandasObject, SelectionMixin):
         - string function name
         - list of functions and/or function names, e.g. ``[np.sum, 'mean']``
         - dict of axis labels -> functions, function names or list of such.
-    %(axis)s
+    %(axis)s%(engine)s
     *args
         Positional arguments to pass to `func`.
     **kwargs
@@ -5,3 +5,4 @@ from pandas.core.groupby.generic import (  # noqa: F401
 )
 from pandas.core.groupby.groupby import GroupBy  # noqa: F401
 from pandas.core.groupby.grouper import Grouper  # noqa: F401
+from pandas.core.groupby.partials import combine_partials  # noqa: F401
@@ -50,6 +50,7 @@ from pandas.core.generic import ABCDataFrame, ABCSeries, NDFrame, _shared_docs
 from pandas.core.groupby import base
 from pandas.core.groupby.groupby import (
     GroupBy,
+    _agg_engine_doc,
     _apply_docs,
     _transform_template,
     groupby,
@@ -219,7 +220,11 @@ class NDFrameGroupBy(GroupBy):
 
         return new_items, new_blocks
 
-    def aggregate(self, func, *args, **kwargs):
+    def aggregate(self, func, *args, engine="cython", engine_kwargs=None, **kwargs):
+        self._validate_engine(engine, engine_kwargs, kwargs)
+        if engine == "numba":
+            return self._numba_agg_general(func, args, engine_kwargs)
+
         _level = kwargs.pop("_level", None)
 
         relabeling = func is None and _is_multi_agg_with_relabel(**kwargs)
@@ -577,7 +582,10 @@ class NDFrameGroupBy(GroupBy):
 
     @Substitution(klass="DataFrame", selected="")
     @Appender(_transform_template)
-    def transform(self, func, *args, **kwargs):
+    def transform(self, func, *args, engine="cython", engine_kwargs=None, **kwargs):
+        self._validate_engine(engine, engine_kwargs, kwargs)
+        if engine == "numba":
+            return self._numba_transform_general(func, args, engine_kwargs)
 
         # optimized transforms
         func = self._get_cython_func(func) or func
@@ -835,9 +843,16 @@ class SeriesGroupBy(GroupBy):
         versionadded="",
         klass="Series",
         axis="",
+        engine=_agg_engine_doc,
     )
     @Appender(_shared_docs["aggregate"])
-    def aggregate(self, func=None, *args, **kwargs):
+    def aggregate(
+        self, func=None, *args, engine="cython", engine_kwargs=None, **kwargs
+    ):
+        self._validate_engine(engine, engine_kwargs, kwargs)
+        if engine == "numba":
+            return self._numba_agg_general(func, args, engine_kwargs)
+
         _level = kwargs.pop("_level", None)
 
         relabeling = func is None
@@ -1016,7 +1031,11 @@ class SeriesGroupBy(GroupBy):
 
     @Substitution(klass="Series", selected="A.")
     @Appender(_transform_template)
-    def transform(self, func, *args, **kwargs):
+    def transform(self, func, *args, engine="cython", engine_kwargs=None, **kwargs):
+        self._validate_engine(engine, engine_kwargs, kwargs)
+        if engine == "numba":
+            return self._numba_transform_general(func, args, engine_kwargs)
+
         func = self._get_cython_func(func) or func
 
         if isinstance(func, str):
@@ -1466,10 +1485,15 @@ class DataFrameGroupBy(NDFrameGroupBy):
         versionadded="",
         klass="DataFrame",
         axis="",
+        engine=_agg_engine_doc,
     )
     @Appender(_shared_docs["aggregate"])
-    def aggregate(self, func=None, *args, **kwargs):
-        return super().aggregate(func, *args, **kwargs)
+    def aggregate(
+        self, func=None, *args, engine="cython", engine_kwargs=None, **kwargs
+    ):
+        return super().aggregate(
+            func, *args, engine=engine, engine_kwargs=engine_kwargs, **kwargs
+        )
 
     agg = aggregate
 
@@ -18,7 +18,7 @@ import numpy as np
 
 from pandas._config.config import option_context
 
-from pandas._libs import Timestamp
+from pandas._libs import Timestamp, lib
 import pandas._libs.groupby as libgroupby
 from pandas.compat import set_function_name
 from pandas.compat.numpy import function as nv
@@ -29,6 +29,7 @@ from pandas.util._validators import validate_kwargs
 from pandas.core.dtypes.cast import maybe_downcast_to_dtype
 from pandas.core.dtypes.common import (
     ensure_float,
+    ensure_float64,
     is_datetime64_dtype,
     is_datetime64tz_dtype,
     is_extension_array_dtype,
@@ -40,7 +41,7 @@ from pandas.core.dtypes.common import (
 from pandas.core.dtypes.missing import isna, notna
 
 import pandas.core.algorithms as algorithms
-from pandas.core.arrays import Categorical
+from pandas.core.arrays import Categorical, IntegerArray
 from pandas.core.base import (
     DataError,
     GroupByError,
@@ -52,7 +53,7 @@ import pandas.core.common as com
 from pandas.core.construction import extract_array
 from pandas.core.frame import DataFrame
 from pandas.core.generic import NDFrame
-from pandas.core.groupby import base
+from pandas.core.groupby import base, numba_
 from pandas.core.index import CategoricalIndex, Index, MultiIndex
 from pandas.core.series import Series
 from pandas.core.sorting import get_group_index_sorter
@@ -237,6 +238,22 @@ Examples
 %(examples)s
 """
 
+_agg_engine_doc = """engine : {'cython', 'numba'}, default 'cython'
+    * ``'cython'`` : the default path.
+    * ``'numba'`` : compiles `func`, and the loop over the groups, with
+      numba. `func` must be a function, which is called with the float64
+      ndarray of the values of each group (column by column for a
+      DataFrame) and must return a scalar. Only numeric columns are
+      aggregated and the result is float64. The compiled function is
+      cached.
+
+    .. versionadded:: 1.0.0
+engine_kwargs : dict, default None
+    Options for the numba engine: ``nopython``, ``nogil`` and ``parallel``,
+    defaulting to ``True``, ``False`` and ``False``.
+
+    .. versionadded:: 1.0.0"""
+
 _transform_template = """
 Call function producing a like-indexed %(klass)s on each group and
 return a %(klass)s having the same indexes as the original object
@@ -246,6 +263,24 @@ Parameters
 ----------
 f : function
     Function to apply to each group
+*args
+    Positional arguments to pass to f.
+engine : {'cython', 'numba'}, default 'cython'
+    * ``'cython'`` : calls f with each group.
+    * ``'numba'`` : compiles f, and the loop over the groups, with numba.
+      f is called with the float64 ndarray of the values of each group
+      (column by column for a DataFrame) and must return an array of the
+      same length or a scalar. Only numeric columns are transformed and the
+      result is float64. The compiled function is cached.
+
+    .. versionadded:: 1.0.0
+engine_kwargs : dict, default None
+    Options for the numba engine: ``nopython``, ``nogil`` and ``parallel``,
+    defaulting to ``True``, ``False`` and ``False``.
+
+    .. versionadded:: 1.0.0
+**kwargs
+    Keyword arguments to pass to f. Not supported with ``engine='numba'``.
 
 Returns
 -------
@@ -814,6 +849,10 @@ b  2""",
                     # _try_cast was called at a point where the result
                     # was already tz-aware
                     pass
+            elif isinstance(result, IntegerArray) and is_integer_dtype(dtype):
+                # the masked kernels sum into 64 bits, like numpy, and
+                # casting back to a narrower integer dtype would overflow
+                pass
             elif is_extension_array_dtype(dtype):
                 # The function can return something of any type, so check
                 # if the type is compatible with the calling EA.
@@ -921,6 +960,72 @@ b  2""",
 
         return self._wrap_aggregated_output(output)
 
+    @staticmethod
+    def _validate_engine(engine, engine_kwargs, kwargs):
+        if engine not in ("cython", "numba"):
+            raise ValueError("engine must be either 'numba' or 'cython'")
+        if engine == "cython" and engine_kwargs is not None:
+            raise ValueError("cython engine does not accept engine_kwargs")
+        if engine == "numba" and kwargs:
+            raise ValueError("numba engine does not support kwargs")
+
+    def _numba_prep(self):
+        """
+        Sort the rows by group and return the bounds of every group in the
+        sorted order.
+
+        Returns
+        -------
+        sorter : ndarray[int64]
+            Positions of the rows, sorted by group. Rows that are not in any
+            group (NA keys) come first.
+        starts, ends : ndarray[int64]
+            Group ``i`` is ``sorter[starts[i]:ends[i]]``.
+        """
+        if self.axis != 0:
+            raise NotImplementedError("numba engine only supports axis=0")
+
+        ids, _, ngroups = self.grouper.group_info
+        sorter = get_group_index_sorter(ids, ngroups)
+        sorted_ids = algorithms.take_nd(ids, sorter, allow_fill=False)
+        starts, ends = lib.generate_slices(sorted_ids, ngroups)
+        return sorter, starts, ends
+
+    def _iterate_numba_values(self):
+        # the numba engine only handles numeric numpy dtypes, which it
+        # receives as float64
+        for name, obj in self._iterate_slices():
+            if is_numeric_dtype(obj.dtype) and not is_extension_array_dtype(obj.dtype):
+                yield name, ensure_float64(obj.values)
+
+    def _numba_agg_general(self, func, args, engine_kwargs):
+        sorter, starts, ends = self._numba_prep()
+        kernel = numba_.get_groupby_agg(func, tuple(args), engine_kwargs)
+
+        output = collections.OrderedDict()
+        for name, values in self._iterate_numba_values():
+            output[name] = kernel(values.take(sorter), starts, ends)
+
+        if len(output) == 0:
+            raise DataError("No numeric types to aggregate")
+
+        return self._wrap_aggregated_output(output)
+
+    def _numba_transform_general(self, func, args, engine_kwargs):
+        sorter, starts, ends = self._numba_prep()
+        kernel = numba_.get_groupby_transform(func, tuple(args), engine_kwargs)
+
+        output = collections.OrderedDict()
+        for name, values in self._iterate_numba_values():
+            result = np.empty(len(values))
+            result[sorter] = kernel(values.take(sorter), starts, ends)
+            output[name] = result
+
+        if len(output) == 0:
+            raise DataError("No numeric types to aggregate")
+
+        return self._wrap_transformed_output(output)
+
     def _wrap_applied_output(self, *args, **kwargs):
         raise AbstractMethodError(self)
 
@@ -1440,6 +1545,47 @@ class GroupBy(_GroupBy):
 
         return self._apply_to_column_groupbys(lambda x: x._cython_agg_general("ohlc"))
 
+    def partial_agg(self, func):
+        """
+        Compute mergeable intermediate states of an aggregation.
+
+        The states of several chunks of a dataset, each grouped by the same
+        keys, can be combined with :func:`combine_partials` to obtain the
+        same result as ``.agg(func)`` on the concatenated chunks, without
+        holding all of the chunks in memory at once.
+
+        .. versionadded:: 1.0.0
+
+        Parameters
+        ----------
+        func : str or list of str
+            Any of 'sum', 'count', 'size', 'mean', 'var', 'std', 'min',
+            'max', 'first', 'last' and 'nunique'.
+
+        Returns
+        -------
+        DataFrame
+            Indexed by the group keys, with one column per intermediate
+            state. The columns are a MultiIndex of (column, function, state)
+            for a DataFrameGroupBy and of (function, state) for a
+            SeriesGroupBy.
+
+        See Also
+        --------
+        combine_partials : Combine partial aggregations of several chunks.
+
+        Examples
+        --------
+        >>> reader = pd.read_csv('data.csv', chunksize=10 ** 6)  # doctest: +SKIP
+        >>> partials = [chunk.groupby('key').partial_agg(['sum', 'std'])
+        ...             for chunk in reader]  # doctest: +SKIP
+        >>> pd.combine_partials(partials)  # doctest: +SKIP
+        """
+        from pandas.core.groupby.partials import partial_agg
+
+        with _group_selection_context(self):
+            return partial_agg(self, func)
+
     @Appender(DataFrame.describe.__doc__)
     def describe(self, **kwargs):
         with _group_selection_context(self):
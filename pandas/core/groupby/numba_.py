@@ -0,0 +1,85 @@
+""" numba engine for groupby aggregate and transform """
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from pandas.compat._optional import import_optional_dependency
+
+from pandas.core.util.numba_ import get_kernel, jit_user_function
+
+
+def make_groupby_agg(
+    func: Callable, args: Tuple, nogil: bool, parallel: bool, nopython: bool
+) -> Callable:
+    """
+    Compile ``func`` and a loop applying it to each group.
+
+    The returned kernel has signature ``kernel(values, starts, ends)``, where
+    ``values`` are sorted by group so that group ``i`` is
+    ``values[starts[i]:ends[i]]``, and returns ``func(group, *args)`` for
+    every group.
+    """
+    numba = import_optional_dependency("numba")
+    numba_func = jit_user_function(func, nopython, nogil)
+
+    if parallel:
+        loop_range = numba.prange
+    else:
+        loop_range = range
+
+    @numba.jit(nopython=nopython, nogil=nogil, parallel=parallel)
+    def group_agg(values, starts, ends):
+        result = np.empty(len(starts))
+        for i in loop_range(len(starts)):
+            result[i] = numba_func(values[starts[i] : ends[i]], *args)
+        return result
+
+    return group_agg
+
+
+def make_groupby_transform(
+    func: Callable, args: Tuple, nogil: bool, parallel: bool, nopython: bool
+) -> Callable:
+    """
+    Compile ``func`` and a loop applying it to each group.
+
+    Like :func:`make_groupby_agg`, but ``func(group, *args)`` returns an
+    array the length of the group (or a scalar, which is broadcast), and the
+    kernel returns the results in the sorted order of ``values``.
+    """
+    numba = import_optional_dependency("numba")
+    numba_func = jit_user_function(func, nopython, nogil)
+
+    if parallel:
+        loop_range = numba.prange
+    else:
+        loop_range = range
+
+    @numba.jit(nopython=nopython, nogil=nogil, parallel=parallel)
+    def group_transform(values, starts, ends):
+        result = np.full(len(values), np.nan)
+        for i in loop_range(len(starts)):
+            result[starts[i] : ends[i]] = numba_func(values[starts[i] : ends[i]], *args)
+        return result
+
+    return group_transform
+
+
+def get_groupby_agg(
+    func: Callable, args: Tuple, engine_kwargs: Optional[Dict[str, bool]]
+) -> Callable:
+    """
+    Return the compiled aggregation kernel for ``func``, compiling it on
+    first use.
+    """
+    return get_kernel(make_groupby_agg, func, args, engine_kwargs)
+
+
+def get_groupby_transform(
+    func: Callable, args: Tuple, engine_kwargs: Optional[Dict[str, bool]]
+) -> Callable:
+    """
+    Return the compiled transform kernel for ``func``, compiling it on first
+    use.
+    """
+    return get_kernel(make_groupby_transform, func, args, engine_kwargs)
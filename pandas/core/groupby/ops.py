@@ -7,9 +7,12 @@ are contained *in* the SeriesGroupBy and DataFrameGroupBy objects.
 """
 
 import collections
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
+from pandas._config import get_option
+
 from pandas._libs import NaT, iNaT, lib
 import pandas._libs.groupby as libgroupby
 import pandas._libs.reduction as libreduction
@@ -21,6 +24,7 @@ from pandas.core.dtypes.common import (
     ensure_int64,
     ensure_int_or_float,
     ensure_platform_int,
+    ensure_uint64,
     is_bool_dtype,
     is_categorical_dtype,
     is_complex_dtype,
@@ -30,11 +34,13 @@ from pandas.core.dtypes.common import (
     is_numeric_dtype,
     is_sparse,
     is_timedelta64_dtype,
+    is_unsigned_integer_dtype,
     needs_i8_conversion,
 )
 from pandas.core.dtypes.missing import _maybe_fill, isna
 
 import pandas.core.algorithms as algorithms
+from pandas.core.arrays import IntegerArray
 from pandas.core.base import SelectionMixin
 import pandas.core.common as com
 from pandas.core.frame import DataFrame
@@ -51,6 +57,10 @@ from pandas.core.sorting import (
     get_indexer_dict,
 )
 
+# minimum number of values for which the cython kernels are dispatched
+# to a thread pool when the ``compute.groupby_threads`` option is set
+_MIN_THREADED_SIZE = 100000
+
 
 def generate_bins_generic(values, binner, closed):
     """
@@ -396,6 +406,12 @@ class BaseGrouper:
 
     _name_functions = {"ohlc": lambda *args: ["open", "high", "low", "close"]}
 
+    # operations computed on the integers and the mask of an IntegerArray
+    _masked_functions = {
+        "aggregate": {"add", "min", "max", "mean", "var", "first", "last"},
+        "transform": {"cumsum"},
+    }
+
     def _is_builtin_func(self, arg):
         """
         if we define an builtin function for this argument, return it,
@@ -454,6 +470,11 @@ class BaseGrouper:
         assert kind in ["transform", "aggregate"]
         orig_values = values
 
+        if isinstance(values, IntegerArray) and how in self._masked_functions[kind]:
+            return self._cython_operation_masked(
+                kind, values, how, min_count=min_count, **kwargs
+            )
+
         # can we do this operation with our cython functions
         # if not raise NotImplementedError
 
@@ -596,6 +617,64 @@ class BaseGrouper:
 
         return result, names
 
+    def _cython_operation_masked(self, kind, values, how, min_count=-1, **kwargs):
+        """
+        Group an IntegerArray with the mask-aware kernels, which work on the
+        integers directly instead of casting them to float.
+
+        Returns
+        -------
+        result : IntegerArray or ndarray[float64]
+            A float ndarray for 'mean' and 'var'.
+        names : None
+        """
+        data = values._data
+        if is_unsigned_integer_dtype(data):
+            data = ensure_uint64(data)
+        else:
+            data = ensure_int64(data)
+        mask = values._mask.view(np.uint8)
+
+        labels, _, ngroups = self.group_info
+
+        if kind == "transform":
+            out = np.empty_like(data)
+            out_mask = np.empty(len(data), dtype=np.uint8)
+            libgroupby.group_cumsum_masked(
+                out,
+                out_mask,
+                data,
+                mask,
+                labels,
+                ngroups,
+                skipna=kwargs.get("skipna", True),
+            )
+            return IntegerArray(out, out_mask.view(np.bool_)), None
+
+        counts = np.zeros(ngroups, dtype=np.int64)
+        if how in ["mean", "var"]:
+            result = np.empty(ngroups, dtype=np.float64)
+            if how == "mean":
+                libgroupby.group_mean_masked(result, counts, data, mask, labels)
+            else:
+                libgroupby.group_var_masked(result, counts, data, mask, labels)
+        else:
+            out = np.empty(ngroups, dtype=data.dtype)
+            out_mask = np.empty(ngroups, dtype=np.uint8)
+            libgroupby.group_reduce_masked(
+                out, out_mask, counts, data, mask, labels, how, min_count=min_count
+            )
+            if how != "add":
+                # these fit in the original dtype, sums are kept in 64 bits
+                # like numpy does
+                out = out.astype(values._data.dtype, copy=False)
+            result = IntegerArray(out, out_mask.view(np.bool_))
+
+        if self._filter_empty_groups and not counts.all():
+            result = result[counts > 0]
+
+        return result, None
+
     def aggregate(self, values, how, axis=0, min_count=-1):
         return self._cython_operation(
             "aggregate", values, how, axis, min_count=min_count
@@ -604,6 +683,28 @@ class BaseGrouper:
     def transform(self, values, how, axis=0, **kwargs):
         return self._cython_operation("transform", values, how, axis, **kwargs)
 
+    def _get_column_slabs(self, values, is_numeric):
+        """
+        Split the columns of 2D ``values`` into contiguous slabs, one per
+        thread, if the ``compute.groupby_threads`` option asks for threading
+        and the aggregation kernels can release the GIL for this dtype.
+
+        Returns
+        -------
+        list of slice or None
+            None if the kernel should be called once on all of ``values``.
+        """
+        nthreads = get_option("compute.groupby_threads")
+        if nthreads <= 1 or not is_numeric or values.ndim != 2:
+            return None
+
+        ncols = values.shape[1]
+        if ncols < 2 or values.size < _MIN_THREADED_SIZE:
+            return None
+
+        edges = np.linspace(0, ncols, min(nthreads, ncols) + 1).astype(int)
+        return [slice(start, stop) for start, stop in zip(edges[:-1], edges[1:])]
+
     def _aggregate(
         self,
         result,
@@ -618,8 +719,21 @@ class BaseGrouper:
         if values.ndim > 2:
             # punting for now
             raise NotImplementedError("number of dimensions is currently limited to 2")
-        else:
+
+        slabs = self._get_column_slabs(values, is_numeric)
+        if slabs is None:
             agg_func(result, counts, values, comp_ids, min_count)
+        else:
+            # every slab computes the same group counts; only keep the first
+            slab_counts = [counts] + [np.zeros_like(counts) for _ in slabs[1:]]
+
+            def f(slab, slab_counts):
+                agg_func(
+                    result[:, slab], slab_counts, values[:, slab], comp_ids, min_count
+                )
+
+            with ThreadPoolExecutor(max_workers=len(slabs)) as executor:
+                list(executor.map(f, slabs, slab_counts))
 
         return result
 
@@ -0,0 +1,271 @@
+"""
+Provide mergeable partial aggregations for groupby.
+
+A partial aggregation stores, for every group, the intermediate state of a
+reduction (e.g. the sum and the count for a mean) instead of its final value.
+States computed on different chunks of a dataset can be concatenated and
+combined with the cythonized groupby reductions, so that data arriving in
+chunks (``read_csv(chunksize=...)``, ``HDFStore.select(iterator=True)``) can be
+aggregated in memory bounded by the number of groups rather than the number
+of rows.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from pandas.core.dtypes.common import is_list_like
+
+from pandas.core.frame import DataFrame
+from pandas.core.index import MultiIndex
+from pandas.core.series import Series
+
+# the intermediate states stored for each reduction
+_partial_states = OrderedDict(
+    [
+        ("sum", ("sum",)),
+        ("count", ("count",)),
+        ("size", ("size",)),
+        ("mean", ("sum", "count")),
+        ("var", ("count", "mean", "m2")),
+        ("std", ("count", "mean", "m2")),
+        ("min", ("min",)),
+        ("max", ("max",)),
+        ("first", ("first",)),
+        ("last", ("last",)),
+        ("nunique", ("unique",)),
+    ]
+)
+
+
+def _validate_funcs(func):
+    funcs = list(func) if is_list_like(func) else [func]
+    for f in funcs:
+        if f not in _partial_states:
+            raise ValueError(
+                "partial aggregation is not supported for {func!r}, "
+                "valid functions are {valid}".format(
+                    func=f, valid=", ".join(_partial_states)
+                )
+            )
+    if len(set(funcs)) != len(funcs):
+        raise ValueError("Function names must be unique, found multiple named ...")
+    return funcs
+
+
+def _unique_state(groupby, obj):
+    """
+    Unique non-null values of each group of the Series ``obj``, as an
+    object Series of ndarrays indexed like the groupby result.
+    """
+    ids, _, ngroups = groupby.grouper.group_info
+    pairs = DataFrame({"ids": ids, "values": obj.values})
+    pairs = pairs[(pairs["ids"] != -1) & pairs["values"].notna()]
+    pairs = pairs.drop_duplicates().sort_values("ids", kind="mergesort")
+
+    bounds = np.searchsorted(pairs["ids"].values, np.arange(1, ngroups))
+    values = np.empty(ngroups, dtype=object)
+    values[:] = np.split(pairs["values"].values, bounds)
+    return Series(values, index=groupby.grouper.result_index)
+
+
+def _compute_states(groupby, states):
+    """
+    Compute ``states`` for every column of ``groupby``.
+
+    Returns
+    -------
+    dict
+        Mapping of state name to a DataFrame (or Series for SeriesGroupBy)
+        indexed like the groupby result.
+    """
+    result = {}
+    for state in states:
+        if state in result:
+            continue
+        if state == "m2":
+            count = groupby.count()
+            m2 = groupby.var() * (count - 1)
+            result[state] = m2.where(count > 1, 0.0)
+        elif state == "unique":
+            obj = groupby._selected_obj
+            if obj.ndim == 1:
+                result[state] = _unique_state(groupby, obj)
+            else:
+                result[state] = DataFrame(
+                    {col: _unique_state(groupby, obj[col]) for col in obj},
+                    columns=obj.columns,
+                )
+        else:
+            result[state] = getattr(groupby, state)()
+    return result
+
+
+def partial_agg(groupby, func):
+    """
+    Compute mergeable intermediate states of ``func`` for ``groupby``.
+
+    See :meth:`GroupBy.partial_agg`.
+    """
+    if not groupby.as_index:
+        raise ValueError("partial aggregation requires as_index=True")
+
+    funcs = _validate_funcs(func)
+    states = [state for f in funcs for state in _partial_states[f]]
+    computed = _compute_states(groupby, states)
+
+    pieces = OrderedDict()
+    if groupby._selected_obj.ndim == 1:
+        for f in funcs:
+            for state in _partial_states[f]:
+                pieces[(f, state)] = computed[state]
+    else:
+        columns = groupby._obj_with_exclusions.columns
+        for col in columns:
+            for f in funcs:
+                states = _partial_states[f]
+                if f == "size":
+                    pieces[(col, f, "size")] = computed["size"]
+                elif all(col in computed[state] for state in states):
+                    # nuisance columns are dropped as in ``agg``
+                    for state in states:
+                        pieces[(col, f, state)] = computed[state][col]
+
+    result = DataFrame(pieces)
+    result.columns = MultiIndex.from_tuples(list(pieces))
+    return result
+
+
+def _combine_states(states):
+    """
+    Reduce the rows of the concatenated ``states`` frame (columns are the
+    state names of one function) to one row per group.
+    """
+    index = states.index
+    grouped = states.groupby(level=list(range(index.nlevels)), sort=True)
+    result = OrderedDict()
+
+    for state in states.columns:
+        if state in ("sum", "count", "size"):
+            result[state] = grouped[state].sum()
+        elif state in ("min", "max", "first", "last"):
+            result[state] = getattr(grouped[state], state)()
+
+    if "m2" in states:
+        # Chan et al. pairwise update of the sum of squared deviations
+        count = states["count"]
+        weighted = (count * states["mean"]).fillna(0)
+        total = grouped["count"].sum()
+        mean = weighted.groupby(grouped.grouper).sum() / total
+        mean = mean.where(total > 0)
+
+        delta = states["mean"] - mean.reindex(index).values
+        spread = (count * delta ** 2).fillna(0)
+        result["count"] = total
+        result["mean"] = mean
+        result["m2"] = grouped["m2"].sum() + spread.groupby(grouped.grouper).sum()
+
+    if "unique" in states:
+        ids, _, ngroups = grouped.grouper.group_info
+        sorter = np.argsort(ids, kind="mergesort")
+        bounds = np.searchsorted(ids[sorter], np.arange(1, ngroups))
+        chunks = np.split(states["unique"].values[sorter], bounds)
+
+        values = np.empty(ngroups, dtype=object)
+        values[:] = [_unique_arrays(chunk) for chunk in chunks]
+        result["unique"] = Series(values, index=grouped.grouper.result_index)
+
+    return DataFrame(result, columns=list(states.columns))
+
+
+def _unique_arrays(arrays):
+    arrays = [arr for arr in arrays if isinstance(arr, np.ndarray)]
+    if not arrays:
+        return np.array([], dtype=object)
+    return Series(np.concatenate(arrays)).unique()
+
+
+def _finalize_states(func, states):
+    if func in ("sum", "count", "size", "min", "max", "first", "last"):
+        return states[func]
+    elif func == "mean":
+        count = states["count"]
+        return (states["sum"] / count).where(count > 0)
+    elif func in ("var", "std"):
+        count = states["count"]
+        var = (states["m2"] / (count - 1)).where(count > 1)
+        return np.sqrt(var) if func == "std" else var
+    elif func == "nunique":
+        return states["unique"].map(len).astype("int64")
+    raise AssertionError(func)
+
+
+def combine_partials(partials, finalize=True):
+    """
+    Combine partial groupby aggregations into a single result.
+
+    .. versionadded:: 1.0.0
+
+    Parameters
+    ----------
+    partials : iterable of DataFrame
+        Results of :meth:`GroupBy.partial_agg` on chunks of a dataset, all
+        computed with the same functions and grouping keys.
+    finalize : bool, default True
+        If True, return the final aggregated values. Otherwise return the
+        combined intermediate states, which can be combined again with
+        further partial results.
+
+    Returns
+    -------
+    DataFrame
+        With ``finalize=True``, the same result as ``.agg(funcs)`` on the
+        concatenated data, where ``funcs`` is the list of functions passed to
+        ``partial_agg``.
+
+    See Also
+    --------
+    GroupBy.partial_agg : Compute the partial states to combine.
+
+    Examples
+    --------
+    >>> df = pd.DataFrame({'key': ['a', 'b', 'a', 'b'], 'x': [1, 2, 3, 5]})
+    >>> partials = [chunk.groupby('key').partial_agg(['sum', 'mean'])
+    ...             for chunk in [df.iloc[:2], df.iloc[2:]]]
+    >>> pd.combine_partials(partials)
+          x
+        sum mean
+    key
+    a     4  2.0
+    b     7  3.5
+    """
+    from pandas.core.reshape.concat import concat
+
+    partials = list(partials)
+    if not partials:
+        raise ValueError("No partial aggregations to combine")
+
+    state = concat(partials, sort=False)
+    columns = state.columns
+    by_func = OrderedDict()
+    for key in columns:
+        by_func.setdefault(key[:-1], []).append(key)
+
+    pieces = OrderedDict()
+    for func_key, keys in by_func.items():
+        states = state[keys]
+        states.columns = [key[-1] for key in keys]
+        combined = _combine_states(states)
+        if finalize:
+            pieces[func_key] = _finalize_states(func_key[-1], combined)
+        else:
+            for name in combined:
+                pieces[func_key + (name,)] = combined[name]
+
+    result = DataFrame(pieces)
+    keys = list(pieces)
+    if len(keys[0]) == 1:
+        result.columns = [key[0] for key in keys]
+    else:
+        result.columns = MultiIndex.from_tuples(keys)
+    return result
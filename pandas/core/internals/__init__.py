@@ -26,3 +26,4 @@ from .managers import (  # noqa: F401; reshape.concat, reshape.merge
 )
 
 from .blocks import _block_shape  # noqa:F401; io.pytables
+from .blocks import _read_only_if_shared  # noqa:F401; core.series
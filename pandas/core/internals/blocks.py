@@ -4,6 +4,7 @@ import inspect
 import re
 from typing import Any, List
 import warnings
+import weakref
 
 import numpy as np
 
@@ -83,6 +84,66 @@ from pandas.core.nanops import nanpercentile
 from pandas.io.formats.printing import pprint_thing
 
 
+# Arrays owning the memory of the values of deep copies made in
+# copy-on-write mode, keyed by id. Values viewing one of them are copied
+# before being modified in place.
+_shared_buffers = weakref.WeakValueDictionary()  # type: weakref.WeakValueDictionary
+
+
+def _get_buffer(values):
+    """
+    Return the ndarray owning the memory viewed by values, or None if there
+    is no such ndarray.
+    """
+    if not isinstance(values, np.ndarray):
+        return None
+    buffer = values if values.base is None else values.base
+    if not isinstance(buffer, np.ndarray) or not buffer.flags.owndata:
+        return None
+    return buffer
+
+
+def _share_values(values) -> bool:
+    """
+    Register the memory of values as shared by a copy.
+
+    Only values viewing all of the memory of an ndarray are shared, so that
+    a copy of a slice doesn't keep the whole parent alive.
+
+    Returns
+    -------
+    bool
+        Whether values can be used by the copy instead of being copied.
+    """
+    buffer = _get_buffer(values)
+    if buffer is None or buffer.nbytes != values.nbytes:
+        return False
+    _shared_buffers[id(buffer)] = buffer
+    return True
+
+
+def _is_shared(values) -> bool:
+    """
+    Whether values view memory shared by a copy made in copy-on-write mode.
+    """
+    if not _shared_buffers:
+        return False
+    buffer = _get_buffer(values)
+    return buffer is not None and _shared_buffers.get(id(buffer)) is buffer
+
+
+def _read_only_if_shared(values):
+    """
+    Return a read-only view of values if they view memory shared by a copy
+    made in copy-on-write mode, so that it can't be modified through the
+    arrays handed out to the user, and values otherwise.
+    """
+    if _is_shared(values):
+        values = values.view()
+        values.flags.writeable = False
+    return values
+
+
 class Block(PandasObject):
     """
     Canonical n-dimensional unit of homogeneous dtype contained in a pandas
@@ -195,7 +256,7 @@ class Block(PandasObject):
 
     def external_values(self, dtype=None):
         """ return an outside world format, currently just the ndarray """
-        return self.values
+        return _read_only_if_shared(self.values)
 
     def internal_values(self, dtype=None):
         """ return an internal format, currently just the ndarray
@@ -366,6 +427,7 @@ class Block(PandasObject):
         -------
         None
         """
+        self.copy_shared_values()
         self.values[locs] = values
 
     def delete(self, loc):
@@ -539,10 +601,12 @@ class Block(PandasObject):
 
         return self.split_and_operate(None, f, False)
 
-    def astype(self, dtype, copy=False, errors="raise", **kwargs):
-        return self._astype(dtype, copy=copy, errors=errors, **kwargs)
+    def astype(self, dtype, copy=False, errors="raise", copy_on_write=False, **kwargs):
+        return self._astype(
+            dtype, copy=copy, errors=errors, copy_on_write=copy_on_write, **kwargs
+        )
 
-    def _astype(self, dtype, copy=False, errors="raise", **kwargs):
+    def _astype(self, dtype, copy=False, errors="raise", copy_on_write=False, **kwargs):
         """Coerce to the new type
 
         Parameters
@@ -550,6 +614,9 @@ class Block(PandasObject):
         dtype : str, dtype convertible
         copy : boolean, default False
             copy if indicated
+        copy_on_write : boolean, default False
+            The mode.copy_on_write option, read once by the calling manager:
+            a copy to the same dtype may then share the values
         errors : str, {'raise', 'ignore'}, default 'ignore'
             - ``raise`` : allow exceptions to be raised
             - ``ignore`` : suppress exceptions. On error return original object
@@ -600,7 +667,7 @@ class Block(PandasObject):
         # astype processing
         if is_dtype_equal(self.dtype, dtype):
             if copy:
-                return self.copy()
+                return self.copy(copy_on_write=copy_on_write)
             return self
 
         try:
@@ -717,13 +784,30 @@ class Block(PandasObject):
         return values
 
     # block actions #
-    def copy(self, deep=True):
+    def copy(self, deep=True, copy_on_write=False):
         """ copy constructor """
+        # copy_on_write is the mode.copy_on_write option, read once by the
+        # calling manager: a deep copy may then share the values
         values = self.values
-        if deep:
+        if deep and not (copy_on_write and _share_values(values)):
             values = values.copy()
         return self.make_block_same_class(values, ndim=self.ndim)
 
+    def copy_shared_values(self) -> bool:
+        """
+        Replace the values by a copy if they are shared with a copy made in
+        copy-on-write mode, before they are modified in place.
+
+        Returns
+        -------
+        bool
+            Whether the values were copied.
+        """
+        if _is_shared(self.values):
+            self.values = self.values.copy()
+            return True
+        return False
+
     def replace(
         self, to_replace, value, inplace=False, filter=None, regex=False, convert=True
     ):
@@ -2263,10 +2347,13 @@ class DatetimeBlock(DatetimeLikeBlockMixin, Block):
         """
         values = conversion.ensure_datetime64ns(values, copy=False)
 
+        self.copy_shared_values()
         self.values[locs] = values
 
     def external_values(self):
-        return np.asarray(self.values.astype("datetime64[ns]", copy=False))
+        return _read_only_if_shared(
+            np.asarray(self.values.astype("datetime64[ns]", copy=False))
+        )
 
 
 class DatetimeTZBlock(ExtensionBlock, DatetimeBlock):
@@ -2558,7 +2645,9 @@ class TimeDeltaBlock(DatetimeLikeBlockMixin, IntBlock):
         return rvalues
 
     def external_values(self, dtype=None):
-        return np.asarray(self.values.astype("timedelta64[ns]", copy=False))
+        return _read_only_if_shared(
+            np.asarray(self.values.astype("timedelta64[ns]", copy=False))
+        )
 
 
 class BoolBlock(NumericBlock):
@@ -7,6 +7,8 @@ from typing import List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
+from pandas._config import get_option
+
 from pandas._libs import Timedelta, Timestamp, internals as libinternals, lib
 from pandas.util._validators import validate_bool_kwarg
 
@@ -46,6 +48,7 @@ from .blocks import (
     ObjectValuesExtensionBlock,
     _extend_blocks,
     _merge_blocks,
+    _read_only_if_shared,
     _safe_reshape,
     get_block_type,
     make_block,
@@ -435,6 +438,9 @@ class BlockManager(PandasObject):
                     axis = getattr(obj, "_info_axis_number", 0)
                     kwargs[k] = obj.reindex(b_items, axis=axis, copy=align_copy)
 
+            if f == "setitem" or kwargs.get("inplace"):
+                b.copy_shared_values()
+
             applied = getattr(b, f)(**kwargs)
             result_blocks = _extend_blocks(applied, result_blocks)
 
@@ -578,7 +584,12 @@ class BlockManager(PandasObject):
         return self.apply("downcast", **kwargs)
 
     def astype(self, dtype, **kwargs):
-        return self.apply("astype", dtype=dtype, **kwargs)
+        return self.apply(
+            "astype",
+            dtype=dtype,
+            copy_on_write=get_option("mode.copy_on_write"),
+            **kwargs
+        )
 
     def convert(self, **kwargs):
         return self.apply("convert", **kwargs)
@@ -617,6 +628,8 @@ class BlockManager(PandasObject):
 
             # its possible to get multiple result blocks here
             # replace ALWAYS will return a list
+            if inplace:
+                blk.copy_shared_values()
             rb = [blk if inplace else blk.copy()]
             for i, (s, d) in enumerate(zip(src_list, dest_list)):
                 # TODO: assert/validate that `d` is always a scalar?
@@ -762,6 +775,22 @@ class BlockManager(PandasObject):
     def nblocks(self):
         return len(self.blocks)
 
+    def copy_shared_values(self) -> bool:
+        """
+        Replace the values of the blocks that are shared with a copy made in
+        copy-on-write mode by copies, before they are modified in place.
+
+        Returns
+        -------
+        bool
+            Whether the values of any block were copied.
+        """
+        copied = False
+        for blk in self.blocks:
+            if blk.copy_shared_values():
+                copied = True
+        return copied
+
     def copy(self, deep=True):
         """
         Make deep or shallow copy of BlockManager
@@ -785,7 +814,13 @@ class BlockManager(PandasObject):
             new_axes = [copy(ax) for ax in self.axes]
         else:
             new_axes = list(self.axes)
-        return self.apply("copy", axes=new_axes, deep=deep, do_integrity_check=False)
+        return self.apply(
+            "copy",
+            axes=new_axes,
+            deep=deep,
+            copy_on_write=get_option("mode.copy_on_write"),
+            do_integrity_check=False,
+        )
 
     def as_array(self, transpose=False, items=None):
         """Convert the blockmanager data into an numpy array.
@@ -821,6 +856,7 @@ class BlockManager(PandasObject):
         else:
             arr = mgr._interleave()
 
+        arr = _read_only_if_shared(arr)
         return arr.transpose() if transpose else arr
 
     def _interleave(self):
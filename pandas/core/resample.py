@@ -6,7 +6,7 @@ import warnings
 
 import numpy as np
 
-from pandas._libs import lib
+from pandas._libs import groupby as libgroupby, lib
 from pandas._libs.tslibs import NaT, Period, Timestamp
 from pandas._libs.tslibs.frequencies import is_subperiod, is_superperiod
 from pandas._libs.tslibs.period import IncompatibleFrequency
@@ -14,21 +14,25 @@ from pandas.compat.numpy import function as nv
 from pandas.errors import AbstractMethodError
 from pandas.util._decorators import Appender, Substitution
 
+from pandas.core.dtypes.cast import maybe_downcast_to_dtype
+from pandas.core.dtypes.common import ensure_int64
 from pandas.core.dtypes.generic import ABCDataFrame, ABCSeries
 
 import pandas.core.algorithms as algos
+from pandas.core.frame import DataFrame
 from pandas.core.generic import _shared_docs
 from pandas.core.groupby.base import GroupByMixin
 from pandas.core.groupby.generic import SeriesGroupBy
 from pandas.core.groupby.groupby import GroupBy, _GroupBy, _pipe_template, groupby
 from pandas.core.groupby.grouper import Grouper
 from pandas.core.groupby.ops import BinGrouper
+from pandas.core.indexes.api import Index, MultiIndex
 from pandas.core.indexes.datetimes import DatetimeIndex, date_range
 from pandas.core.indexes.period import PeriodIndex, period_range
 from pandas.core.indexes.timedeltas import TimedeltaIndex, timedelta_range
 
 from pandas.tseries.frequencies import to_offset
-from pandas.tseries.offsets import DateOffset, Day, Nano, Tick
+from pandas.tseries.offsets import DateOffset, Day, Hour, Nano, Tick
 
 _shared_docs_kwargs = dict()  # type: Dict[str, str]
 
@@ -274,12 +278,19 @@ class Resampler(_GroupBy):
         versionadded="",
         klass="DataFrame",
         axis="",
+        engine="",
     )
     @Appender(_shared_docs["aggregate"])
     def aggregate(self, func, *args, **kwargs):
 
         self._set_binner()
-        result, how = self._aggregate(func, *args, **kwargs)
+        result = None
+        if not args and not kwargs:
+            result = self._aggregate_bins(func)
+        if result is not None:
+            how = func
+        else:
+            result, how = self._aggregate(func, *args, **kwargs)
         if result is None:
             how = func
             grouper = None
@@ -369,6 +380,85 @@ class Resampler(_GroupBy):
         result = self._apply_loffset(result)
         return self._wrap_result(result)
 
+    def _aggregate_bins(self, func):
+        """
+        Compute a list of aggregations of all of the columns in a single pass
+        over the bins, which are contiguous slices of the sorted data.
+
+        Returns
+        -------
+        Series, DataFrame or None
+            None if ``func`` or the data aren't supported, to use the groupby
+            path instead.
+        """
+        if not isinstance(func, list) or not func or len(set(func)) != len(func):
+            return None
+        if not all(isinstance(how, str) for how in func):
+            return None
+        if not all(how in libgroupby.bin_aggregations for how in func):
+            return None
+
+        obj = self._selected_obj
+        ax = self.ax
+        if (
+            self.axis != 0
+            or isinstance(self, _GroupByMixin)
+            or not isinstance(self.grouper, BinGrouper)
+            or not isinstance(ax, (DatetimeIndex, TimedeltaIndex))
+            or not len(ax)
+            or ax.hasnans
+        ):
+            return None
+
+        if isinstance(obj, ABCDataFrame):
+            if not obj.columns.is_unique:
+                return None
+            columns = [obj.iloc[:, i] for i in range(obj.shape[1])]
+        else:
+            columns = [obj]
+
+        # the values are aggregated as float64, which is exact for integers
+        # below 2**53 like the groupby kernels
+        dtypes = [col.dtype for col in columns]
+        for col, dtype in zip(columns, dtypes):
+            if dtype.kind not in "fi" or dtype.itemsize > 8:
+                return None
+            if dtype.kind == "i":
+                values = col.values
+                if values.min() <= -(2 ** 53) or values.max() >= 2 ** 53:
+                    return None
+
+        if isinstance(obj, ABCDataFrame):
+            values = obj.values.T
+        else:
+            values = obj.values[None, :]
+        values = np.ascontiguousarray(values, dtype=np.float64)
+
+        bins = ensure_int64(self.grouper.bins)
+        hows = np.array([libgroupby.bin_aggregations[how] for how in func])
+        out = np.empty((len(bins), len(values) * len(func)), dtype=np.float64)
+        libgroupby.group_agg_bins(out, values, bins, ensure_int64(hows))
+
+        # cast back like the groupby aggregations do
+        arrays = []
+        for i, dtype in enumerate(dtypes):
+            for j, how in enumerate(func):
+                result = out[:, i * len(func) + j]
+                if how == "count":
+                    result = result.astype(np.int64)
+                else:
+                    result = maybe_downcast_to_dtype(result, dtype)
+                arrays.append(result)
+
+        index = self.grouper.result_index
+        if isinstance(obj, ABCDataFrame):
+            columns = MultiIndex.from_product([list(obj.columns), func])
+        else:
+            columns = Index(func)
+        result = DataFrame(dict(enumerate(arrays)), index=index)
+        result.columns = columns
+        return result
+
     def _apply_loffset(self, result):
         """
         If loffset is set, offset the result index.
@@ -885,6 +975,56 @@ class Resampler(_GroupBy):
         """
         return self._downsample("quantile", q=q, **kwargs)
 
+    def stream(self, func, *args, **kwargs):
+        """
+        Resample data that arrives in sorted chunks.
+
+        Only the rows of the last bin, which a later chunk can still add to,
+        are kept between chunks, so that memory is proportional to the size
+        of a chunk rather than to the length of the data.
+
+        .. versionadded:: 1.0.0
+
+        Parameters
+        ----------
+        func : function, str, list or dict
+            Aggregation computed for each bin, accepting the same values as
+            :meth:`aggregate`.
+        *args, **kwargs
+            Arguments and keyword arguments to be passed into func.
+
+        Returns
+        -------
+        StreamingResampler
+            Its :meth:`~StreamingResampler.update` method adds a chunk and
+            returns the bins it closed, :meth:`~StreamingResampler.close`
+            returns the last bin.
+
+        See Also
+        --------
+        Resampler.aggregate : Aggregate the bins of the data.
+
+        Notes
+        -----
+        The data of the resampler is the beginning of the stream. Chunks
+        must have a :class:`DatetimeIndex` and follow it in time. A fixed
+        frequency, such as ``'7min'``, must divide a day, since its bins
+        are anchored at the midnight of the first timestamp.
+
+        Examples
+        --------
+        >>> index = pd.date_range('2019-01-01', periods=6, freq='20s')
+        >>> s = pd.Series(range(6), index=index)
+        >>> stream = s[:3].resample('1min').stream('sum')
+        >>> stream.update(s[3:5])
+        2019-01-01    3
+        Freq: T, dtype: int64
+        >>> stream.close()
+        2019-01-01 00:01:00    7
+        Freq: T, dtype: int64
+        """
+        return StreamingResampler(self, func, *args, **kwargs)
+
 
 # downsample methods
 for method in ["sum", "prod"]:
@@ -1291,6 +1431,148 @@ class TimedeltaIndexResamplerGroupby(_GroupByMixin, TimedeltaIndexResampler):
         return TimedeltaIndexResampler
 
 
+class StreamingResampler:
+    """
+    Resampling of data that arrives in sorted chunks.
+
+    Created by :meth:`Resampler.stream`. The rows of the last bin, which a
+    later chunk can add to, are kept between calls to :meth:`update`.
+
+    Parameters
+    ----------
+    resampler : DatetimeIndexResampler
+        The parameters and the beginning of the data.
+    func : function, str, list or dict
+        Aggregation computed for each bin.
+    *args, **kwargs
+        Arguments and keyword arguments to be passed into func.
+    """
+
+    def __init__(self, resampler, func, *args, **kwargs):
+        if isinstance(resampler, _GroupByMixin):
+            raise NotImplementedError("stream is not implemented for groupby")
+        if type(resampler) is not DatetimeIndexResampler:
+            raise NotImplementedError("stream is only implemented for a DatetimeIndex")
+        if resampler.axis != 0:
+            raise NotImplementedError("stream is only implemented for axis=0")
+        if resampler.kind == "period":
+            raise NotImplementedError("stream is not implemented for kind='period'")
+        if resampler._from_selection:
+            raise NotImplementedError(
+                "stream is not implemented for resampling on a column or level"
+            )
+
+        # the bins of a fixed frequency are anchored at the midnight of the
+        # first timestamp of each chunk, which must fall on the bins of the
+        # previous chunks; the days of a timezone can be an hour shorter
+        freq = resampler.freq
+        if isinstance(freq, Day):
+            supported = freq.n == 1
+        elif isinstance(freq, Tick):
+            period = Day(1) if resampler.ax.tz is None else Hour(1)
+            supported = period.nanos % freq.nanos == 0
+        else:
+            supported = True
+        if not supported:
+            raise NotImplementedError(
+                "stream is only implemented for a fixed frequency that divides "
+                "a day, or an hour for timezone-aware data"
+            )
+
+        self._resampler = resampler
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self._pending = self._validate_chunk(resampler.obj, None)
+
+    def _validate_chunk(self, chunk, pending):
+        if not isinstance(chunk, (ABCSeries, ABCDataFrame)):
+            raise TypeError("chunks must be a Series or DataFrame")
+        if pending is not None:
+            if pending.ndim != chunk.ndim:
+                raise TypeError(
+                    "chunks must be a {klass}".format(klass=type(pending).__name__)
+                )
+            if chunk.ndim == 2 and not chunk.columns.equals(pending.columns):
+                raise ValueError("chunks must have the same columns as the data")
+
+        index = chunk.index
+        if not isinstance(index, DatetimeIndex):
+            raise TypeError(
+                "chunks must have a DatetimeIndex, but got an instance "
+                "of %r" % type(index).__name__
+            )
+        if index.hasnans:
+            raise ValueError("chunks must not have NaT in their index")
+        if not index.is_monotonic_increasing:
+            raise ValueError("chunks must be sorted by time")
+        if pending is not None and len(pending) and len(chunk):
+            if index[0] < pending.index[-1]:
+                raise ValueError("chunks must follow the previous chunk in time")
+        return chunk
+
+    def _resample(self, data):
+        groupby = self._resampler.groupby
+        return resample(
+            data,
+            kind=self._resampler.kind,
+            freq=groupby.freq,
+            closed=groupby.closed,
+            label=groupby.label,
+            loffset=groupby.loffset,
+            base=groupby.base,
+        )
+
+    def update(self, chunk):
+        """
+        Add a chunk to the data and return the bins that it closed.
+
+        Parameters
+        ----------
+        chunk : Series or DataFrame
+            The rows following those of the previous chunk, with the same
+            columns as the data the stream was created from.
+
+        Returns
+        -------
+        Series or DataFrame
+            The aggregation of the bins before the one of the last row of the
+            chunk, indexed by their labels.
+        """
+        from pandas.core.reshape.concat import concat
+
+        pending = self._pending
+        self._validate_chunk(chunk, pending)
+        data = concat([pending, chunk])
+
+        resampler = self._resample(data)
+        result = resampler.aggregate(self.func, *self.args, **self.kwargs)
+        if not len(data):
+            return result
+
+        # the last bin holds the last row, later chunks can add to it
+        bins = resampler.grouper.bins
+        nclosed = bins.searchsorted(len(data), side="left")
+        start = bins[nclosed - 1] if nclosed else 0
+
+        self._pending = data.iloc[start:].copy()
+        return result.iloc[:nclosed]
+
+    def close(self):
+        """
+        Return the aggregation of the last bin and clear the data.
+
+        Returns
+        -------
+        Series or DataFrame
+            The aggregation of the bin of the last row, if any.
+        """
+        pending = self._pending
+        result = self._resample(pending).aggregate(self.func, *self.args, **self.kwargs)
+        self._pending = pending.iloc[:0]
+        return result
+
+
 def resample(obj, kind=None, **kwds):
     """
     Create a TimeGrouper and return our resampler.
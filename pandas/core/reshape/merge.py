@@ -9,7 +9,7 @@ import warnings
 
 import numpy as np
 
-from pandas._libs import hashtable as libhashtable, lib
+from pandas._libs import algos as libalgos, hashtable as libhashtable, lib
 import pandas._libs.join as libjoin
 from pandas.errors import MergeError
 from pandas.util._decorators import Appender, Substitution
@@ -1279,6 +1279,24 @@ def _get_join_indexers(left_keys, right_keys, sort=False, how="inner", **kwargs)
         right_keys
     ), "left_key and right_keys must be the same length"
 
+    if not kwargs and (how in ("inner", "left") or sort):
+        # already sorted keys can be joined in a single linear pass
+        result = _sorted_join_indexers(left_keys, right_keys, how)
+        if result is not None:
+            return result
+
+    if (
+        how == "left"
+        and not sort
+        and not kwargs
+        and len(right_keys[0]) * _HASH_JOIN_RATIO <= len(left_keys[0])
+    ):
+        # a large table left-joined to a small one with unique keys can be
+        # resolved by hashing the small side only
+        result = _hash_join_unique(left_keys, right_keys)
+        if result is not None:
+            return result
+
     # bind `sort` arg. of _factorize_keys
     fkeys = partial(_factorize_keys, sort=sort)
 
@@ -1833,7 +1851,183 @@ _join_functions = {
 }
 
 
-def _factorize_keys(lk, rk, sort=True):
+# minimum ratio of the number of rows of the left side to the right side for
+# which a left merge tries the build-probe path of _hash_join_unique
+_HASH_JOIN_RATIO = 4
+
+
+def _hash_join_unique(probe_keys, build_keys):
+    """
+    Left join ``probe_keys`` to ``build_keys`` by hashing only the build side.
+
+    Each level of the (smaller) build side is factorized and the (larger)
+    probe side is looked up in the resulting hashtable, so that unlike
+    ``_factorize_keys`` no hashtable or label arrays are built for the union
+    of both sides.
+
+    Parameters
+    ----------
+    probe_keys : list of array-like
+    build_keys : list of array-like
+
+    Returns
+    -------
+    tuple of (probe_indexer, build_indexer) or None
+        None if the build side contains missing or duplicate keys, in which
+        case the general factorize-and-sort join must be used.
+    """
+    nprobe = len(probe_keys[0])
+    if not len(build_keys[0]):
+        return None
+
+    probe_labels, build_labels, shape = [], [], []
+
+    for pk, bk in zip(probe_keys, build_keys):
+        pk, bk, klass = _prepare_factorize_keys(pk, bk)
+
+        rizer = klass(max(len(bk), 1))
+        blab = rizer.factorize(bk)
+        if (blab == -1).any():
+            return None
+
+        probe_labels.append(rizer.table.lookup(pk))
+        build_labels.append(blab)
+        shape.append(rizer.get_count())
+
+    if len(shape) == 1:
+        if shape[0] != len(build_labels[0]):
+            return None
+        # with unique keys the labels of the build side are its positions
+        build_indexer = probe_labels[0]
+    else:
+        if is_int64_overflow_possible(shape):
+            return None
+
+        # flat i8 keys over the levels of the build side
+        stride = np.prod(shape, dtype="i8")
+        build_key = np.zeros(len(build_labels[0]), dtype="i8")
+        probe_key = np.zeros(nprobe, dtype="i8")
+        missing = np.zeros(nprobe, dtype=bool)
+        for blab, plab, size in zip(build_labels, probe_labels, shape):
+            stride //= size
+            build_key += blab * stride
+            probe_key += plab * stride
+            missing |= plab == -1
+        probe_key[missing] = -1
+
+        table = libhashtable.Int64HashTable(max(len(build_key), 1))
+        table.map_locations(build_key)
+        if len(table) != len(build_key):
+            return None
+        build_indexer = table.lookup(probe_key)
+
+    return np.arange(nprobe, dtype=np.int64), ensure_int64(build_indexer)
+
+
+def _sorted_join_keys(left_keys, right_keys):
+    """
+    Combine ``left_keys`` and ``right_keys`` into one flat array per side
+    whose order matches the lexicographic order of the key tuples.
+
+    Returns
+    -------
+    tuple of (left_key, right_key) or None
+        None if the keys are not integer-like (or float for a single key),
+        or their flat representation would overflow int64.
+    """
+    lkeys, rkeys = [], []
+    for lk, rk in zip(left_keys, right_keys):
+        if (
+            len(left_keys) == 1
+            and isinstance(lk, np.ndarray)
+            and isinstance(rk, np.ndarray)
+            and lk.dtype == rk.dtype == np.float64
+        ):
+            return lk, rk
+
+        lk, rk, klass = _prepare_factorize_keys(lk, rk)
+        if klass is not libhashtable.Int64Factorizer:
+            return None
+        lkeys.append(lk)
+        rkeys.append(rk)
+
+    if len(lkeys) == 1:
+        return lkeys[0], rkeys[0]
+
+    if not len(lkeys[0]) or not len(rkeys[0]):
+        return None
+
+    # offset every level by its minimum so that the flat key of a tuple
+    # grows with its lexicographic rank
+    lows, shape = [], []
+    for lk, rk in zip(lkeys, rkeys):
+        low = min(int(lk.min()), int(rk.min()))
+        high = max(int(lk.max()), int(rk.max()))
+        lows.append(low)
+        shape.append(high - low + 1)
+
+    if is_int64_overflow_possible(shape):
+        return None
+
+    stride = np.prod(shape, dtype="i8")
+    lkey = np.zeros(len(lkeys[0]), dtype="i8")
+    rkey = np.zeros(len(rkeys[0]), dtype="i8")
+    for lk, rk, low, size in zip(lkeys, rkeys, lows, shape):
+        stride //= size
+        lkey += (lk - low) * stride
+        rkey += (rk - low) * stride
+
+    return lkey, rkey
+
+
+def _sorted_join_indexers(left_keys, right_keys, how):
+    """
+    Join already sorted keys with a linear merge-join instead of hashing.
+
+    The sorted join indexers in ``libjoin`` (as used by ``Index.join``) only
+    handle duplicate keys on one of the sides, and order their result by
+    key, so this is only used where that gives the same result as the
+    general join.
+
+    Returns
+    -------
+    tuple of (left_indexer, right_indexer) or None
+        None if the keys are not sorted, not of a supported dtype, or
+        duplicated on both sides.
+    """
+    keys = _sorted_join_keys(left_keys, right_keys)
+    if keys is None:
+        return None
+    lkey, rkey = keys
+
+    timelike = False
+    lmono, _, lunique = libalgos.is_monotonic(lkey, timelike)
+    if not lmono:
+        return None
+    rmono, _, runique = libalgos.is_monotonic(rkey, timelike)
+    if not rmono or not (lunique or runique):
+        return None
+
+    if how == "inner":
+        _, lidx, ridx = libjoin.inner_join_indexer(lkey, rkey)
+    elif how == "left":
+        _, lidx, ridx = libjoin.left_join_indexer(lkey, rkey)
+    elif how == "right":
+        _, ridx, lidx = libjoin.left_join_indexer(rkey, lkey)
+    else:
+        _, lidx, ridx = libjoin.outer_join_indexer(lkey, rkey)
+
+    return lidx, ridx
+
+
+def _prepare_factorize_keys(lk, rk):
+    """
+    Convert ``lk`` and ``rk`` to arrays that can be factorized together.
+
+    Returns
+    -------
+    tuple of (lk, rk, factorizer class)
+    """
     # Some pre-processing for non-ndarray lk / rk
     if is_datetime64tz_dtype(lk) and is_datetime64tz_dtype(rk):
         lk = getattr(lk, "_values", lk)._data
@@ -1878,6 +2072,12 @@ def _factorize_keys(lk, rk, sort=True):
         lk = ensure_object(lk)
         rk = ensure_object(rk)
 
+    return lk, rk, klass
+
+
+def _factorize_keys(lk, rk, sort=True):
+    lk, rk, klass = _prepare_factorize_keys(lk, rk)
+
     rizer = klass(max(len(lk), len(rk)))
 
     llab = rizer.factorize(lk)
@@ -75,7 +75,7 @@ from pandas.core.indexes.datetimes import DatetimeIndex
 from pandas.core.indexes.period import PeriodIndex
 from pandas.core.indexes.timedeltas import TimedeltaIndex
 from pandas.core.indexing import check_bool_indexer
-from pandas.core.internals import SingleBlockManager
+from pandas.core.internals import SingleBlockManager, _read_only_if_shared
 from pandas.core.strings import StringMethods
 from pandas.core.tools.datetimes import to_datetime
 
@@ -562,6 +562,11 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         """
         return self._data.internal_values()
 
+    @property
+    def _external_values(self):
+        # read-only while shared with a copy made in copy-on-write mode
+        return _read_only_if_shared(self._values)
+
     def get_values(self):
         """
         Same as values (but handles sparseness conversions); is a view.
@@ -1251,6 +1256,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
             self._maybe_update_cacher()
 
     def _set_with_engine(self, key, value):
+        self._data.copy_shared_values()
         values = self._values
         if is_extension_array_dtype(values.dtype):
             # The cython indexing engine does not support ExtensionArrays.
@@ -1342,6 +1348,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
             If label is contained, will be reference to calling Series,
             otherwise a new object.
         """
+        self._data.copy_shared_values()
         try:
             if takeable:
                 self._values[label] = value
@@ -3832,6 +3839,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         see_also=_agg_see_also_doc,
         examples=_agg_examples_doc,
         versionadded="\n.. versionadded:: 0.20.0\n",
+        engine="",
         **_shared_doc_kwargs
     )
     @Appender(generic._shared_docs["aggregate"])
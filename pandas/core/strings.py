@@ -30,6 +30,7 @@ from pandas.core.dtypes.generic import (
 from pandas.core.dtypes.missing import isna
 
 from pandas.core.algorithms import take_1d
+from pandas.core.arrays.string_ import StringArray
 from pandas.core.base import NoNewAttributesMixin
 import pandas.core.common as com
 
@@ -46,6 +47,9 @@ _cpython_optimized_decoders = _cpython_optimized_encoders + ("utf-16", "utf-32")
 
 _shared_docs = dict()  # type: Dict[str, str]
 
+# characters with a special meaning in regular expressions
+_regex_special_chars = frozenset(".^$*+?{}[]|()\\")
+
 
 def cat_core(list_of_columns: List, sep: str):
     """
@@ -108,6 +112,35 @@ def cat_safe(list_of_columns: List, sep: str):
     return result
 
 
+def _string_array(arr):
+    """
+    Return the StringArray backing the Series ``arr``, or None.
+    """
+    values = getattr(arr, "array", None)
+    if isinstance(values, StringArray):
+        return values
+    return None
+
+
+def _na_fill(result, mask, na_value=np.nan):
+    """
+    Put ``na_value`` into ``result`` where ``mask`` is set, converting the
+    result the same way as ``_na_map``.
+    """
+    if not mask.any():
+        return result
+
+    result = result.astype(object)
+    result[mask] = np.nan
+    if not mask.all():
+        result = lib.maybe_convert_objects(result)
+    if na_value is not np.nan:
+        np.putmask(result, mask, na_value)
+        if result.dtype == object:
+            result = lib.maybe_convert_objects(result)
+    return result
+
+
 def _na_map(f, arr, na_result=np.nan, dtype=object):
     # should really _check_ for NA
     return _map(f, arr, na_mask=True, na_value=na_result, dtype=dtype)
@@ -345,6 +378,15 @@ def str_contains(arr, pat, case=True, flags=0, na=np.nan, regex=True):
     4    False
     dtype: bool
     """
+    values = _string_array(arr)
+    if (
+        values is not None
+        and case
+        and isinstance(pat, str)
+        and (not regex or (not flags and _regex_special_chars.isdisjoint(pat)))
+    ):
+        return _na_fill(values._str_contains(pat), values.isna(), na)
+
     if regex:
         if not case:
             flags |= re.IGNORECASE
@@ -422,6 +464,10 @@ def str_startswith(arr, pat, na=np.nan):
     3    False
     dtype: bool
     """
+    values = _string_array(arr)
+    if values is not None and isinstance(pat, str):
+        return _na_fill(values._str_startswith(pat), values.isna(), na)
+
     f = lambda x: x.startswith(pat)
     return _na_map(f, arr, na, dtype=bool)
 
@@ -477,6 +523,10 @@ def str_endswith(arr, pat, na=np.nan):
     3    False
     dtype: bool
     """
+    values = _string_array(arr)
+    if values is not None and isinstance(pat, str):
+        return _na_fill(values._str_endswith(pat), values.isna(), na)
+
     f = lambda x: x.endswith(pat)
     return _na_map(f, arr, na, dtype=bool)
 
@@ -1474,6 +1524,10 @@ def str_slice(arr, start=None, stop=None, step=None):
     2    cm
     dtype: object
     """
+    values = _string_array(arr)
+    if values is not None:
+        return values._str_slice(start, stop, step)
+
     obj = slice(start, stop, step)
     f = lambda x: x[obj]
     return _na_map(f, arr)
@@ -1858,10 +1912,21 @@ def forbid_nonstring_types(forbidden, name=None):
     return _forbid_nonstring_types
 
 
-def _noarg_wrapper(f, name=None, docstring=None, forbidden_types=["bytes"], **kargs):
+def _noarg_wrapper(
+    f,
+    name=None,
+    docstring=None,
+    forbidden_types=["bytes"],
+    string_array_f=None,
+    **kargs
+):
     @forbid_nonstring_types(forbidden_types, name=name)
     def wrapper(self):
-        result = _na_map(f, self._parent, **kargs)
+        values = _string_array(self._parent)
+        if string_array_f is not None and values is not None:
+            result = string_array_f(values)
+        else:
+            result = _na_map(f, self._parent, **kargs)
         return self._wrap_result(result)
 
     wrapper.__name__ = f.__name__ if name is None else name
@@ -3067,7 +3132,11 @@ class StringMethods(NoNewAttributesMixin):
     dtype: float64
     """
     len = _noarg_wrapper(
-        len, docstring=_shared_docs["len"], forbidden_types=None, dtype=int
+        len,
+        docstring=_shared_docs["len"],
+        forbidden_types=None,
+        string_array_f=lambda values: _na_fill(values._str_len(), values.isna()),
+        dtype=int,
     )
 
     _shared_docs[
@@ -3156,11 +3225,13 @@ class StringMethods(NoNewAttributesMixin):
     lower = _noarg_wrapper(
         lambda x: x.lower(),
         name="lower",
+        string_array_f=lambda values: values._str_case(upper=False),
         docstring=_shared_docs["casemethods"] % _doc_args["lower"],
     )
     upper = _noarg_wrapper(
         lambda x: x.upper(),
         name="upper",
+        string_array_f=lambda values: values._str_case(upper=True),
         docstring=_shared_docs["casemethods"] % _doc_args["upper"],
     )
     title = _noarg_wrapper(
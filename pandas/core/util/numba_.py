@@ -0,0 +1,72 @@
+"""
+Common utilities for the numba engines
+"""
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from pandas.compat._optional import import_optional_dependency
+
+# compiled kernels, keyed on the kernel factory, the user function, its extra
+# positional arguments and the numba options they were compiled with
+_numba_func_cache = {}  # type: Dict[Tuple, Callable]
+
+_DEFAULT_ENGINE_KWARGS = {"nopython": True, "nogil": False, "parallel": False}
+
+
+def validate_engine_kwargs(engine_kwargs: Optional[Dict[str, bool]]) -> Dict:
+    """
+    Fill in the defaults of the numba options and check that no unknown
+    options are passed.
+    """
+    if engine_kwargs is None:
+        engine_kwargs = {}
+    unknown = set(engine_kwargs) - set(_DEFAULT_ENGINE_KWARGS)
+    if unknown:
+        raise ValueError(
+            "engine_kwargs only supports {supported}, got {unknown}".format(
+                supported=sorted(_DEFAULT_ENGINE_KWARGS), unknown=sorted(unknown)
+            )
+        )
+    result = dict(_DEFAULT_ENGINE_KWARGS)
+    result.update(engine_kwargs)
+    return result
+
+
+def jit_user_function(func: Callable, nopython: bool, nogil: bool) -> Callable:
+    """
+    Compile the user function with numba.
+
+    A function that is already jitted is recompiled with the given options.
+    """
+    numba = import_optional_dependency("numba")
+    func = getattr(func, "py_func", func)
+    return numba.jit(nopython=nopython, nogil=nogil)(func)
+
+
+def get_kernel(
+    make_kernel: Callable,
+    func: Callable,
+    args: Tuple,
+    engine_kwargs: Optional[Dict[str, bool]],
+) -> Callable:
+    """
+    Return the kernel ``make_kernel(func, args, **engine_kwargs)``, compiling
+    it on first use.
+
+    numba specializes a kernel on the dtypes it is called with and keeps each
+    specialization, so the cache only needs to be keyed on the function and
+    the options.
+    """
+    engine_kwargs = validate_engine_kwargs(engine_kwargs)
+    options = tuple(sorted(engine_kwargs.items()))
+    key = (make_kernel, func, args) + options  # type: Any
+    try:
+        return _numba_func_cache[key]
+    except TypeError:
+        # unhashable args, compile without caching
+        return make_kernel(func, args, **engine_kwargs)
+    except KeyError:
+        pass
+
+    kernel = make_kernel(func, args, **engine_kwargs)
+    _numba_func_cache[key] = kernel
+    return kernel
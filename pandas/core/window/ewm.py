@@ -6,6 +6,7 @@ import pandas._libs.window as libwindow
 from pandas.compat.numpy import function as nv
 from pandas.util._decorators import Appender, Substitution
 
+from pandas.core.dtypes.common import is_numeric_dtype, needs_i8_conversion
 from pandas.core.dtypes.generic import ABCDataFrame
 
 from pandas.core.base import DataError
@@ -204,6 +205,7 @@ class EWM(_Rolling):
         versionadded="",
         klass="Series/Dataframe",
         axis="",
+        engine="",
     )
     @Appender(_shared_docs["aggregate"])
     def aggregate(self, func, *args, **kwargs):
@@ -281,6 +283,45 @@ class EWM(_Rolling):
         nv.validate_window_func("mean", args, kwargs)
         return self._apply("ewma", **kwargs)
 
+    def online(self):
+        """
+        Exponential weighted moving average of rows appended to the data.
+
+        The recursion of :meth:`mean` is run once over the current data and
+        its state is kept, so that each batch of new rows costs time
+        proportional to its own length only.
+
+        .. versionadded:: 1.0.0
+
+        Returns
+        -------
+        OnlineEWM
+
+        See Also
+        --------
+        EWM.mean : Exponential weighted moving average of the data.
+
+        Examples
+        --------
+        >>> s = pd.Series([0, 1, 2])
+        >>> online = s.ewm(com=0.5).online()
+        >>> online.update(pd.Series([np.nan, 4], index=[3, 4]))
+        3    1.615385
+        4    3.670213
+        dtype: float64
+
+        The result is the same as that of :meth:`mean` over all the rows.
+
+        >>> pd.Series([0, 1, 2, np.nan, 4]).ewm(com=0.5).mean()
+        0    0.000000
+        1    0.750000
+        2    1.615385
+        3    1.615385
+        4    3.670213
+        dtype: float64
+        """
+        return OnlineEWM(self)
+
     @Substitution(name="ewm")
     @Appender(_doc_template)
     @Appender(_bias_template)
@@ -386,3 +427,104 @@ class EWM(_Rolling):
         return _flex_binary_moment(
             self._selected_obj, other._selected_obj, _get_corr, pairwise=bool(pairwise)
         )
+
+
+class OnlineEWM:
+    """
+    Exponential weighted moving average that is updated with new rows.
+
+    Created by :meth:`EWM.online`. The weighted average, old weight and
+    number of observations of every column are kept between calls to
+    :meth:`update`.
+
+    Parameters
+    ----------
+    ewm : EWM
+        The parameters and the data preceding the first update.
+    """
+
+    def __init__(self, ewm):
+        if ewm.axis != 0:
+            raise NotImplementedError("online is only implemented for axis=0")
+
+        self.com = ewm.com
+        self.adjust = ewm.adjust
+        self.ignore_na = ewm.ignore_na
+        self.min_periods = ewm.min_periods
+        self._ewm = ewm
+
+        obj = ewm._selected_obj
+        if isinstance(obj, ABCDataFrame):
+            self._columns = obj.columns
+            # non-numeric columns are excluded as in EWM.mean, by dtype so
+            # that the choice doesn't depend on the initial values
+            self._positions = [
+                i
+                for i, dtype in enumerate(obj.dtypes)
+                if is_numeric_dtype(dtype) and not needs_i8_conversion(dtype)
+            ]
+        else:
+            self._columns = None
+            self._positions = [None]
+
+        # weighted average, old weight and number of observations
+        self._state = np.empty((len(self._positions), 3), dtype=np.float64)
+        self._state[:] = [np.nan, 1.0, 0.0]
+
+        self.update(obj)
+
+    def update(self, new_rows):
+        """
+        Add rows to the data and return their exponential weighted moving
+        average.
+
+        Parameters
+        ----------
+        new_rows : Series or DataFrame
+            The rows following those of the previous update, with the same
+            columns as the data the online object was created from.
+
+        Returns
+        -------
+        Series or DataFrame
+            The exponential weighted moving average of the new rows, indexed
+            like them.
+        """
+        if self._columns is None:
+            if isinstance(new_rows, ABCDataFrame):
+                raise TypeError("new rows must be a Series")
+            values = [new_rows.values]
+        else:
+            if not isinstance(new_rows, ABCDataFrame):
+                raise TypeError("new rows must be a DataFrame")
+            if not new_rows.columns.equals(self._columns):
+                raise ValueError("new rows must have the same columns as the data")
+            values = [new_rows.iloc[:, i].values for i in self._positions]
+
+        results = []
+        for state, vals in zip(self._state, values):
+            try:
+                vals = self._ewm._prep_values(vals)
+            except (TypeError, NotImplementedError):
+                raise DataError("No numeric types to aggregate")
+            results.append(
+                libwindow.ewma(
+                    vals,
+                    self.com,
+                    int(self.adjust),
+                    int(self.ignore_na),
+                    int(self.min_periods),
+                    state,
+                )
+            )
+
+        if self._columns is None:
+            return new_rows._constructor(
+                results[0], index=new_rows.index, name=new_rows.name
+            )
+        columns = self._columns.take(self._positions)
+        result = new_rows._constructor(
+            dict(enumerate(results)), index=new_rows.index, columns=range(len(columns))
+        )
+        result.columns = columns
+        return result
@@ -134,6 +134,7 @@ class Expanding(_Rolling_and_Expanding):
         versionadded="",
         klass="Series/Dataframe",
         axis="",
+        engine="",
     )
     @Appender(_shared_docs["aggregate"])
     def aggregate(self, func, *args, **kwargs):
@@ -148,8 +149,17 @@ class Expanding(_Rolling_and_Expanding):
 
     @Substitution(name="expanding")
     @Appender(_shared_docs["apply"])
-    def apply(self, func, raw=None, args=(), kwargs={}):
-        return super().apply(func, raw=raw, args=args, kwargs=kwargs)
+    def apply(
+        self, func, raw=None, args=(), kwargs={}, engine="cython", engine_kwargs=None
+    ):
+        return super().apply(
+            func,
+            raw=raw,
+            args=args,
+            kwargs=kwargs,
+            engine=engine,
+            engine_kwargs=engine_kwargs,
+        )
 
     @Substitution(name="expanding")
     @Appender(_shared_docs["sum"])
@@ -0,0 +1,88 @@
+"""Indexer objects for computing start/end window bounds for rolling operations"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from pandas.util._decorators import Appender
+
+get_window_bounds_doc = """
+Computes the bounds of a window.
+
+Parameters
+----------
+num_values : int, default 0
+    number of values that will be aggregated over
+min_periods : int, default None
+    min_periods passed from the top level rolling API
+center : bool, default None
+    center passed from the top level rolling API
+closed : str, default None
+    closed passed from the top level rolling API
+
+Returns
+-------
+A tuple of ndarray[int64]s, indicating the start (inclusive) and the end
+(exclusive) of the window of each value
+"""
+
+
+class BaseIndexer:
+    """
+    Base class for custom window bounds calculations.
+
+    Subclasses implement ``get_window_bounds``, which returns the start and
+    the end of the window of every value. An instance can be passed as the
+    ``window`` of :meth:`DataFrame.rolling` or :meth:`Series.rolling`, and
+    the built-in aggregations are then computed over these windows.
+
+    .. versionadded:: 1.0.0
+
+    Parameters
+    ----------
+    index_array : ndarray, optional
+        Array that the windows can be computed from, e.g. an index.
+    window_size : int, default 0
+        Nominal size of the windows. ``min_periods`` defaults to it.
+    **kwargs
+        Set as attributes of the indexer, to be used in
+        ``get_window_bounds``.
+
+    Examples
+    --------
+    A window of the current and the next ``window_size - 1`` values:
+
+    >>> from pandas.api.indexers import BaseIndexer
+    >>> class ForwardIndexer(BaseIndexer):
+    ...     def get_window_bounds(self, num_values, min_periods, center, closed):
+    ...         start = np.arange(num_values, dtype=np.int64)
+    ...         end = np.minimum(start + self.window_size, num_values)
+    ...         return start, end
+    >>> s = pd.Series([1, 2, 3, 4, 5])
+    >>> s.rolling(ForwardIndexer(window_size=2), min_periods=1).sum()
+    0    3.0
+    1    5.0
+    2    7.0
+    3    9.0
+    4    5.0
+    dtype: float64
+    """
+
+    def __init__(
+        self, index_array: Optional[np.ndarray] = None, window_size: int = 0, **kwargs
+    ):
+        self.index_array = index_array
+        self.window_size = window_size
+        # Set user defined kwargs as attributes that can be used in get_window_bounds
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    @Appender(get_window_bounds_doc)
+    def get_window_bounds(
+        self,
+        num_values: int = 0,
+        min_periods: Optional[int] = None,
+        center: Optional[bool] = None,
+        closed: Optional[str] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+
+        raise NotImplementedError
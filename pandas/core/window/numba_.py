@@ -0,0 +1,49 @@
+""" numba engine for the window apply functions """
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from pandas.compat._optional import import_optional_dependency
+
+from pandas.core.util.numba_ import get_kernel, jit_user_function
+
+
+def make_rolling_apply(
+    func: Callable, args: Tuple, nogil: bool, parallel: bool, nopython: bool
+) -> Callable:
+    """
+    Compile ``func`` and a loop applying it over each window.
+
+    The returned kernel has signature
+    ``kernel(values, start, end, counts, minp)`` and computes
+    ``func(values[start[i]:end[i]], *args)`` for every window ``i`` holding
+    at least ``minp`` non-NaN observations, NaN otherwise.
+    """
+    numba = import_optional_dependency("numba")
+    numba_func = jit_user_function(func, nopython, nogil)
+
+    if parallel:
+        loop_range = numba.prange
+    else:
+        loop_range = range
+
+    @numba.jit(nopython=nopython, nogil=nogil, parallel=parallel)
+    def roll_apply(values, start, end, counts, minp):
+        result = np.empty(len(start))
+        for i in loop_range(len(start)):
+            if counts[i] >= minp:
+                result[i] = numba_func(values[start[i] : end[i]], *args)
+            else:
+                result[i] = np.nan
+        return result
+
+    return roll_apply
+
+
+def get_rolling_apply(
+    func: Callable, args: Tuple, engine_kwargs: Optional[Dict[str, bool]]
+) -> Callable:
+    """
+    Return the compiled window kernel for ``func``, compiling it on first use.
+    """
+    return get_kernel(make_rolling_apply, func, args, engine_kwargs)
@@ -16,7 +16,9 @@ from pandas.util._decorators import Appender, Substitution, cache_readonly
 
 from pandas.core.dtypes.common import (
     ensure_float64,
+    ensure_int64,
     is_bool,
+    is_categorical_dtype,
     is_float_dtype,
     is_integer,
     is_integer_dtype,
@@ -37,7 +39,9 @@ from pandas.core.dtypes.generic import (
 from pandas._typing import Axis, FrameOrSeries, Scalar
 from pandas.core.base import DataError, PandasObject, SelectionMixin
 import pandas.core.common as com
-from pandas.core.index import Index, ensure_index
+from pandas.core.index import Index, MultiIndex, ensure_index
+from pandas.core.sorting import get_group_index_sorter
+import pandas.core.window.numba_ as numba_
 from pandas.core.window.common import (
     _doc_template,
     _flex_binary_moment,
@@ -48,6 +52,7 @@ from pandas.core.window.common import (
     _use_window,
     _zsqrt,
 )
+from pandas.core.window.indexers import BaseIndexer
 
 
 class _Window(PandasObject, SelectionMixin):
@@ -182,6 +187,8 @@ class _Window(PandasObject, SelectionMixin):
         -------
         window : int
         """
+        if isinstance(self.window, BaseIndexer):
+            return self.window.window_size
         return self.window
 
     @property
@@ -208,13 +215,22 @@ class _Window(PandasObject, SelectionMixin):
 
     def _get_index(self) -> Optional[np.ndarray]:
         """
-        Return integer representations as an ndarray if index is frequency.
+        Return integer representations as an ndarray if index is frequency,
+        or the bounds of the windows of a custom indexer.
 
         Returns
         -------
-        None or ndarray
+        None, ndarray or BoundsWindowIndexer
         """
 
+        if isinstance(self.window, BaseIndexer):
+            start, end = self.window.get_window_bounds(
+                num_values=self._selected_obj.shape[self.axis],
+                min_periods=self.min_periods,
+                center=self.center,
+                closed=self.closed,
+            )
+            return libwindow.BoundsWindowIndexer(start, end, self.window.window_size)
         if self.is_freq_type:
             return self._on.asi8
         return None
@@ -408,6 +424,10 @@ class _Window(PandasObject, SelectionMixin):
         if center is None:
             center = self.center
 
+        # a custom indexer centers the windows itself
+        if isinstance(self.window, BaseIndexer):
+            center = False
+
         if check_minp is None:
             check_minp = _use_window
 
@@ -619,17 +639,25 @@ class Window(_Window):
 
     Parameters
     ----------
-    window : int, or offset
+    window : int, offset, or BaseIndexer subclass
         Size of the moving window. This is the number of observations used for
         calculating the statistic. Each window will be a fixed size.
 
         If its an offset then this will be the time period of each window. Each
         window will be a variable sized based on the observations included in
         the time-period. This is only valid for datetimelike indexes.
+
+        If a BaseIndexer subclass is passed, calculates the window boundaries
+        based on the defined ``get_window_bounds`` method. Additional rolling
+        keyword arguments, namely `min_periods`, `center`, and
+        `closed` will be passed to `get_window_bounds`.
+
+        .. versionadded:: 1.0.0
     min_periods : int, default None
         Minimum number of observations in window required to have a value
         (otherwise result is NA). For a window that is specified by an offset,
-        `min_periods` will default to 1. Otherwise, `min_periods` will default
+        `min_periods` will default to 1. For a BaseIndexer subclass, it will
+        default to its ``window_size``. Otherwise, `min_periods` will default
         to the size of the window.
     center : bool, default False
         Set the labels at the center of the window.
@@ -899,6 +927,7 @@ class Window(_Window):
         versionadded="",
         klass="Series/DataFrame",
         axis="",
+        engine="",
     )
     @Appender(_shared_docs["aggregate"])
     def aggregate(self, func, *args, **kwargs):
@@ -979,8 +1008,11 @@ class _Rolling_and_Expanding(_Rolling):
         # Validate the index
         self._get_index()
 
-        window = self._get_window()
-        window = min(window, len(obj)) if not self.center else window
+        if isinstance(self.window, BaseIndexer):
+            window = self.window
+        else:
+            window = self._get_window()
+            window = min(window, len(obj)) if not self.center else window
 
         results = []
         for b in blocks:
@@ -1018,8 +1050,25 @@ class _Rolling_and_Expanding(_Rolling):
         not passed. In the future `raw` will default to False.
 
         .. versionadded:: 0.23.0
-    *args, **kwargs
-        Arguments and keyword arguments to be passed into func.
+    args : tuple, default ()
+        Positional arguments to be passed into func.
+    kwargs : dict, default {}
+        Keyword arguments to be passed into func. Not supported with
+        ``engine='numba'``.
+    engine : {'cython', 'numba'}, default 'cython'
+        * ``'cython'`` : calls ``func`` from a Cython loop over the windows.
+        * ``'numba'`` : compiles ``func`` and the loop over the windows with
+          numba. Requires ``raw=True`` and a ``func`` that numba can compile
+          in ``nopython`` mode. The compiled function is cached, so only the
+          first call with a given ``func`` pays for the compilation.
+
+        .. versionadded:: 1.0.0
+    engine_kwargs : dict, default None
+        Options for the numba engine: ``nopython``, ``nogil`` and
+        ``parallel``, defaulting to ``True``, ``False`` and ``False``.
+        ``parallel=True`` computes the windows on multiple threads.
+
+        .. versionadded:: 1.0.0
 
     Returns
     -------
@@ -1033,12 +1082,21 @@ class _Rolling_and_Expanding(_Rolling):
     """
     )
 
-    def apply(self, func, raw=None, args=(), kwargs={}):
+    def apply(
+        self, func, raw=None, args=(), kwargs={}, engine="cython", engine_kwargs=None
+    ):
         from pandas import Series
 
         kwargs.pop("_level", None)
+        if engine not in ("cython", "numba"):
+            raise ValueError("engine must be either 'numba' or 'cython'")
+        if engine == "cython" and engine_kwargs is not None:
+            raise ValueError("cython engine does not accept engine_kwargs")
         window = self._get_window()
-        offset = _offset(window, self.center)
+        if isinstance(self.window, BaseIndexer):
+            offset = 0
+        else:
+            offset = _offset(window, self.center)
         index_as_array = self._get_index()
 
         # TODO: default is for backward compat
@@ -1055,6 +1113,21 @@ class _Rolling_and_Expanding(_Rolling):
             )
             raw = True
 
+        if engine == "numba":
+            if not raw:
+                raise ValueError("raw must be `True` when using the numba engine")
+            if kwargs:
+                raise ValueError("numba engine does not support kwargs")
+            kernel = numba_.get_rolling_apply(func, tuple(args), engine_kwargs)
+
+            def f(arg, window, min_periods, closed):
+                minp = _use_window(min_periods, window)
+                return self._apply_numba(
+                    kernel, arg, window, minp, index_as_array, closed, offset
+                )
+
+            return self._apply(f, func, args=args, center=False, raw=raw)
+
         def f(arg, window, min_periods, closed):
             minp = _use_window(min_periods, window)
             if not raw:
@@ -1074,6 +1147,39 @@ class _Rolling_and_Expanding(_Rolling):
 
         return self._apply(f, func, args=args, kwargs=kwargs, center=False, raw=raw)
 
+    @staticmethod
+    def _apply_numba(kernel, values, window, minp, index, closed, offset):
+        """
+        Run a compiled window kernel over the same windows as
+        ``libwindow.roll_generic``.
+        """
+        if not len(values):
+            return values
+
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        counts = libwindow.roll_sum(
+            np.concatenate([np.isfinite(values).astype(float), np.zeros(offset)]),
+            window,
+            minp,
+            index,
+            closed,
+        )[offset:]
+
+        start, end, N, window, minp, is_variable = libwindow.get_window_indexer(
+            values, window, minp, index, closed, floor=0
+        )
+        if is_variable:
+            if offset != 0:
+                raise ValueError("unable to roll_generic with a non-zero offset")
+        else:
+            # windows ending ``offset`` past the current position, truncated
+            # at both ends of the values
+            positions = np.arange(N, dtype=np.int64) + offset
+            start = np.maximum(positions - window + 1, 0)
+            end = np.minimum(positions + 1, N)
+
+        return kernel(values, start, end, counts, minp)
+
     def sum(self, *args, **kwargs):
         nv.validate_window_func("sum", args, kwargs)
         return self._apply("roll_sum", "sum", **kwargs)
@@ -1691,12 +1797,19 @@ class Rolling(_Rolling_and_Expanding):
             if self.min_periods is None:
                 self.min_periods = 1
 
+        elif isinstance(self.window, BaseIndexer):
+            # the custom indexer computes the windows
+            pass
         elif not is_integer(self.window):
             raise ValueError("window must be an integer")
         elif self.window < 0:
             raise ValueError("window must be non-negative")
 
-        if not self.is_datetimelike and self.closed is not None:
+        if (
+            not self.is_datetimelike
+            and not isinstance(self.window, BaseIndexer)
+            and self.closed is not None
+        ):
             raise ValueError(
                 "closed only implemented for datetimelike and offset based windows"
             )
@@ -1786,6 +1899,7 @@ class Rolling(_Rolling_and_Expanding):
         versionadded="",
         klass="Series/Dataframe",
         axis="",
+        engine="",
     )
     @Appender(_shared_docs["aggregate"])
     def aggregate(self, func, *args, **kwargs):
@@ -1793,6 +1907,44 @@ class Rolling(_Rolling_and_Expanding):
 
     agg = aggregate
 
+    def stateful(self, func, *args, **kwargs):
+        """
+        Rolling aggregation of rows appended to the data.
+
+        Only the trailing rows that fall in the window of a future row are
+        kept between updates, so that each batch of new rows costs time
+        proportional to its own length and the window size, not to the length
+        of the history.
+
+        .. versionadded:: 1.0.0
+
+        Parameters
+        ----------
+        func : function, str, list or dict
+            Aggregation computed for the new rows, accepting the same values
+            as :meth:`aggregate`.
+        *args, **kwargs
+            Arguments and keyword arguments to be passed into func.
+
+        Returns
+        -------
+        StatefulRolling
+
+        See Also
+        --------
+        Rolling.aggregate : Rolling aggregation of the data.
+
+        Examples
+        --------
+        >>> s = pd.Series([0, 1, 2])
+        >>> stateful = s.rolling(2).stateful('sum')
+        >>> stateful.update(pd.Series([3, 4], index=[3, 4]))
+        3    5.0
+        4    7.0
+        dtype: float64
+        """
+        return StatefulRolling(self, func, *args, **kwargs)
+
     @Substitution(name="rolling")
     @Appender(_shared_docs["count"])
     def count(self):
@@ -1805,8 +1957,17 @@ class Rolling(_Rolling_and_Expanding):
 
     @Substitution(name="rolling")
     @Appender(_shared_docs["apply"])
-    def apply(self, func, raw=None, args=(), kwargs={}):
-        return super().apply(func, raw=raw, args=args, kwargs=kwargs)
+    def apply(
+        self, func, raw=None, args=(), kwargs={}, engine="cython", engine_kwargs=None
+    ):
+        return super().apply(
+            func,
+            raw=raw,
+            args=args,
+            kwargs=kwargs,
+            engine=engine,
+            engine_kwargs=engine_kwargs,
+        )
 
     @Substitution(name="rolling")
     @Appender(_shared_docs["sum"])
@@ -1915,10 +2076,136 @@ class RollingGroupby(_GroupByMixin, Rolling):
     Provide a rolling groupby implementation.
     """
 
+    # functions that are computed for all of the groups at once,
+    # over the rows sorted by group
+    _grouped_funcs = frozenset(
+        [
+            "sum",
+            "mean",
+            "max",
+            "min",
+            "median",
+            "std",
+            "var",
+            "skew",
+            "kurt",
+            "quantile",
+        ]
+    )
+
+    # the window bounds of the rows sorted by group
+    _window_indexer = None
+
     @property
     def _constructor(self):
         return Rolling
 
+    def _apply(
+        self, func, name=None, window=None, center=None, check_minp=None, **kwargs
+    ):
+        if self._window_indexer is not None:
+            # we are already sorted by group
+            return Rolling._apply(
+                self,
+                func,
+                name=name,
+                window=window,
+                center=center,
+                check_minp=check_minp,
+                **kwargs
+            )
+
+        if self._use_grouped_windows(name, center):
+            return self._apply_grouped(name, **kwargs)
+
+        return super()._apply(
+            func,
+            name=name,
+            window=window,
+            center=center,
+            check_minp=check_minp,
+            **kwargs
+        )
+
+    def _use_grouped_windows(self, name, center) -> bool:
+        """
+        Whether we can compute the windows of all of the groups at once,
+        rather than applying a new Rolling to every group.
+        """
+        if center is None:
+            center = self.center
+        groupby = self._groupby
+        return (
+            isinstance(name, str)
+            and name in self._grouped_funcs
+            and not center
+            and not isinstance(self.window, BaseIndexer)
+            and self.on is None
+            and self.axis == 0
+            and groupby.axis == 0
+            and groupby.as_index
+            and groupby.group_keys
+            and len(self.obj) > 0
+            and not any(
+                is_categorical_dtype(ping.grouper) for ping in groupby.grouper.groupings
+            )
+            and (
+                not self.is_freq_type
+                or isinstance(
+                    groupby._selected_obj.index,
+                    (ABCDatetimeIndex, ABCTimedeltaIndex, ABCPeriodIndex),
+                )
+            )
+        )
+
+    def _apply_grouped(self, name, **kwargs):
+        """
+        Sort the rows by group, compute the window bounds of every group in
+        a single pass and call the rolling function once for all of the
+        groups. The result is the same as the one of ``groupby.apply``.
+        """
+        groupby = self._groupby
+        grouper = groupby.grouper
+        obj = groupby._selected_obj
+
+        ids, _, ngroups = grouper.group_info
+        counts = np.bincount(ids[ids != -1], minlength=ngroups)
+        group_ends = ensure_int64(counts.cumsum())
+
+        # rows with a missing key are sorted first and are not in any group
+        sorter = get_group_index_sorter(ids, ngroups)
+        sorter = sorter[len(ids) - counts.sum() :]
+
+        # the index of the groups, which may have been set from ``on``
+        index = None
+        if self.is_freq_type:
+            index = obj.index.asi8.take(sorter)
+        indexer = libwindow.get_grouped_window_indexer(
+            group_ends, self._get_window(), index, self.closed
+        )
+
+        grouped = self._shallow_copy(
+            obj.take(sorter),
+            obj_type=type(self),
+            groupby=groupby,
+            _window_indexer=indexer,
+        )
+        result = getattr(grouped, name)(**kwargs)
+
+        keys = grouper.result_index.take(ids.take(sorter))
+        index = result.index
+        result.index = MultiIndex.from_arrays(
+            [keys.get_level_values(i) for i in range(keys.nlevels)]
+            + [index.get_level_values(i) for i in range(index.nlevels)],
+            names=list(keys.names) + list(index.names),
+        )
+        return result
+
+    def _get_index(self):
+        if self._window_indexer is not None:
+            return self._window_indexer
+        return super()._get_index()
+
     def _gotitem(self, key, ndim, subset=None):
 
         # we are setting the index on the actual object
@@ -1937,3 +2224,94 @@ class RollingGroupby(_GroupByMixin, Rolling):
         level.
         """
         pass
+
+
+class StatefulRolling:
+    """
+    Rolling aggregation that is updated with new rows.
+
+    Created by :meth:`Rolling.stateful`. The rows of the data that are in
+    the window of the next row are kept between calls to :meth:`update`.
+
+    Parameters
+    ----------
+    rolling : Rolling
+        The parameters and the data preceding the first update.
+    func : function, str, list or dict
+        Aggregation computed for the new rows.
+    *args, **kwargs
+        Arguments and keyword arguments to be passed into func.
+    """
+
+    def __init__(self, rolling, func, *args, **kwargs):
+        if isinstance(rolling, _GroupByMixin):
+            raise NotImplementedError("stateful is not implemented for groupby")
+        if rolling.axis != 0:
+            raise NotImplementedError("stateful is only implemented for axis=0")
+        if rolling.center:
+            raise NotImplementedError("stateful is not implemented for center=True")
+        if isinstance(rolling.window, BaseIndexer):
+            raise NotImplementedError(
+                "stateful is not implemented for custom window indexers"
+            )
+
+        self._rolling = rolling
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self._trailing = self._get_trailing(rolling)
+
+    def _get_trailing(self, rolling):
+        """
+        Return a copy of the last rows of the data of rolling, which can be
+        in the window of a row appended to it.
+        """
+        obj = rolling.obj
+        if not len(obj):
+            return obj
+
+        if rolling.is_freq_type:
+            # rows older than the window of the last row can't be in the
+            # window of a new one
+            on = rolling._on.asi8
+            start = on.searchsorted(on[-1] - rolling.window, side="left")
+        else:
+            start = max(len(obj) - max(rolling.window - 1, 0), 0)
+        return obj.iloc[start:].copy()
+
+    def update(self, new_rows):
+        """
+        Add rows to the data and return their rolling aggregation.
+
+        Parameters
+        ----------
+        new_rows : Series or DataFrame
+            The rows following those of the previous update, with the same
+            columns as the data the stateful object was created from.
+
+        Returns
+        -------
+        Series or DataFrame
+            The rolling aggregation of the new rows, indexed like them.
+        """
+        from pandas import concat
+
+        trailing = self._trailing
+        if trailing.ndim != new_rows.ndim:
+            raise TypeError(
+                "new rows must be a {klass}".format(klass=type(trailing).__name__)
+            )
+        if trailing.ndim == 2 and not new_rows.columns.equals(trailing.columns):
+            raise ValueError("new rows must have the same columns as the data")
+
+        rolling = self._rolling._shallow_copy(concat([trailing, new_rows]))
+        if rolling.is_freq_type:
+            rolling._validate_monotonic()
+
+        selected = rolling
+        if self._rolling._selection is not None:
+            selected = rolling[self._rolling._selection]
+        result = selected.aggregate(self.func, *self.args, **self.kwargs)
+
+        self._trailing = self._get_trailing(rolling)
+        return result.iloc[len(trailing) :]
@@ -4,6 +4,7 @@ Data IO api
 
 # flake8: noqa
 
+from pandas.io.blocks import read_blocks
 from pandas.io.clipboards import read_clipboard
 from pandas.io.excel import ExcelFile, ExcelWriter, read_excel
 from pandas.io.feather_format import read_feather
@@ -0,0 +1,196 @@
+""" native block format """
+
+import mmap as mmap_module
+import pickle
+import struct
+
+import numpy as np
+
+from pandas.core.dtypes.common import is_extension_array_dtype
+
+from pandas import DataFrame
+from pandas.core.internals import BlockManager, make_block
+
+from pandas.io.common import _stringify_path
+
+_MAGIC = b"PDBLOCKS"
+_VERSION = 1
+
+# buffers are aligned so that they can be viewed as ndarrays in place
+_ALIGNMENT = 64
+
+# uint32 version, uint64 header length
+_PREAMBLE = struct.Struct("<IQ")
+
+
+def _align(offset):
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _is_raw(values):
+    # only numeric / datetimelike ndarrays are written as raw buffers,
+    # everything else is pickled
+    return (
+        isinstance(values, np.ndarray)
+        and not is_extension_array_dtype(values.dtype)
+        and values.dtype.kind in "biufcmM"
+    )
+
+
+def to_blocks(df, path):
+    """
+    Write a DataFrame to the native block format.
+
+    Every block of the frame is written as an aligned buffer, preceded by a
+    header holding the axes and the dtype, shape and placement of each
+    block.
+
+    Parameters
+    ----------
+    df : DataFrame
+    path : str
+        File path.
+    """
+    if not isinstance(df, DataFrame):
+        raise ValueError("to_blocks only supports IO with DataFrames")
+
+    path = _stringify_path(path)
+    if not isinstance(path, str):
+        raise ValueError("to_blocks requires a file path")
+
+    data = df._data
+    if not data.is_consolidated():
+        data = data.consolidate()
+
+    buffers = []
+    metadata = []
+    offset = 0
+    for b in data.blocks:
+        values = b.values
+        if _is_raw(values):
+            values = np.ascontiguousarray(values)
+            kind = "raw"
+            nbytes = values.nbytes
+        else:
+            values = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+            kind = "pickle"
+            nbytes = len(values)
+
+        placement = b.mgr_locs
+        metadata.append(
+            {
+                "kind": kind,
+                "locs": placement.as_slice
+                if placement.is_slice_like
+                else placement.as_array,
+                "dtype": values.dtype.str if kind == "raw" else None,
+                "shape": values.shape if kind == "raw" else None,
+                "offset": offset,
+                "nbytes": nbytes,
+            }
+        )
+        buffers.append(values)
+        offset = _align(offset + nbytes)
+
+    header = pickle.dumps(
+        {"axes": data.axes, "blocks": metadata}, protocol=pickle.HIGHEST_PROTOCOL
+    )
+    start = _align(len(_MAGIC) + _PREAMBLE.size + len(header))
+
+    with open(path, "wb") as f:
+        f.write(_MAGIC)
+        f.write(_PREAMBLE.pack(_VERSION, len(header)))
+        f.write(header)
+        for meta, values in zip(metadata, buffers):
+            f.write(b"\x00" * (start + meta["offset"] - f.tell()))
+            if meta["kind"] == "raw":
+                f.write(memoryview(values.reshape(-1).view(np.uint8)))
+            else:
+                f.write(values)
+
+
+def read_blocks(path, mmap=True):
+    """
+    Load a DataFrame written with :meth:`DataFrame.to_blocks`.
+
+    .. versionadded:: 1.0.0
+
+    Parameters
+    ----------
+    path : str or path object
+        File path.
+    mmap : bool, default True
+        Memory-map the file and return numeric and datetimelike columns as
+        read-only views on the mapped file instead of reading them into
+        memory. Other processes mapping the same file share its pages.
+
+    Returns
+    -------
+    DataFrame
+
+    See Also
+    --------
+    DataFrame.to_blocks : Write a DataFrame to the native block format.
+    read_pickle : Load pickled pandas object (or any object) from file.
+
+    Notes
+    -----
+    Columns of other dtypes (object, categorical, extension types) are
+    stored pickled and are always loaded into memory.
+
+    As with :func:`read_pickle`, loading a file from an untrusted source can
+    be unsafe.
+
+    Examples
+    --------
+    >>> df = pd.DataFrame({"foo": range(5), "bar": np.arange(5.0)})
+    >>> df.to_blocks("./dummy.blocks")  # doctest: +SKIP
+    >>> pd.read_blocks("./dummy.blocks")  # doctest: +SKIP
+       foo  bar
+    0    0  0.0
+    1    1  1.0
+    2    2  2.0
+    3    3  3.0
+    4    4  4.0
+    """
+    path = _stringify_path(path)
+
+    with open(path, "rb") as f:
+        magic = f.read(len(_MAGIC))
+        preamble = f.read(_PREAMBLE.size)
+        if magic != _MAGIC or len(preamble) != _PREAMBLE.size:
+            raise ValueError("{path} is not a block format file".format(path=path))
+
+        version, header_size = _PREAMBLE.unpack(preamble)
+        if version > _VERSION:
+            raise ValueError(
+                "block format version {version} is not supported by this "
+                "version of pandas".format(version=version)
+            )
+        header = pickle.loads(f.read(header_size))
+        start = _align(len(_MAGIC) + _PREAMBLE.size + header_size)
+
+        buf = None
+        if mmap:
+            buf = mmap_module.mmap(f.fileno(), 0, access=mmap_module.ACCESS_READ)
+
+        blocks = []
+        for meta in header["blocks"]:
+            offset = start + meta["offset"]
+            if meta["kind"] == "raw":
+                dtype = np.dtype(meta["dtype"])
+                if buf is not None:
+                    count = meta["nbytes"] // dtype.itemsize
+                    values = np.frombuffer(buf, dtype=dtype, count=count, offset=offset)
+                    values = values.reshape(meta["shape"])
+                else:
+                    values = np.empty(meta["shape"], dtype=dtype)
+                    f.seek(offset)
+                    f.readinto(memoryview(values.reshape(-1).view(np.uint8)))
+            else:
+                f.seek(offset)
+                values = pickle.loads(f.read(meta["nbytes"]))
+
+            blocks.append(make_block(values, placement=meta["locs"], ndim=2))
+
+    return DataFrame(BlockManager(blocks, header["axes"]))
@@ -2,6 +2,8 @@
 Module for formatting output data into CSV files.
 """
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import csv as csvlib
 from io import StringIO
 import os
@@ -12,6 +14,7 @@ import numpy as np
 
 from pandas._libs import writers as libwriters
 
+from pandas.core.dtypes.common import is_integer
 from pandas.core.dtypes.generic import (
     ABCDatetimeIndex,
     ABCIndexClass,
@@ -52,10 +55,15 @@ class CSVFormatter:
         doublequote=True,
         escapechar=None,
         decimal=".",
+        num_threads=None,
     ):
 
         self.obj = obj
 
+        if num_threads is not None and (not is_integer(num_threads) or num_threads < 1):
+            raise ValueError("'num_threads' must be an integer >=1")
+        self.num_threads = num_threads
+
         if path_or_buf is None:
             path_or_buf = StringIO()
 
@@ -195,6 +203,8 @@ class CSVFormatter:
                 escapechar=self.escapechar,
                 quotechar=self.quotechar,
             )
+            self.writer_kwargs = writer_kwargs.copy()
+            self.handle = f
             if self.encoding == "ascii":
                 self.writer = csvlib.writer(f, **writer_kwargs)
             else:
@@ -319,16 +329,63 @@ class CSVFormatter:
         chunksize = self.chunksize
         chunks = int(nrows / chunksize) + 1
 
+        bounds = []
         for i in range(chunks):
             start_i = i * chunksize
             end_i = min((i + 1) * chunksize, nrows)
             if start_i >= end_i:
                 break
+            bounds.append((start_i, end_i))
+
+        if self.num_threads is not None and self.num_threads > 1 and len(bounds) > 1:
+            self._save_threaded(bounds)
+            return
 
+        for start_i, end_i in bounds:
             self._save_chunk(start_i, end_i)
 
+    def _save_threaded(self, bounds):
+        """
+        Format and render chunks to text on a thread pool, writing them to
+        the output handle in order from this thread.
+
+        Writing (and compressing) a chunk overlaps with formatting the
+        following ones; at most ``2 * num_threads`` rendered chunks are held
+        in memory at a time.
+        """
+        # csv writers write through to their file, so the rendered chunks
+        # can go to the same handle as the header
+        write = self.handle.write
+
+        with ThreadPoolExecutor(self.num_threads) as pool:
+            pending = deque()
+            for start_i, end_i in bounds:
+                if len(pending) >= 2 * self.num_threads:
+                    write(pending.popleft().result())
+                pending.append(pool.submit(self._render_chunk, start_i, end_i))
+            while pending:
+                write(pending.popleft().result())
+
+    def _render_chunk(self, start_i, end_i):
+        """
+        Return the csv text of the rows ``start_i:end_i``.
+        """
+        buf = StringIO()
+        writer = csvlib.writer(buf, **self.writer_kwargs)
+        data = [None] * len(self.data)
+        ix = self._format_chunk(start_i, end_i, data)
+        libwriters.write_csv_rows(data, ix, self.nlevels, self.cols, writer)
+        return buf.getvalue()
+
     def _save_chunk(self, start_i, end_i):
+        ix = self._format_chunk(start_i, end_i, self.data)
+        libwriters.write_csv_rows(self.data, ix, self.nlevels, self.cols, self.writer)
 
+    def _format_chunk(self, start_i, end_i, data):
+        """
+        Fill ``data`` with the native types of the columns for the rows
+        ``start_i:end_i`` and return those of the index.
+        """
         data_index = self.data_index
 
         # create the data for a chunk
@@ -345,10 +402,10 @@ class CSVFormatter:
             )
 
             for col_loc, col in zip(b.mgr_locs, d):
-                # self.data is a preallocated list
-                self.data[col_loc] = col
+                # data is a preallocated list
+                data[col_loc] = col
 
-        ix = data_index.to_native_types(
+        return data_index.to_native_types(
             slicer=slicer,
             na_rep=self.na_rep,
             float_format=self.float_format,
@@ -356,5 +413,3 @@ class CSVFormatter:
             date_format=self.date_format,
             quoting=self.quoting,
         )
-
-        libwriters.write_csv_rows(self.data, ix, self.nlevels, self.cols, self.writer)
@@ -1,15 +1,300 @@
 """ parquet compat """
 
+import ast
+from functools import partial
+import operator
 from warnings import catch_warnings
 
+import numpy as np
+
 from pandas.compat._optional import import_optional_dependency
 from pandas.errors import AbstractMethodError
 
-from pandas import DataFrame, get_option
+from pandas.core.dtypes.common import is_integer, is_list_like
+
+from pandas import DataFrame, RangeIndex, concat, get_option
+from pandas.core.computation.common import _remove_spaces_column_name
+from pandas.core.computation.expr import (
+    _clean_spaces_backtick_quoted_names,
+    _compose,
+    _preparse,
+    _replace_booleans,
+    _replace_locals,
+)
+from pandas.core.computation.ops import _LOCAL_TAG
+from pandas.core.computation.scope import Scope
 
 from pandas.io.common import get_filepath_or_buffer, is_s3_url
 
 
+_CMP_OPS = {
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+    ast.In: "in",
+    ast.NotIn: "not in",
+}
+
+# the comparison with the operands swapped, and the negated comparison
+_SWAPPED_OPS = {"==": "==", "!=": "!=", "<": ">", "<=": ">=", ">": "<", ">=": "<="}
+_NEGATED_OPS = {
+    "==": "!=",
+    "!=": "==",
+    "<": ">=",
+    "<=": ">",
+    ">": "<=",
+    ">=": "<",
+    "in": "not in",
+    "not in": "in",
+}
+
+_MASK_OPS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda values, other: values.isin(other),
+    "not in": lambda values, other: ~values.isin(other),
+}
+
+
+class ParquetFilter:
+    """
+    A boolean expression on the columns of a parquet file, such as
+    ``"a > 5 & b in ['x', 'y']"``, that is used both to skip row groups whose
+    column statistics rule out a match and to filter the rows that are read.
+
+    The expression uses the syntax of :meth:`DataFrame.query`, restricted to
+    comparisons of a column with a constant combined with ``&``, ``|`` and
+    ``~``. Constants can be literals or local variables prefixed with ``@``.
+
+    Parameters
+    ----------
+    expr : str
+    level : int, default 0
+        Number of frames above the caller to look up local variables in.
+    """
+
+    def __init__(self, expr, level=0):
+        self.expr = expr
+        self._scope = Scope(level=level + 1)
+        preparse = partial(
+            _preparse,
+            f=_compose(
+                _replace_locals, _replace_booleans, _clean_spaces_backtick_quoted_names
+            ),
+        )
+        try:
+            body = ast.parse(preparse(expr), mode="eval").body
+        except SyntaxError:
+            raise ValueError("invalid parquet filter {expr!r}".format(expr=expr))
+        self._names = set()
+        self._tree = self._visit(body)
+        self._columns = None
+
+    # ------------------------------------------------------------------
+    # parsing into nested tuples of
+    # ("and", nodes), ("or", nodes), ("not", node) or ("cmp", name, op, value)
+
+    def _unsupported(self, node):
+        return ValueError(
+            "unsupported parquet filter {expr!r}: only comparisons of a column "
+            "with a constant, combined with '&', '|' and '~', are "
+            "supported".format(expr=self.expr)
+        )
+
+    def _visit(self, node):
+        if isinstance(node, ast.BoolOp):
+            kind = "and" if isinstance(node.op, ast.And) else "or"
+            return (kind, [self._visit(value) for value in node.values])
+        elif isinstance(node, ast.UnaryOp) and isinstance(
+            node.op, (ast.Not, ast.Invert)
+        ):
+            return ("not", self._visit(node.operand))
+        elif isinstance(node, ast.Compare):
+            nodes = []
+            left = node.left
+            for op, right in zip(node.ops, node.comparators):
+                nodes.append(self._visit_compare(left, op, right))
+                left = right
+            return nodes[0] if len(nodes) == 1 else ("and", nodes)
+        raise self._unsupported(node)
+
+    def _visit_compare(self, left, op, right):
+        op = _CMP_OPS[type(op)]
+        if self._is_column(left):
+            name, value = left.id, self._constant(right)
+        elif self._is_column(right) and op in _SWAPPED_OPS:
+            name, value = right.id, self._constant(left)
+            op = _SWAPPED_OPS[op]
+        else:
+            raise self._unsupported(left)
+
+        if op in ("in", "not in") and not is_list_like(value):
+            value = [value]
+        self._names.add(name)
+        return ("cmp", name, op, value)
+
+    @staticmethod
+    def _is_column(node):
+        return isinstance(node, ast.Name) and not node.id.startswith(_LOCAL_TAG)
+
+    def _constant(self, node):
+        if isinstance(node, ast.Name) and node.id.startswith(_LOCAL_TAG):
+            return self._scope.resolve(node.id[len(_LOCAL_TAG) :], is_local=True)
+        try:
+            return ast.literal_eval(node)
+        except ValueError:
+            raise self._unsupported(node)
+
+    # ------------------------------------------------------------------
+
+    def bind(self, columns):
+        """
+        Match the names in the expression with the columns of the file.
+
+        Parameters
+        ----------
+        columns : list
+            The columns (and index levels) stored in the file.
+        """
+        lookup = {_remove_spaces_column_name(c): c for c in columns}
+        unknown = sorted(self._names - set(lookup))
+        if unknown:
+            raise ValueError(
+                "parquet filter {expr!r} refers to unknown columns "
+                "{unknown}".format(expr=self.expr, unknown=unknown)
+            )
+        self._columns = {name: lookup[name] for name in self._names}
+
+    @property
+    def columns(self):
+        """ The columns used by the expression. """
+        return sorted(self._columns.values())
+
+    def mask(self, df):
+        """
+        Boolean ndarray selecting the rows of ``df`` matching the expression.
+        """
+        return np.asarray(self._mask(self._tree, df), dtype=bool)
+
+    def _mask(self, node, df):
+        kind = node[0]
+        if kind == "cmp":
+            _, name, op, value = node
+            column = self._columns[name]
+            if column in df.columns:
+                values = df[column]
+            else:
+                values = df.index.get_level_values(column).to_series(index=df.index)
+            return np.asarray(_MASK_OPS[op](values, value), dtype=bool)
+        elif kind == "not":
+            return ~self._mask(node[1], df)
+        masks = [self._mask(child, df) for child in node[1]]
+        if kind == "and":
+            return np.logical_and.reduce(masks)
+        return np.logical_or.reduce(masks)
+
+    def may_match(self, statistics):
+        """
+        Whether a row group with the given column statistics can contain
+        rows matching the expression.
+
+        Parameters
+        ----------
+        statistics : dict
+            Maps columns to a tuple of ``(min, max, null_count)`` of the row
+            group. Each element is None when unknown. Columns without
+            statistics can be left out.
+        """
+        return self._may_match(self._tree, statistics, False)
+
+    def _may_match(self, node, statistics, negate):
+        kind = node[0]
+        if kind == "not":
+            return self._may_match(node[1], statistics, not negate)
+        elif kind in ("and", "or"):
+            # De Morgan, when negated
+            results = (self._may_match(n, statistics, negate) for n in node[1])
+            if (kind == "and") != negate:
+                return all(results)
+            return any(results)
+
+        _, name, op, value = node
+        minimum, maximum, null_count = statistics.get(
+            self._columns[name], (None, None, None)
+        )
+        if negate:
+            # a negated comparison is true for missing values
+            if null_count != 0:
+                return True
+            op = _NEGATED_OPS[op]
+        elif op in ("!=", "not in") and null_count != 0:
+            # and so are these comparisons
+            return True
+        if minimum is None or maximum is None:
+            return True
+
+        try:
+            if op == "==":
+                return minimum <= value <= maximum
+            elif op == "!=":
+                return not (minimum == maximum == value)
+            elif op == "<":
+                return minimum < value
+            elif op == "<=":
+                return minimum <= value
+            elif op == ">":
+                return maximum > value
+            elif op == ">=":
+                return maximum >= value
+            elif op == "in":
+                return any(minimum <= v <= maximum for v in value)
+            return not (minimum == maximum and minimum in value)
+        except TypeError:
+            # statistics that are not comparable with the value, e.g. bytes
+            # for a string column
+            return True
+
+    def to_conjunction(self):
+        """
+        The comparisons that are and-ed at the top level of the expression, as
+        a list of ``(column, op, value)`` tuples, the filter format of the
+        parquet engines.
+        """
+        if self._tree[0] == "cmp":
+            nodes = [self._tree]
+        elif self._tree[0] == "and":
+            nodes = [n for n in self._tree[1] if n[0] == "cmp"]
+        else:
+            nodes = []
+        return [(self._columns[name], op, value) for _, name, op, value in nodes]
+
+
+def _iter_chunks(frames, chunksize):
+    """
+    Regroup a sequence of DataFrames into DataFrames of ``chunksize`` rows
+    (except the last one).
+    """
+    buffer = []
+    nrows = 0
+    for df in frames:
+        buffer.append(df)
+        nrows += len(df)
+        while nrows >= chunksize:
+            combined = concat(buffer) if len(buffer) > 1 else buffer[0]
+            yield combined.iloc[:chunksize]
+            buffer = [combined.iloc[chunksize:]]
+            nrows -= chunksize
+    if nrows:
+        yield concat(buffer) if len(buffer) > 1 else buffer[0]
+
+
 def get_engine(engine):
     """ return our implementation """
 
@@ -71,6 +356,37 @@ class BaseImpl:
     def read(self, path, columns=None, **kwargs):
         raise AbstractMethodError(self)
 
+    def iter_row_groups(self, path, columns=None, filters=None, **kwargs):
+        """
+        Yield a DataFrame for each row group of the file that may match the
+        ``filters``, with the rows matching ``filters``.
+        """
+        raise AbstractMethodError(self)
+
+    @staticmethod
+    def _read_columns(columns, filters):
+        # the filter columns are read as well, to filter the rows
+        if columns is None or filters is None:
+            return columns
+        return list(columns) + [c for c in filters.columns if c not in columns]
+
+    @staticmethod
+    def _number_rows(df, start):
+        # the default index restarts at 0 in every row group, number the rows
+        # by their position in the file instead, as a full read does
+        index = df.index
+        if isinstance(index, RangeIndex) and index.start == 0 and index.step == 1:
+            df.index = RangeIndex(start, start + len(df))
+        return df
+
+    @staticmethod
+    def _filter(df, columns, filters):
+        if filters is not None:
+            df = df.loc[filters.mask(df)]
+            if columns is not None:
+                df = df[[c for c in columns if c in df.columns]]
+        return df
+
 
 class PyArrowImpl(BaseImpl):
     def __init__(self):
@@ -132,6 +448,62 @@ class PyArrowImpl(BaseImpl):
 
         return result
 
+    def iter_row_groups(self, path, columns=None, filters=None, **kwargs):
+        if "filters" in kwargs:
+            raise ValueError(
+                "filters on the partition keys are not supported with "
+                "chunksize, use a str filters instead"
+            )
+        path, _, _, should_close = get_filepath_or_buffer(path)
+        try:
+            parquet_file = self.api.parquet.ParquetFile(path)
+            metadata = parquet_file.metadata
+            if filters is not None:
+                filters.bind(parquet_file.schema.names)
+
+            row_groups = [
+                i
+                for i in range(metadata.num_row_groups)
+                if filters is None
+                or filters.may_match(self._statistics(metadata.row_group(i)))
+            ]
+            if not row_groups and metadata.num_row_groups:
+                # read (and filter out) one row group, for the columns
+                row_groups = [0]
+
+            num_rows = [
+                metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)
+            ]
+            starts = np.cumsum([0] + num_rows)
+            read_columns = self._read_columns(columns, filters)
+            for i in row_groups:
+                df = parquet_file.read_row_group(
+                    i, columns=read_columns, use_pandas_metadata=True, **kwargs
+                ).to_pandas()
+                df = self._number_rows(df, starts[i])
+                yield self._filter(df, columns, filters)
+        finally:
+            if should_close:
+                try:
+                    path.close()
+                except:  # noqa: flake8
+                    pass
+
+    @staticmethod
+    def _statistics(row_group):
+        statistics = {}
+        for i in range(row_group.num_columns):
+            column = row_group.column(i)
+            stats = column.statistics
+            if stats is None:
+                continue
+            if stats.has_min_max:
+                minimum, maximum = stats.min, stats.max
+            else:
+                minimum = maximum = None
+            statistics[column.path_in_schema] = (minimum, maximum, stats.null_count)
+        return statistics
+
 
 class FastParquetImpl(BaseImpl):
     def __init__(self):
@@ -183,6 +555,38 @@ class FastParquetImpl(BaseImpl):
             )
 
     def read(self, path, columns=None, **kwargs):
+        parquet_file = self._parquet_file(path)
+        return parquet_file.to_pandas(columns=columns, **kwargs)
+
+    def iter_row_groups(self, path, columns=None, filters=None, **kwargs):
+        parquet_file = self._parquet_file(path)
+        native_filters = list(kwargs.pop("filters", []))
+        if filters is not None:
+            filters.bind(parquet_file.columns)
+            # fastparquet skips the row groups whose statistics rule out the
+            # comparisons that are and-ed at the top level
+            native_filters += filters.to_conjunction()
+
+        read_columns = self._read_columns(columns, filters)
+        row_groups = parquet_file.row_groups
+        num_rows = [rg.num_rows for rg in row_groups]
+        starts = dict(zip(map(id, row_groups), np.cumsum([0] + num_rows)))
+        if native_filters:
+            row_groups = parquet_file.filter_row_groups(native_filters)
+            if not row_groups:
+                # no row group matches, read one for the columns
+                parquet_file.row_groups = parquet_file.row_groups[:1]
+                for df in parquet_file.iter_row_groups(columns=read_columns, **kwargs):
+                    yield self._filter(df.iloc[:0], columns, filters)
+                return
+            parquet_file.row_groups = row_groups
+
+        frames = parquet_file.iter_row_groups(columns=read_columns, **kwargs)
+        for rg, df in zip(row_groups, frames):
+            df = self._number_rows(df, starts[id(rg)])
+            yield self._filter(df, columns, filters)
+
+    def _parquet_file(self, path):
         if is_s3_url(path):
             from pandas.io.s3 import get_file_and_filesystem
 
@@ -198,7 +602,7 @@ class FastParquetImpl(BaseImpl):
             path, _, _, _ = get_filepath_or_buffer(path)
             parquet_file = self.api.ParquetFile(path)
 
-        return parquet_file.to_pandas(columns=columns, **kwargs)
+        return parquet_file
 
 
 def to_parquet(
@@ -255,7 +659,9 @@ def to_parquet(
     )
 
 
-def read_parquet(path, engine="auto", columns=None, **kwargs):
+def read_parquet(
+    path, engine="auto", columns=None, filters=None, chunksize=None, **kwargs
+):
     """
     Load a parquet object from the file path, returning a DataFrame.
 
@@ -284,13 +690,68 @@ def read_parquet(path, engine="auto", columns=None, **kwargs):
         If not None, only these columns will be read from the file.
 
         .. versionadded:: 0.21.1
+    filters : str, optional
+        Only read the rows matching this boolean expression, written as for
+        :meth:`DataFrame.query`: comparisons of a column (or index level)
+        with a constant, such as ``"a > 5 & b in ['x', 'y']"``, combined
+        with ``&``, ``|`` and ``~``. Local variables can be used by prefixing
+        them with ``@``. Row groups whose column statistics rule out a match
+        are not read at all. The filter columns do not need to be included
+        in ``columns``.
+
+        A list of tuples is passed to the engine as is, as in earlier
+        versions.
+
+        .. versionadded:: 1.0.0
+    chunksize : int, optional
+        Return an iterator of DataFrames of ``chunksize`` rows instead of a
+        single DataFrame. The file is read one row group at a time, so
+        memory use is bounded by the chunksize and the row group size.
+
+        .. versionadded:: 1.0.0
     **kwargs
         Any additional kwargs are passed to the engine.
 
     Returns
     -------
-    DataFrame
+    DataFrame, or iterator of DataFrames if ``chunksize`` is given
+
+    Notes
+    -----
+    ``filters`` (as a string) and ``chunksize`` require ``path`` to be a
+    single file rather than a partitioned dataset directory.
+
+    Examples
+    --------
+    >>> threshold = 10
+    >>> pd.read_parquet("data.parquet",
+    ...                 filters="value > @threshold & key != 'x'")  # doctest: +SKIP
+
+    >>> for chunk in pd.read_parquet("data.parquet",
+    ...                              chunksize=100000):  # doctest: +SKIP
+    ...     process(chunk)
     """
 
     impl = get_engine(engine)
-    return impl.read(path, columns=columns, **kwargs)
+    if filters is not None and not isinstance(filters, str):
+        # the native filters of the engine
+        kwargs["filters"] = filters
+        filters = None
+
+    if filters is None and chunksize is None:
+        return impl.read(path, columns=columns, **kwargs)
+
+    if filters is not None:
+        filters = ParquetFilter(filters, level=1)
+    if chunksize is not None and (not is_integer(chunksize) or chunksize < 1):
+        raise ValueError("'chunksize' must be an integer >=1")
+
+    frames = impl.iter_row_groups(path, columns=columns, filters=filters, **kwargs)
+    if chunksize is not None:
+        return _iter_chunks(frames, chunksize)
+
+    frames = list(frames)
+    if not frames:
+        # a file without row groups
+        return impl.read(path, columns=columns, **kwargs)
+    return concat(frames)
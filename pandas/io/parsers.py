@@ -2,10 +2,14 @@
 Module contains tools for processing files into DataFrames or other objects
 """
 
+import codecs
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import csv
 import datetime
-from io import StringIO
+from io import BytesIO, StringIO
+import mmap
+import os
 import re
 import sys
 from textwrap import fill
@@ -38,11 +42,13 @@ from pandas.core.dtypes.common import (
     is_integer,
     is_integer_dtype,
     is_list_like,
+    is_numeric_dtype,
     is_object_dtype,
     is_scalar,
     is_string_dtype,
     pandas_dtype,
 )
+from pandas.core.dtypes.concat import union_categoricals
 from pandas.core.dtypes.dtypes import CategoricalDtype
 from pandas.core.dtypes.missing import isna
 
@@ -51,6 +57,7 @@ from pandas.core import algorithms
 from pandas.core.arrays import Categorical
 from pandas.core.frame import DataFrame
 from pandas.core.index import Index, MultiIndex, RangeIndex, ensure_index_from_sequences
+from pandas.core.reshape.concat import concat
 from pandas.core.series import Series
 from pandas.core.tools import datetimes as tools
 
@@ -337,6 +344,16 @@ memory_map : bool, default False
     If a filepath is provided for `filepath_or_buffer`, map the file object
     directly onto memory and access the data directly from there. Using this
     option can improve performance because there is no longer any I/O overhead.
+num_threads : int, optional
+    Number of threads used to tokenize and convert the file. When greater
+    than 1, the input is split at line boundaries (outside of quoted fields)
+    into ``num_threads`` blocks that are parsed concurrently and whose
+    inferred dtypes are reconciled before concatenation. Inputs that cannot
+    be split safely (e.g. compressed files, ``skiprows``, ``comment`` or a
+    multi-row ``header``) are parsed on a single thread.
+    (Only valid with C parser).
+
+    .. versionadded:: 1.0.0
 float_precision : str, optional
     Specifies which converter the C engine should use for floating-point
     values. The options are `None` for the ordinary converter,
@@ -447,16 +464,23 @@ def _read(filepath_or_buffer: FilePathOrBuffer, kwds):
     # Check for duplicates in names.
     _validate_names(kwds.get("names", None))
 
-    # Create the parser.
-    parser = TextFileReader(fp_or_buf, **kwds)
+    data = None
+    if kwds.get("num_threads") is not None and kwds.get("engine") == "c":
+        num_threads = _validate_integer("num_threads", kwds["num_threads"], 1)
+        if num_threads > 1 and not (chunksize or iterator):
+            data = _read_parallel(fp_or_buf, kwds, num_threads)
 
-    if chunksize or iterator:
-        return parser
+    if data is None:
+        # Create the parser.
+        parser = TextFileReader(fp_or_buf, **kwds)
 
-    try:
-        data = parser.read(nrows)
-    finally:
-        parser.close()
+        if chunksize or iterator:
+            return parser
+
+        try:
+            data = parser.read(nrows)
+        finally:
+            parser.close()
 
     if should_close:
         try:
@@ -467,6 +491,248 @@ def _read(filepath_or_buffer: FilePathOrBuffer, kwds):
     return data
 
 
+def _can_read_parallel(kwds):
+    """
+    Check whether the options in ``kwds`` allow the input to be split at
+    line boundaries and each block to be parsed independently.
+    """
+    if kwds.get("engine", "c") != "c":
+        return False
+
+    delimiter = kwds.get("delimiter")
+    if not kwds.get("delim_whitespace") and (
+        delimiter is None or (len(delimiter) != 1 and delimiter != r"\s+")
+    ):
+        return False
+
+    header = kwds.get("header", "infer")
+    if header == "infer":
+        header = 0 if kwds.get("names") is None else None
+    if header is not None and header != 0:
+        return False
+
+    encoding = kwds.get("encoding")
+    if encoding is not None and codecs.lookup(encoding).name not in (
+        "utf-8",
+        "ascii",
+        "latin-1",
+        "iso8859-1",
+    ):
+        return False
+
+    quotechar = kwds.get("quotechar")
+    return (
+        kwds.get("compression") is None
+        and kwds.get("skiprows") is None
+        and not kwds.get("skipfooter")
+        and kwds.get("nrows") is None
+        and kwds.get("comment") is None
+        and kwds.get("escapechar") is None
+        and kwds.get("lineterminator") in (None, "\n")
+        and kwds.get("dialect") is None
+        and (quotechar is None or len(quotechar) == 1)
+    )
+
+
+def _find_block_bounds(buf, start, num_blocks, quotechar, block_size=None):
+    """
+    Split ``buf[start:]`` into at most ``num_blocks`` blocks, ending each
+    block at a newline that is not inside a quoted field.
+
+    Parameters
+    ----------
+    buf : bytes or mmap.mmap
+    start : int
+        Offset of the first data byte.
+    num_blocks : int
+    quotechar : bytes or None
+        Quoting character, or None if quoting should be ignored.
+    block_size : int, optional
+        Minimum number of bytes per block. Defaults to an even split.
+
+    Returns
+    -------
+    bounds : list of int
+        Offsets such that block ``i`` is ``buf[bounds[i]:bounds[i + 1]]``.
+    """
+    size = len(buf)
+    arr = np.frombuffer(buf, dtype=np.uint8)
+    quote = ord(quotechar) if quotechar is not None else None
+    if block_size is None:
+        block_size = max((size - start) // num_blocks, 1)
+
+    bounds = [start]
+    # whether ``buf[scanned]`` lies inside a quoted field
+    scanned = start
+    in_quotes = False
+
+    while len(bounds) < num_blocks:
+        pos = buf.find(b"\n", bounds[-1] + block_size - 1)
+        while pos != -1:
+            if quote is not None:
+                n_quotes = np.count_nonzero(arr[scanned:pos] == quote)
+                in_quotes ^= bool(n_quotes % 2)
+                scanned = pos
+            if not in_quotes:
+                break
+            pos = buf.find(b"\n", pos + 1)
+
+        if pos == -1 or pos + 1 >= size:
+            break
+        bounds.append(pos + 1)
+
+    bounds.append(size)
+    return bounds
+
+
+def _read_parallel(fp_or_buf, kwds, num_threads):
+    """
+    Parse the input in ``num_threads`` blocks concurrently with the C engine.
+
+    The header line (if any) is prepended to every block so that each block
+    is parsed with exactly the same options. Columns whose inferred dtypes
+    disagree between blocks in a way that cannot be resolved by numeric
+    upcasting are parsed again as object, matching what a single pass over
+    the whole file would infer.
+
+    Returns
+    -------
+    DataFrame, Series or None
+        None if the input cannot be split safely, or if dtypes disagree while
+        dates are parsed or converters are given; the caller should fall
+        back to the single-threaded reader.
+    """
+    if not _can_read_parallel(kwds):
+        return None
+
+    handle = None
+    if isinstance(fp_or_buf, str):
+        if not os.path.isfile(fp_or_buf):
+            return None
+        handle = open(fp_or_buf, "rb")
+        try:
+            buf = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files cannot be memory-mapped
+            handle.close()
+            return None
+    elif hasattr(fp_or_buf, "read") and hasattr(fp_or_buf, "seek"):
+        position = fp_or_buf.tell()
+        buf = fp_or_buf.read()
+        if isinstance(buf, str):
+            buf = buf.encode("utf-8")
+            kwds = dict(kwds, encoding="utf-8")
+        if not isinstance(buf, bytes):
+            fp_or_buf.seek(position)
+            return None
+    else:
+        return None
+
+    try:
+        result = _read_blocks(buf, kwds, num_threads)
+    finally:
+        if handle is not None:
+            buf.close()
+            handle.close()
+
+    if result is None and handle is None:
+        # the single-threaded reader reads the buffer again
+        fp_or_buf.seek(position)
+    return result
+
+
+def _read_blocks(buf, kwds, num_threads):
+    squeeze = kwds.get("squeeze", False)
+    kwds = dict(kwds, num_threads=None, squeeze=False)
+
+    quotechar = kwds.get("quotechar")
+    if kwds.get("quoting", csv.QUOTE_MINIMAL) == csv.QUOTE_NONE or not quotechar:
+        quotechar = None
+    elif isinstance(quotechar, str):
+        quotechar = quotechar.encode("utf-8")
+
+    header = kwds.get("header", "infer")
+    if header == "infer":
+        header = 0 if kwds.get("names") is None else None
+
+    start = 0
+    if header == 0:
+        start = _find_block_bounds(buf, 0, 2, quotechar, block_size=1)[1]
+        if start == len(buf) or not buf[:start].strip():
+            # header-only input or leading blank lines; let the
+            # single-threaded reader deal with it
+            return None
+    header_line = bytes(buf[:start])
+
+    bounds = _find_block_bounds(buf, start, num_threads, quotechar)
+    if len(bounds) <= 2:
+        return None
+
+    def parse_blocks(block_kwds):
+        def parse_block(i):
+            data = header_line + bytes(buf[bounds[i] : bounds[i + 1]])
+            parser = TextFileReader(BytesIO(data), **block_kwds)
+            try:
+                return parser.read()
+            finally:
+                parser.close()
+
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            frames = list(executor.map(parse_block, range(len(bounds) - 1)))
+
+        # blocks consisting only of blank lines carry no dtype information
+        return [frame for frame in frames if len(frame)] or frames[:1]
+
+    frames = parse_blocks(kwds)
+
+    # reconcile dtypes that differ between blocks
+    object_cols = []
+    for col in frames[0].columns:
+        # blocks with only missing values are inferred as float64 and
+        # booleans with missing values as object
+        dtypes = [
+            np.dtype(bool)
+            if lib.infer_dtype(frame[col], skipna=True) == "boolean"
+            else frame[col].dtype
+            for frame in frames
+            if frame[col].notna().any()
+        ]
+        if all(is_dtype_equal(dtype, dtypes[0]) for dtype in dtypes) or all(
+            is_numeric_dtype(dtype) and not is_bool_dtype(dtype) for dtype in dtypes
+        ):
+            continue
+        if not any(is_categorical_dtype(dtype) for dtype in dtypes):
+            # mixing e.g. strings and numbers: a single pass over the
+            # whole column would have left every value as a string
+            object_cols.append(col)
+
+    if object_cols and (kwds.get("parse_dates") or kwds.get("converters")):
+        # the values were already converted differently in each block, let
+        # the single-threaded reader convert the whole column at once
+        return None
+
+    dtype = kwds.get("dtype")
+    if object_cols and (dtype is None or isinstance(dtype, dict)):
+        dtype = dict(dtype or {}, **{col: object for col in object_cols})
+        frames = parse_blocks(dict(kwds, dtype=dtype))
+
+    for col in frames[0].columns:
+        columns = [frame[col] for frame in frames]
+        if all(is_categorical_dtype(x) for x in columns) and not all(
+            is_dtype_equal(x.dtype, columns[0].dtype) for x in columns
+        ):
+            categories = union_categoricals(columns, sort_categories=True).categories
+            for frame in frames:
+                frame[col] = frame[col].cat.set_categories(categories)
+
+    index_col = kwds.get("index_col")
+    result = concat(frames, ignore_index=index_col is None or index_col is False)
+
+    if squeeze and len(result.columns) == 1:
+        return result[result.columns[0]].copy()
+    return result
+
+
 _parser_defaults = {
     "delimiter": None,
     "escapechar": None,
@@ -515,6 +781,7 @@ _c_parser_defaults = {
     "na_filter": True,
     "low_memory": True,
     "memory_map": False,
+    "num_threads": None,
     "error_bad_lines": True,
     "warn_bad_lines": True,
     "float_precision": None,
@@ -523,7 +790,7 @@ _c_parser_defaults = {
 _fwf_defaults = {"colspecs": "infer", "infer_nrows": 100, "widths": None}
 
 _c_unsupported = {"skipfooter"}
-_python_unsupported = {"low_memory", "float_precision"}
+_python_unsupported = {"low_memory", "float_precision", "num_threads"}
 
 _deprecated_defaults = {}  # type: Dict[str, Any]
 _deprecated_args = set()  # type: Set[str]
@@ -587,6 +854,7 @@ def _make_parser_function(name, default_sep=","):
         delim_whitespace=False,
         low_memory=_c_parser_defaults["low_memory"],
         memory_map=False,
+        num_threads=None,
         float_precision=None,
     ):
 
@@ -665,6 +933,7 @@ def _make_parser_function(name, default_sep=","):
             encoding=encoding,
             squeeze=squeeze,
             memory_map=memory_map,
+            num_threads=num_threads,
             float_precision=float_precision,
             na_filter=na_filter,
             delim_whitespace=delim_whitespace,
@@ -1902,6 +2171,9 @@ class CParserWrapper(ParserBase):
         # #2442
         kwds["allow_leading_cols"] = self.index_col is not False
 
+        # handled by _read before the engine is created
+        kwds.pop("num_threads", None)
+
         # GH20529, validate usecol arg before TextReader
         self.usecols, self.usecols_dtype = _validate_usecols_arg(kwds["usecols"])
         kwds["usecols"] = self.usecols
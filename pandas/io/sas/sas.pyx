@@ -1,6 +1,9 @@
 # cython: profile=False
 # cython: boundscheck=False, initializedcheck=False
 from cython import Py_ssize_t
+from libc.string cimport memcpy, memset
+
+import sys
 
 import numpy as np
 import pandas.io.sas.sas_constants as const
@@ -9,16 +12,21 @@ ctypedef signed long long   int64_t
 ctypedef unsigned char      uint8_t
 ctypedef unsigned short     uint16_t
 
+cdef:
+    object nan = np.nan
+    bint native_little_endian = sys.byteorder == "little"
+
 # rle_decompress decompresses data using a Run Length Encoding
 # algorithm.  It is partially documented here:
 #
 # https://cran.r-project.org/package=sas7bdat/vignettes/sas7bdat.pdf
-cdef const uint8_t[:] rle_decompress(int result_length,
-                                     const uint8_t[:] inbuff):
+#
+# The row is written to ``result``, which must be zeroed and hold the full
+# uncompressed row.
+cdef int rle_decompress(const uint8_t[:] inbuff, uint8_t[:] result) except -1:
 
     cdef:
         uint8_t control_byte, x
-        uint8_t[:] result = np.zeros(result_length, np.uint8)
         int rpos = 0
         int i, nbytes, end_of_first_byte
         Py_ssize_t ipos = 0, length = len(inbuff)
@@ -108,25 +116,20 @@ cdef const uint8_t[:] rle_decompress(int result_length,
             raise ValueError("unknown control byte: {byte}"
                              .format(byte=control_byte))
 
-    # In py37 cython/clang sees `len(outbuff)` as size_t and not Py_ssize_t
-    if <Py_ssize_t>len(result) != <Py_ssize_t>result_length:
-        raise ValueError("RLE: {got} != {expect}".format(got=len(result),
-                                                         expect=result_length))
-
-    return np.asarray(result)
+    return 0
 
 
 # rdc_decompress decompresses data using the Ross Data Compression algorithm:
 #
 # http://collaboration.cmc.ec.gc.ca/science/rpn/biblio/ddj/Website/articles/CUJ/1992/9210/ross/ross.htm
-cdef const uint8_t[:] rdc_decompress(int result_length,
-                                     const uint8_t[:] inbuff):
+#
+# Like rle_decompress, the row is written to ``outbuff``.
+cdef int rdc_decompress(const uint8_t[:] inbuff, uint8_t[:] outbuff) except -1:
 
     cdef:
         uint8_t cmd
         uint16_t ctrl_bits, ctrl_mask = 0, ofs, cnt
         int rpos = 0, k
-        uint8_t[:] outbuff = np.zeros(result_length, dtype=np.uint8)
         Py_ssize_t ipos = 0, length = len(inbuff)
 
     ii = -1
@@ -192,12 +195,36 @@ cdef const uint8_t[:] rdc_decompress(int result_length,
         else:
             raise ValueError("unknown RDC command")
 
-    # In py37 cython/clang sees `len(outbuff)` as size_t and not Py_ssize_t
-    if <Py_ssize_t>len(outbuff) != <Py_ssize_t>result_length:
-        raise ValueError("RDC: {got} != {expect}\n"
-                         .format(got=len(outbuff), expect=result_length))
+    return 0
 
-    return np.asarray(outbuff)
+
+cdef inline double read_double(const uint8_t *data, int64_t length,
+                               bint is_little_endian) nogil:
+    # SAS stores numbers as doubles truncated to their `length` most
+    # significant bytes, restore the missing bytes as zeros
+    cdef:
+        uint8_t buf[8]
+        uint8_t tmp
+        double value
+        int k
+
+    if length > 8:
+        length = 8
+
+    memset(buf, 0, 8)
+    if is_little_endian:
+        memcpy(buf + 8 - length, data, length)
+    else:
+        memcpy(buf, data, length)
+
+    if is_little_endian != native_little_endian:
+        for k in range(4):
+            tmp = buf[k]
+            buf[k] = buf[7 - k]
+            buf[7 - k] = tmp
+
+    memcpy(&value, buf, 8)
+    return value
 
 
 cdef enum ColumnTypes:
@@ -221,9 +248,13 @@ cdef class Parser:
         int64_t[:] lengths
         int64_t[:] offsets
         int64_t[:] column_types
-        uint8_t[:, :] byte_chunk
+        double[:, :] float_chunk
         object[:, :] string_chunk
-        char *cached_page
+        uint8_t[:] decompress_buffer
+        const uint8_t[:] cached_page
+        bint has_page
+        bint blank_missing
+        object encoding
         int current_row_on_page_index
         int current_page_block_count
         int current_page_data_subheader_pointers_len
@@ -236,8 +267,8 @@ cdef class Parser:
         int subheader_pointer_length
         int current_page_type
         bint is_little_endian
-        const uint8_t[:] (*decompress)(int result_length,
-                                       const uint8_t[:] inbuff)
+        int (*decompress)(const uint8_t[:] inbuff,
+                          uint8_t[:] result) except -1
         object parser
 
     def __init__(self, object parser):
@@ -250,12 +281,18 @@ cdef class Parser:
         self.column_count = parser.column_count
         self.lengths = parser.column_data_lengths()
         self.offsets = parser.column_data_offsets()
-        self.byte_chunk = parser._byte_chunk
+        self.float_chunk = parser._float_chunk
         self.string_chunk = parser._string_chunk
         self.row_length = parser.row_length
+        self.decompress_buffer = np.empty(self.row_length, dtype=np.uint8)
         self.bit_offset = self.parser._page_bit_offset
         self.subheader_pointer_length = self.parser._subheader_pointer_length
         self.is_little_endian = parser.byte_order == "<"
+        self.blank_missing = parser.blank_missing
+        if parser.convert_text and parser.encoding is not None:
+            self.encoding = parser.encoding
+        else:
+            self.encoding = None
         self.column_types = np.empty(self.column_count, dtype='int64')
 
         # page indicators
@@ -308,7 +345,7 @@ cdef class Parser:
 
         done = self.parser._read_next_page()
         if done:
-            self.cached_page = NULL
+            self.has_page = False
         else:
             self.update_next_page()
         return done
@@ -316,7 +353,8 @@ cdef class Parser:
     cdef update_next_page(self):
         # update data for the current page
 
-        self.cached_page = <char *>self.parser._cached_page
+        self.cached_page = self.parser._cached_page
+        self.has_page = True
         self.current_row_on_page_index = 0
         self.current_page_type = self.parser._current_page_type
         self.current_page_block_count = self.parser._current_page_block_count
@@ -336,7 +374,7 @@ cdef class Parser:
         subheader_pointer_length = self.subheader_pointer_length
 
         # If there is no page, go to the end of the header and read a page.
-        if self.cached_page == NULL:
+        if not self.has_page:
             self.parser._path_or_buf.seek(self.header_length)
             done = self.read_next_page()
             if done:
@@ -395,55 +433,52 @@ cdef class Parser:
                 raise ValueError("unknown page type: {typ}"
                                  .format(typ=self.current_page_type))
 
-    cdef void process_byte_array_with_data(self, int offset, int length):
+    cdef int process_byte_array_with_data(self, int offset,
+                                          int length) except -1:
 
         cdef:
             Py_ssize_t j
-            int s, k, m, jb, js, current_row
-            int64_t lngt, start, ct
+            int jb, js, current_row
+            int64_t lngt, start
             const uint8_t[:] source
-            int64_t[:] column_types
-            int64_t[:] lengths
-            int64_t[:] offsets
-            uint8_t[:, :] byte_chunk
-            object[:, :] string_chunk
 
-        source = np.frombuffer(
-            self.cached_page[offset:offset + length], dtype=np.uint8)
+        source = self.cached_page[offset:offset + length]
 
         if self.decompress != NULL and (length < self.row_length):
-            source = self.decompress(self.row_length, source)
+            self.decompress_buffer[:] = 0
+            self.decompress(source, self.decompress_buffer)
+            source = self.decompress_buffer
 
         current_row = self.current_row_in_chunk_index
-        column_types = self.column_types
-        lengths = self.lengths
-        offsets = self.offsets
-        byte_chunk = self.byte_chunk
-        string_chunk = self.string_chunk
-        s = 8 * self.current_row_in_chunk_index
         js = 0
         jb = 0
         for j in range(self.column_count):
-            lngt = lengths[j]
+            lngt = self.lengths[j]
             if lngt == 0:
                 break
-            start = offsets[j]
-            ct = column_types[j]
-            if ct == column_type_decimal:
-                # decimal
-                if self.is_little_endian:
-                    m = s + 8 - lngt
-                else:
-                    m = s
-                for k in range(lngt):
-                    byte_chunk[jb, m + k] = source[start + k]
+            start = self.offsets[j]
+            if self.column_types[j] == column_type_decimal:
+                self.float_chunk[jb, current_row] = read_double(
+                    &source[start], lngt, self.is_little_endian)
                 jb += 1
-            elif column_types[j] == column_type_string:
-                # string
-                string_chunk[js, current_row] = np.array(source[start:(
-                    start + lngt)]).tostring().rstrip(b"\x00 ")
+            elif self.column_types[j] == column_type_string:
+                self.string_chunk[js, current_row] = self.read_string(
+                    &source[start], lngt)
                 js += 1
 
         self.current_row_on_page_index += 1
         self.current_row_in_chunk_index += 1
         self.current_row_in_file_index += 1
+        return 0
+
+    cdef object read_string(self, const uint8_t *data, int64_t length):
+        # strings are padded with blanks or nulls
+        while length > 0 and (data[length - 1] == 0x20 or
+                              data[length - 1] == 0x00):
+            length -= 1
+
+        if length == 0 and self.blank_missing:
+            return nan
+        if self.encoding is None:
+            return (<const char *>data)[:length]
+        return (<const char *>data)[:length].decode(self.encoding)
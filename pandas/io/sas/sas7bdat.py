@@ -652,8 +652,8 @@ class SAS7BDATReader(BaseIterator):
         nd = self._column_types.count(b"d")
         ns = self._column_types.count(b"s")
 
-        self._string_chunk = np.empty((ns, nrows), dtype=np.object)
-        self._byte_chunk = np.zeros((nd, 8 * nrows), dtype=np.uint8)
+        self._string_chunk = np.empty((ns, nrows), dtype=object)
+        self._float_chunk = np.empty((nd, nrows), dtype=np.float64)
 
         self._current_row_in_chunk_index = 0
         p = Parser(self)
@@ -692,7 +692,7 @@ class SAS7BDATReader(BaseIterator):
         n = self._current_row_in_chunk_index
         m = self._current_row_in_file_index
         ix = range(m - n, m)
-        rslt = pd.DataFrame(index=ix)
+        data = {}
 
         js, jb = 0, 0
         for j in range(self.column_count):
@@ -700,8 +700,8 @@ class SAS7BDATReader(BaseIterator):
             name = self.column_names[j]
 
             if self._column_types[j] == b"d":
-                rslt[name] = self._byte_chunk[jb, :].view(dtype=self.byte_order + "d")
-                rslt[name] = np.asarray(rslt[name], dtype=np.float64)
+                # decoded to native float64 by the parser
+                col = self._float_chunk[jb, :n]
                 if self.convert_dates:
                     unit = None
                     if self.column_formats[j] in const.sas_date_formats:
@@ -709,24 +709,17 @@ class SAS7BDATReader(BaseIterator):
                     elif self.column_formats[j] in const.sas_datetime_formats:
                         unit = "s"
                     if unit:
-                        rslt[name] = pd.to_datetime(
-                            rslt[name], unit=unit, origin="1960-01-01"
-                        )
+                        col = pd.to_datetime(col, unit=unit, origin="1960-01-01")
                 jb += 1
             elif self._column_types[j] == b"s":
-                rslt[name] = self._string_chunk[js, :]
-                if self.convert_text and (self.encoding is not None):
-                    rslt[name] = rslt[name].str.decode(
-                        self.encoding or self.default_encoding
-                    )
-                if self.blank_missing:
-                    ii = rslt[name].str.len() == 0
-                    rslt.loc[ii, name] = np.nan
+                # decoded, and blanks set to missing, by the parser
+                col = self._string_chunk[js, :n]
                 js += 1
             else:
                 self.close()
                 raise ValueError(
                     "unknown column type {type}".format(type=self._column_types[j])
                 )
+            data[name] = col
 
-        return rslt
+        return pd.DataFrame(data, index=ix)
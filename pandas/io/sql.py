@@ -6,6 +6,7 @@ retrieval and to reduce dependency on DB-specific API.
 from contextlib import contextmanager
 from datetime import date, datetime, time
 from functools import partial
+from io import StringIO
 import re
 import warnings
 
@@ -14,12 +15,20 @@ import numpy as np
 import pandas._libs.lib as lib
 from pandas.compat import raise_with_traceback
 
-from pandas.core.dtypes.common import is_datetime64tz_dtype, is_dict_like, is_list_like
+from pandas.core.dtypes.cast import astype_nansafe, maybe_cast_to_datetime
+from pandas.core.dtypes.common import (
+    is_datetime64tz_dtype,
+    is_dict_like,
+    is_extension_array_dtype,
+    is_list_like,
+    pandas_dtype,
+)
 from pandas.core.dtypes.dtypes import DatetimeTZDtype
 from pandas.core.dtypes.missing import isna
 
 from pandas.core.api import DataFrame, Series
 from pandas.core.base import PandasObject
+import pandas.core.indexes.base as ibase
 from pandas.core.tools.datetimes import to_datetime
 
 
@@ -36,6 +45,22 @@ class DatabaseError(IOError):
 
 _SQLALCHEMY_INSTALLED = None
 
+# the representation of missing values in the CSV of method="copy"
+_COPY_NULL = "\\N"
+
+
+def _format_copy_column(arr):
+    """
+    Format the values of an object array as fields of the CSV of
+    method="copy": missing values are the unquoted ``_COPY_NULL``, all other
+    values are quoted so that a string equal to it is not loaded as NULL.
+    """
+    result = np.array(
+        ['"' + str(value).replace('"', '""') + '"' for value in arr], dtype=object
+    )
+    result[isna(arr)] = _COPY_NULL
+    return result
+
 
 def _is_sqlalchemy_connectable(con):
     global _SQLALCHEMY_INSTALLED
@@ -119,10 +144,92 @@ def _parse_date_columns(data_frame, parse_dates):
     return data_frame
 
 
-def _wrap_result(data, columns, index_col=None, coerce_float=True, parse_dates=None):
+def _string_columns(description, dbapi):
+    """
+    Positions of the columns a DBAPI2 cursor ``description`` reports as
+    strings, according to the ``STRING`` type object of the ``dbapi`` module.
+    """
+    string_type = getattr(dbapi, "STRING", None)
+    if description is None or string_type is None:
+        return set()
+
+    result = set()
+    for i, col_desc in enumerate(description):
+        type_code = col_desc[1]
+        try:
+            if type_code is not None and type_code == string_type:
+                result.add(i)
+        except Exception:
+            # type codes are driver specific, skip what we can't compare
+            pass
+    return result
+
+
+class _ColumnBuffer:
+    """
+    Convert the rows fetched from a result set into columns.
+
+    The rows are transposed into an object buffer, which is reused between the
+    chunks of a chunked read, and each column is converted to its final dtype
+    directly: with its ``dtype`` if one is given, kept as object if the cursor
+    describes it as a string, and otherwise inferred the way
+    :meth:`DataFrame.from_records` does.
+    """
+
+    def __init__(
+        self, columns, dtype=None, coerce_float=True, description=None, dbapi=None
+    ):
+        self.columns = list(columns)
+        self.coerce_float = coerce_float
+
+        if is_dict_like(dtype):
+            dtypes = [dtype.get(col) for col in self.columns]
+        else:
+            dtypes = [dtype] * len(self.columns)
+        self.dtypes = [None if dt is None else pandas_dtype(dt) for dt in dtypes]
+        self.string_columns = _string_columns(description, dbapi)
+
+        self._buffer = np.empty((len(self.columns), 0), dtype=object)
+
+    def _convert(self, i, values):
+        dtype = self.dtypes[i]
+        if dtype is not None:
+            if is_extension_array_dtype(dtype):
+                array_type = dtype.construct_array_type()
+                return array_type._from_sequence(values, dtype=dtype)
+            return astype_nansafe(values, dtype, copy=True)
+
+        if i in self.string_columns or not len(values):
+            return values.copy()
+
+        result = lib.maybe_convert_objects(values, try_float=self.coerce_float)
+        if result is values:
+            # still object, don't hand out a view on the buffer
+            result = values.copy()
+        return maybe_cast_to_datetime(result, None)
+
+    def to_frame(self, data):
+        """
+        Convert a list of rows to a DataFrame.
+        """
+        n = len(data)
+        if n > self._buffer.shape[1]:
+            self._buffer = np.empty((len(self.columns), n), dtype=object)
+        lib.fill_columns_from_rows(data, self._buffer)
+
+        arrays = [
+            self._convert(i, self._buffer[i, :n]) for i in range(len(self.columns))
+        ]
+        # drop the references to this chunk's values
+        self._buffer[:, :n] = None
+
+        return DataFrame._from_arrays(arrays, self.columns, ibase.default_index(n))
+
+
+def _wrap_result(data, buffer, index_col=None, parse_dates=None):
     """Wrap result set of query in a DataFrame."""
 
-    frame = DataFrame.from_records(data, columns=columns, coerce_float=coerce_float)
+    frame = buffer.to_frame(data)
 
     frame = _parse_date_columns(frame, parse_dates)
 
@@ -268,6 +375,7 @@ def read_sql_query(
     params=None,
     parse_dates=None,
     chunksize=None,
+    dtype=None,
 ):
     """
     Read SQL query into a DataFrame.
@@ -308,10 +416,16 @@ def read_sql_query(
     chunksize : int, default None
         If specified, return an iterator where `chunksize` is the number of
         rows to include in each chunk.
+    dtype : type name or dict of column -> type, default None
+        Data type for data or columns. E.g. ``np.float64`` or
+        ``{'a': np.float64, 'b': np.int32, 'c': 'Int64'}``. Columns with a
+        dtype are converted directly instead of having their type inferred.
+
+        .. versionadded:: 1.0.0
 
     Returns
     -------
-    DataFrame
+    DataFrame or Iterator[DataFrame]
 
     See Also
     --------
@@ -331,6 +445,7 @@ def read_sql_query(
         coerce_float=coerce_float,
         parse_dates=parse_dates,
         chunksize=chunksize,
+        dtype=dtype,
     )
 
 
@@ -484,11 +599,16 @@ def to_sql(
         keys should be the column names and the values should be the
         SQLAlchemy types or strings for the sqlite3 fallback mode. If a
         scalar is provided, it will be applied to all columns.
-    method : {None, 'multi', callable}, optional
+    method : {None, 'multi', 'copy', callable}, optional
         Controls the SQL insertion clause used:
 
         - None : Uses standard SQL ``INSERT`` clause (one per row).
         - 'multi': Pass multiple values in a single ``INSERT`` clause.
+        - 'copy': Stream the rows as CSV into the bulk loader of the
+          database (``COPY ... FROM STDIN`` for PostgreSQL with psycopg2).
+          Other databases use the ``None`` method.
+
+          .. versionadded:: 1.0.0
         - callable with signature ``(pd_table, conn, keys, data_iter)``.
 
         Details and a sample callable implementation can be found in the
@@ -681,59 +801,102 @@ class SQLTable(PandasObject):
         data = [dict(zip(keys, row)) for row in data_iter]
         conn.execute(self.table.insert(data))
 
+    def _copy_supported(self):
+        # COPY FROM STDIN, through psycopg2
+        dialect = self.pd_sql.connectable.dialect
+        return dialect.name == "postgresql" and dialect.driver == "psycopg2"
+
+    def _execute_insert_copy(self, conn, keys, data_iter):
+        """Alternative to _execute_insert streaming the rows as CSV into
+        ``COPY ... FROM STDIN``.
+
+        The values are expected formatted by ``_format_copy_column``.
+        """
+        buf = StringIO()
+        buf.writelines(",".join(row) + "\n" for row in data_iter)
+        buf.seek(0)
+
+        preparer = conn.dialect.identifier_preparer
+        sql = "COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{null}')"
+        sql = sql.format(
+            table=preparer.format_table(self.table),
+            columns=", ".join(preparer.quote(key) for key in keys),
+            null=_COPY_NULL,
+        )
+        with conn.connection.cursor() as cursor:
+            cursor.copy_expert(sql=sql, file=buf)
+
     def insert_data(self):
+        column_names = list(map(str, self.frame.columns))
+        frames = [self.frame]
         if self.index is not None:
-            temp = self.frame.copy()
-            temp.index.names = self.index
-            try:
-                temp.reset_index(inplace=True)
-            except ValueError as err:
-                raise ValueError("duplicate name in index/columns: {0}".format(err))
-        else:
-            temp = self.frame
-
-        column_names = list(map(str, temp.columns))
-        ncols = len(column_names)
-        data_list = [None] * ncols
-        blocks = temp._data.blocks
-
-        for b in blocks:
-            if b.is_datetime:
-                # return datetime.datetime objects
-                if b.is_datetimetz:
-                    # GH 9086: Ensure we return datetimes with timezone info
-                    # Need to return 2-D data; DatetimeIndex is 1D
-                    d = b.values.to_pydatetime()
-                    d = np.atleast_2d(d)
-                else:
-                    # convert to microsecond resolution for datetime.datetime
-                    d = b.values.astype("M8[us]").astype(object)
-            else:
-                d = np.array(b.get_values(), dtype=object)
-
-            # replace NaN with None
-            if b._can_hold_na:
-                mask = isna(d)
-                d[mask] = None
+            # the index levels are inserted first; only the index is copied,
+            # not the frame
+            for name in self.index:
+                if name in self.frame.columns:
+                    raise ValueError(
+                        "duplicate name in index/columns: cannot insert "
+                        "{name}, already exists".format(name=name)
+                    )
+            frames.insert(0, self.frame.index.to_frame(index=False))
+            column_names = list(self.index) + column_names
 
-            for col_loc, col in zip(b.mgr_locs, d):
-                data_list[col_loc] = col
+        data_list = [None] * len(column_names)
+        offset = 0
+        for frame in frames:
+            for b in frame._data.blocks:
+                for col_loc, col in zip(b.mgr_locs, self._block_to_objects(b)):
+                    data_list[offset + col_loc] = col
+            offset += frame.shape[1]
 
         return column_names, data_list
 
+    @staticmethod
+    def _block_to_objects(b):
+        """
+        Convert the values of a block to 2-D object ndarray, of datetime
+        objects for datetimes, and with None for missing values.
+        """
+        if b.is_datetime:
+            # return datetime.datetime objects
+            if b.is_datetimetz:
+                # GH 9086: Ensure we return datetimes with timezone info
+                # Need to return 2-D data; DatetimeIndex is 1D
+                d = b.values.to_pydatetime()
+                d = np.atleast_2d(d)
+            else:
+                # convert to microsecond resolution for datetime.datetime
+                d = b.values.astype("M8[us]").astype(object)
+        else:
+            d = np.array(b.get_values(), dtype=object)
+
+        # replace NaN with None
+        if b._can_hold_na:
+            mask = isna(d)
+            d[mask] = None
+
+        return d
+
     def insert(self, chunksize=None, method=None):
 
         # set insert method
+        copy = False
         if method is None:
             exec_insert = self._execute_insert
         elif method == "multi":
             exec_insert = self._execute_insert_multi
+        elif method == "copy":
+            # without a bulk loader, this is the default (executemany) path
+            copy = self._copy_supported()
+            exec_insert = self._execute_insert_copy if copy else self._execute_insert
         elif callable(method):
             exec_insert = partial(method, self)
         else:
             raise ValueError("Invalid parameter `method`: {}".format(method))
 
         keys, data_list = self.insert_data()
+        if copy:
+            data_list = [_format_copy_column(arr) for arr in data_list]
 
         nrows = len(self.frame)
 
@@ -1148,9 +1311,7 @@ class SQLDatabase(PandasSQL):
         )
 
     @staticmethod
-    def _query_iterator(
-        result, chunksize, columns, index_col=None, coerce_float=True, parse_dates=None
-    ):
+    def _query_iterator(result, chunksize, buffer, index_col=None, parse_dates=None):
         """Return generator through chunked result set"""
 
         while True:
@@ -1159,11 +1320,7 @@ class SQLDatabase(PandasSQL):
                 break
             else:
                 yield _wrap_result(
-                    data,
-                    columns,
-                    index_col=index_col,
-                    coerce_float=coerce_float,
-                    parse_dates=parse_dates,
+                    data, buffer, index_col=index_col, parse_dates=parse_dates
                 )
 
     def read_query(
@@ -1174,6 +1331,7 @@ class SQLDatabase(PandasSQL):
         parse_dates=None,
         params=None,
         chunksize=None,
+        dtype=None,
     ):
         """Read SQL query into a DataFrame.
 
@@ -1204,6 +1362,11 @@ class SQLDatabase(PandasSQL):
         chunksize : int, default None
             If specified, return an iterator where `chunksize` is the number
             of rows to include in each chunk.
+        dtype : type name or dict of column -> type, default None
+            Data type for data or columns. Columns with a dtype are converted
+            directly instead of having their type inferred.
+
+            .. versionadded:: 1.0.0
 
         Returns
         -------
@@ -1218,25 +1381,23 @@ class SQLDatabase(PandasSQL):
         args = _convert_params(sql, params)
 
         result = self.execute(*args)
-        columns = result.keys()
+        cursor = getattr(result, "cursor", None)
+        buffer = _ColumnBuffer(
+            result.keys(),
+            dtype=dtype,
+            coerce_float=coerce_float,
+            description=getattr(cursor, "description", None),
+            dbapi=self.connectable.dialect.dbapi,
+        )
 
         if chunksize is not None:
             return self._query_iterator(
-                result,
-                chunksize,
-                columns,
-                index_col=index_col,
-                coerce_float=coerce_float,
-                parse_dates=parse_dates,
+                result, chunksize, buffer, index_col=index_col, parse_dates=parse_dates,
             )
         else:
             data = result.fetchall()
             frame = _wrap_result(
-                data,
-                columns,
-                index_col=index_col,
-                coerce_float=coerce_float,
-                parse_dates=parse_dates,
+                data, buffer, index_col=index_col, parse_dates=parse_dates
             )
             return frame
 
@@ -1283,11 +1444,14 @@ class SQLDatabase(PandasSQL):
             Optional specifying the datatype for columns. The SQL type should
             be a SQLAlchemy type. If all columns are of the same type, one
             single value can be used.
-        method : {None', 'multi', callable}, default None
+        method : {None', 'multi', 'copy', callable}, default None
             Controls the SQL insertion clause used:
 
             * None : Uses standard SQL ``INSERT`` clause (one per row).
             * 'multi': Pass multiple values in a single ``INSERT`` clause.
+            * 'copy': Stream the rows as CSV into the bulk loader of the
+              database (``COPY ... FROM STDIN`` for PostgreSQL with
+              psycopg2). Other databases use the ``None`` method.
             * callable with signature ``(pd_table, conn, keys, data_iter)``.
 
             Details and a sample callable implementation can be found in the
@@ -1465,9 +1629,12 @@ class SQLiteTable(SQLTable):
         )
         return insert_statement
 
+    def _copy_supported(self):
+        return False
+
     def _execute_insert(self, conn, keys, data_iter):
-        data_list = list(data_iter)
-        conn.executemany(self.insert_statement(), data_list)
+        # executemany consumes the rows of the chunk lazily
+        conn.executemany(self.insert_statement(), data_iter)
 
     def _create_table_setup(self):
         """
@@ -1612,9 +1779,7 @@ class SQLiteDatabase(PandasSQL):
             raise_with_traceback(ex)
 
     @staticmethod
-    def _query_iterator(
-        cursor, chunksize, columns, index_col=None, coerce_float=True, parse_dates=None
-    ):
+    def _query_iterator(cursor, chunksize, buffer, index_col=None, parse_dates=None):
         """Return generator through chunked result set"""
 
         while True:
@@ -1626,11 +1791,7 @@ class SQLiteDatabase(PandasSQL):
                 break
             else:
                 yield _wrap_result(
-                    data,
-                    columns,
-                    index_col=index_col,
-                    coerce_float=coerce_float,
-                    parse_dates=parse_dates,
+                    data, buffer, index_col=index_col, parse_dates=parse_dates
                 )
 
     def read_query(
@@ -1641,31 +1802,24 @@ class SQLiteDatabase(PandasSQL):
         params=None,
         parse_dates=None,
         chunksize=None,
+        dtype=None,
     ):
 
         args = _convert_params(sql, params)
         cursor = self.execute(*args)
         columns = [col_desc[0] for col_desc in cursor.description]
+        buffer = _ColumnBuffer(columns, dtype=dtype, coerce_float=coerce_float)
 
         if chunksize is not None:
             return self._query_iterator(
-                cursor,
-                chunksize,
-                columns,
-                index_col=index_col,
-                coerce_float=coerce_float,
-                parse_dates=parse_dates,
+                cursor, chunksize, buffer, index_col=index_col, parse_dates=parse_dates,
             )
         else:
             data = self._fetchall_as_list(cursor)
             cursor.close()
 
             frame = _wrap_result(
-                data,
-                columns,
-                index_col=index_col,
-                coerce_float=coerce_float,
-                parse_dates=parse_dates,
+                data, buffer, index_col=index_col, parse_dates=parse_dates
             )
             return frame
 
@@ -1715,11 +1869,12 @@ class SQLiteDatabase(PandasSQL):
             Optional specifying the datatype for columns. The SQL type should
             be a string. If all columns are of the same type, one single value
             can be used.
-        method : {None, 'multi', callable}, default None
+        method : {None, 'multi', 'copy', callable}, default None
             Controls the SQL insertion clause used:
 
             * None : Uses standard SQL ``INSERT`` clause (one per row).
             * 'multi': Pass multiple values in a single ``INSERT`` clause.
+            * 'copy': Same as None, sqlite has no bulk loader.
             * callable with signature ``(pd_table, conn, keys, data_iter)``.
 
             Details and a sample callable implementation can be found in the
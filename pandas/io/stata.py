@@ -36,7 +36,6 @@ from pandas import (
     DatetimeIndex,
     NaT,
     Timestamp,
-    concat,
     isna,
     to_datetime,
     to_timedelta,
@@ -1621,221 +1620,192 @@ the string values returned are correct."""
                 self._read_value_labels()
             self.close()
             raise StopIteration
-        offset = self._lines_read * dtype.itemsize
-        self.path_or_buf.seek(self.data_location + offset)
         read_lines = min(nrows, self.nobs - self._lines_read)
-        data = np.frombuffer(
-            self.path_or_buf.read(read_len), dtype=dtype, count=read_lines
-        )
+        records = self._read_records(self._lines_read, read_lines)
 
         self._lines_read += read_lines
         if self._lines_read == self.nobs:
             self._can_read_value_labels = True
             self._data_read = True
-        # if necessary, swap the byte order to native here
-        if self.byteorder != self._native_byteorder:
-            data = data.byteswap().newbyteorder()
 
         if convert_categoricals:
             self._read_value_labels()
 
-        if len(data) == 0:
-            data = DataFrame(columns=self.varlist)
-        else:
-            data = DataFrame.from_records(data)
-            data.columns = self.varlist
-
-        # If index is not specified, use actual row number rather than
-        # restarting at 0 for each chunk.
-        if index_col is None:
-            ix = np.arange(self._lines_read - read_lines, self._lines_read)
-            data = data.set_index(ix)
-
         if columns is not None:
             try:
-                data = self._do_select_columns(data, columns)
+                self._do_select_columns(columns)
             except ValueError:
                 self.close()
                 raise
 
-        # Decode strings
-        for col, typ in zip(data, self.typlist):
-            if type(typ) is int:
-                data[col] = data[col].apply(self._decode, convert_dtype=True)
-
-        data = self._insert_strls(data)
-
-        cols_ = np.where(self.dtyplist)[0]
-
-        # Convert columns (if needed) to match input type
-        ix = data.index
-        requires_type_conversion = False
-        data_formatted = []
-        for i in cols_:
-            if self.dtyplist[i] is not None:
-                col = data.columns[i]
-                dtype = data[col].dtype
-                if dtype != np.dtype(object) and dtype != self.dtyplist[i]:
-                    requires_type_conversion = True
-                    data_formatted.append(
-                        (col, Series(data[col], ix, self.dtyplist[i]))
-                    )
-                else:
-                    data_formatted.append((col, data[col]))
-        if requires_type_conversion:
-            data = DataFrame.from_dict(OrderedDict(data_formatted))
-        del data_formatted
-
-        data = self._do_convert_missing(data, convert_missing)
-
-        if convert_dates:
-
-            def any_startswith(x: str) -> bool:
-                return any(x.startswith(fmt) for fmt in _date_formats)
+        if self._column_selector_set:
+            positions = self._column_positions
+        else:
+            positions = range(len(self.varlist))
 
-            cols = np.where([any_startswith(x) for x in self.fmtlist])[0]
-            for i in cols:
-                col = data.columns[i]
+        # If index is not specified, use actual row number rather than
+        # restarting at 0 for each chunk.
+        if index_col is None:
+            index = np.arange(self._lines_read - read_lines, self._lines_read)
+        else:
+            index = None
+
+        # Convert each column of the records on its own, only the columns
+        # that are returned are read from the records
+        data = OrderedDict()
+        for i, pos in enumerate(positions):
+            col = self.varlist[pos]
+            values = self._convert_column(records[dtype.names[pos]], i)
+            values = self._do_convert_missing(values, i, convert_missing)
+
+            if convert_dates and any(
+                self.fmtlist[i].startswith(fmt) for fmt in _date_formats
+            ):
                 try:
-                    data[col] = _stata_elapsed_date_to_datetime_vec(
-                        data[col], self.fmtlist[i]
-                    )
+                    values = _stata_elapsed_date_to_datetime_vec(
+                        Series(values, index=index), self.fmtlist[i]
+                    )._values
                 except ValueError:
                     self.close()
                     raise
 
-        if convert_categoricals and self.format_version > 108:
-            data = self._do_convert_categoricals(
-                data, self.value_label_dict, self.lbllist, order_categoricals
-            )
+            if convert_categoricals and self.format_version > 108:
+                values = self._do_convert_categoricals(
+                    values, col, self.lbllist[i], order_categoricals
+                )
 
-        if not preserve_dtypes:
-            retyped_data = []
-            convert = False
-            for col in data:
-                dtype = data[col].dtype
-                if dtype in (np.float16, np.float32):
-                    dtype = np.float64
-                    convert = True
-                elif dtype in (np.int8, np.int16, np.int32):
-                    dtype = np.int64
-                    convert = True
-                retyped_data.append((col, data[col].astype(dtype)))
-            if convert:
-                data = DataFrame.from_dict(OrderedDict(retyped_data))
+            if not preserve_dtypes:
+                if values.dtype in (np.float16, np.float32):
+                    values = values.astype(np.float64)
+                elif values.dtype in (np.int8, np.int16, np.int32):
+                    values = values.astype(np.int64)
+
+            data[col] = values
+        del records
+
+        data = DataFrame(data, index=index, columns=list(data))
 
         if index_col is not None:
             data = data.set_index(data.pop(index_col))
 
         return data
 
-    def _do_convert_missing(self, data, convert_missing):
-        # Check for missing values, and replace if found
-        replacements = {}
-        for i, colname in enumerate(data):
-            fmt = self.typlist[i]
-            if fmt not in self.VALID_RANGE:
-                continue
-
-            nmin, nmax = self.VALID_RANGE[fmt]
-            series = data[colname]
-            missing = np.logical_or(series < nmin, series > nmax)
-
-            if not missing.any():
-                continue
-
-            if convert_missing:  # Replacement follows Stata notation
-
-                missing_loc = np.argwhere(missing._ndarray_values)
-                umissing, umissing_loc = np.unique(series[missing], return_inverse=True)
-                replacement = Series(series, dtype=np.object)
-                for j, um in enumerate(umissing):
-                    missing_value = StataMissingValue(um)
-
-                    loc = missing_loc[umissing_loc == j]
-                    replacement.iloc[loc] = missing_value
-            else:  # All replacements are identical
-                dtype = series.dtype
-                if dtype not in (np.float32, np.float64):
-                    dtype = np.float64
-                replacement = Series(series, dtype=dtype)
-                replacement[missing] = np.nan
-            replacements[colname] = replacement
-        if replacements:
-            columns = data.columns
-            replacements = DataFrame(replacements)
-            data = concat([data.drop(replacements.columns, 1), replacements], 1)
-            data = data[columns]
-        return data
+    def _read_records(self, start, count):
+        """
+        Return ``count`` data records starting at record ``start`` as a
+        structured array, memory-mapped from the file when it is on disk.
+        """
+        dtype = self._dtype
+        offset = self.data_location + start * dtype.itemsize
+        try:
+            self.path_or_buf.fileno()
+        except (AttributeError, IOError):
+            # in-memory buffer
+            self.path_or_buf.seek(offset)
+            return np.frombuffer(
+                self.path_or_buf.read(count * dtype.itemsize), dtype=dtype, count=count
+            )
+        return np.memmap(
+            self.path_or_buf, dtype=dtype, mode="r", offset=offset, shape=(count,)
+        )
 
-    def _insert_strls(self, data):
-        if not hasattr(self, "GSO") or len(self.GSO) == 0:
-            return data
-        for i, typ in enumerate(self.typlist):
-            if typ != "Q":
-                continue
+    def _convert_column(self, values, i):
+        """
+        Copy a column out of the data records, decoding strings and strLs
+        and swapping the byte order to native.
+        """
+        typ = self.typlist[i]
+        if type(typ) is int:
+            # fixed width strings, decode each distinct value once
+            uniques, inverse = np.unique(values, return_inverse=True)
+            decoded = np.empty(len(uniques), dtype=object)
+            decoded[:] = [self._decode(x) for x in uniques]
+            return decoded[inverse]
+
+        values = values.astype(values.dtype.newbyteorder("="))
+        if typ == "Q" and len(getattr(self, "GSO", ())) > 0:
+            uniques, inverse = np.unique(values, return_inverse=True)
+            strls = np.empty(len(uniques), dtype=object)
             # Wrap v_o in a string to allow uint64 values as keys on 32bit OS
-            data.iloc[:, i] = [self.GSO[str(k)] for k in data.iloc[:, i]]
-        return data
+            strls[:] = [self.GSO[str(k)] for k in uniques]
+            return strls[inverse]
 
-    def _do_select_columns(self, data, columns):
+        dtype = self.dtyplist[i]
+        if dtype is not None and values.dtype != dtype:
+            values = values.astype(dtype)
+        return values
 
+    def _do_convert_missing(self, values, i, convert_missing):
+        # Check for missing values, and replace if found
+        fmt = self.typlist[i]
+        if fmt not in self.VALID_RANGE:
+            return values
+
+        nmin, nmax = self.VALID_RANGE[fmt]
+        missing = (values < nmin) | (values > nmax)
+
+        if not missing.any():
+            return values
+
+        if convert_missing:  # Replacement follows Stata notation
+            umissing, umissing_loc = np.unique(values[missing], return_inverse=True)
+            missing_values = np.empty(len(umissing), dtype=object)
+            missing_values[:] = [StataMissingValue(um) for um in umissing]
+            values = values.astype(object)
+            values[missing] = missing_values[umissing_loc]
+        else:  # All replacements are identical
+            if values.dtype not in (np.float32, np.float64):
+                values = values.astype(np.float64)
+            values[missing] = np.nan
+        return values
+
+    def _do_select_columns(self, columns):
+        """
+        Restrict the columns that are read to ``columns``.
+        """
         if not self._column_selector_set:
             column_set = set(columns)
             if len(column_set) != len(columns):
                 raise ValueError("columns contains duplicate entries")
-            unmatched = column_set.difference(data.columns)
+            unmatched = column_set.difference(self.varlist)
             if unmatched:
                 raise ValueError(
                     "The following columns were not found in the "
                     "Stata data set: " + ", ".join(list(unmatched))
                 )
             # Copy information for retained columns for later processing
-            dtyplist = []
-            typlist = []
-            fmtlist = []
-            lbllist = []
-            for col in columns:
-                i = data.columns.get_loc(col)
-                dtyplist.append(self.dtyplist[i])
-                typlist.append(self.typlist[i])
-                fmtlist.append(self.fmtlist[i])
-                lbllist.append(self.lbllist[i])
-
-            self.dtyplist = dtyplist
-            self.typlist = typlist
-            self.fmtlist = fmtlist
-            self.lbllist = lbllist
+            locs = {col: i for i, col in enumerate(self.varlist)}
+            positions = [locs[col] for col in columns]
+
+            self.dtyplist = [self.dtyplist[i] for i in positions]
+            self.typlist = [self.typlist[i] for i in positions]
+            self.fmtlist = [self.fmtlist[i] for i in positions]
+            self.lbllist = [self.lbllist[i] for i in positions]
+            self._column_positions = positions
             self._column_selector_set = True
 
-        return data[columns]
-
-    def _do_convert_categoricals(
-        self, data, value_label_dict, lbllist, order_categoricals
-    ):
+    def _do_convert_categoricals(self, values, col, label, order_categoricals):
         """
-        Converts categorical columns to Categorical type.
+        Converts a labeled column to Categorical type.
         """
-        value_labels = list(value_label_dict.keys())
-        cat_converted_data = []
-        for col, label in zip(data, lbllist):
-            if label in value_labels:
-                # Explicit call with ordered=True
-                cat_data = Categorical(data[col], ordered=order_categoricals)
-                categories = []
-                for category in cat_data.categories:
-                    if category in value_label_dict[label]:
-                        categories.append(value_label_dict[label][category])
-                    else:
-                        categories.append(category)  # Partially labeled
-                try:
-                    cat_data.categories = categories
-                except ValueError:
-                    vc = Series(categories).value_counts()
-                    repeats = list(vc.index[vc > 1])
-                    repeats = "-" * 80 + "\n" + "\n".join(repeats)
-                    # GH 25772
-                    msg = """
+        if label not in self.value_label_dict:
+            return values
+
+        # Explicit call with ordered=True
+        cat_data = Categorical(values, ordered=order_categoricals)
+        value_labels = self.value_label_dict[label]
+        # Partially labeled columns keep the values without a label
+        categories = [value_labels.get(cat, cat) for cat in cat_data.categories]
+        try:
+            return Categorical.from_codes(
+                cat_data.codes, categories, ordered=order_categoricals
+            )
+        except ValueError:
+            vc = Series(categories).value_counts()
+            repeats = list(vc.index[vc > 1])
+            repeats = "-" * 80 + "\n" + "\n".join(repeats)
+            # GH 25772
+            msg = """
 Value labels for column {col} are not unique. These cannot be converted to
 pandas categoricals.
 
@@ -1846,14 +1816,7 @@ value_labels.
 The repeated labels are:
 {repeats}
 """
-                    raise ValueError(msg.format(col=col, repeats=repeats))
-                # TODO: is the next line needed above in the data(...) method?
-                cat_data = Series(cat_data, index=data.index)
-                cat_converted_data.append((col, cat_data))
-            else:
-                cat_converted_data.append((col, data[col]))
-        data = DataFrame.from_dict(OrderedDict(cat_converted_data))
-        return data
+            raise ValueError(msg.format(col=col, repeats=repeats))
 
     @property
     def data_label(self):
@@ -87,6 +87,7 @@ class TestPDApi(Base):
         "UInt16Dtype",
         "UInt32Dtype",
         "UInt64Dtype",
+        "StringDtype",
         "NamedAgg",
     ]
     if not compat.PY37:
@@ -105,6 +106,8 @@ class TestPDApi(Base):
     funcs = [
         "array",
         "bdate_range",
+        "combine_partials",
+        "compile_expr",
         "concat",
         "crosstab",
         "cut",
@@ -147,6 +150,7 @@ class TestPDApi(Base):
 
     # top-level read_* funcs
     funcs_read = [
+        "read_blocks",
         "read_clipboard",
         "read_csv",
         "read_excel",
@@ -216,7 +220,7 @@ class TestPDApi(Base):
 
 class TestApi(Base):
 
-    allowed = ["types", "extensions"]
+    allowed = ["types", "extensions", "indexers"]
 
     def test_api(self):
 
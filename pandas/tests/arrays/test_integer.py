@@ -745,6 +745,119 @@ def test_reduce_to_float(op):
     tm.assert_frame_equal(result, expected)
 
 
+@pytest.mark.parametrize("dtype", ["Int64", "UInt64"])
+def test_reduce_large_values(dtype):
+    # reductions don't cast to float, which loses precision beyond 2**53
+    big = 2 ** 53 + 1
+    s = pd.Series([1, None, big, 3, None], dtype=dtype)
+
+    assert s.max() == big
+    assert s.min() == 1
+    assert s.sum() == big + 4
+    tm.assert_almost_equal(s.mean(), (big + 4) / 3)
+    assert np.isnan(s.sum(skipna=False))
+    assert np.isnan(s.max(skipna=False))
+    assert np.isnan(s.iloc[[1, 4]].max())
+    assert s.iloc[[1, 4]].sum() == 0
+    assert np.isnan(s.iloc[[1, 4]].sum(min_count=1))
+
+
+def test_groupby_reduce_large_values():
+    big = 2 ** 53 + 1
+    df = pd.DataFrame(
+        {
+            "A": ["a", "a", "b", "b", "c"],
+            "B": integer_array([1, None, big, 3, None], dtype="Int64"),
+        }
+    )
+    gb = df.groupby("A")["B"]
+    index = pd.Index(["a", "b", "c"], name="A")
+
+    result = gb.max()
+    expected = pd.Series(integer_array([1, big, None]), index=index, name="B")
+    tm.assert_series_equal(result, expected)
+
+    result = gb.first()
+    expected = pd.Series(integer_array([1, big, None]), index=index, name="B")
+    tm.assert_series_equal(result, expected)
+
+    result = gb.sum()
+    expected = pd.Series(integer_array([1, big + 3, 0]), index=index, name="B")
+    tm.assert_series_equal(result, expected)
+
+    result = gb.sum(min_count=1)
+    expected = pd.Series(integer_array([1, big + 3, None]), index=index, name="B")
+    tm.assert_series_equal(result, expected)
+
+    result = gb.cumsum()
+    expected = pd.Series(integer_array([1, None, big, big + 3, None]), name="B")
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("dtype", ["Int8", "Int16", "UInt8"])
+def test_groupby_sum_overflow(dtype):
+    # sums are computed and returned in 64 bits instead of wrapping around
+    big = np.iinfo(dtype.lower()).max
+    result_dtype = "UInt64" if dtype.startswith("U") else "Int64"
+    df = pd.DataFrame(
+        {
+            "A": ["a", "a", "a", "b", "b"],
+            "B": integer_array([big, big, None, None, None], dtype=dtype),
+        }
+    )
+    index = pd.Index(["a", "b"], name="A")
+
+    expected = pd.Series([2 * big, 0], index=index, name="B", dtype=result_dtype)
+    tm.assert_series_equal(df.groupby("A")["B"].sum(), expected)
+    tm.assert_series_equal(df.groupby("A").sum()["B"], expected)
+
+    result = df.groupby("A")["B"].sum(min_count=1)
+    expected = pd.Series(
+        integer_array([2 * big, None], dtype=result_dtype), index=index, name="B"
+    )
+    tm.assert_series_equal(result, expected)
+
+    expected = pd.Series(
+        integer_array([big, 2 * big, None, None, None], dtype=result_dtype), name="B"
+    )
+    tm.assert_series_equal(df.groupby("A")["B"].cumsum(), expected)
+    tm.assert_series_equal(df.groupby("A").cumsum()["B"], expected)
+
+
+@pytest.mark.parametrize("dtype", ["Int8", "Int16", "UInt8"])
+def test_groupby_reduce_all_na_group(dtype):
+    df = pd.DataFrame(
+        {
+            "A": ["a", "a", "a", "b", "b"],
+            "B": integer_array([1, None, 2, None, None], dtype=dtype),
+        }
+    )
+    gb = df.groupby("A")["B"]
+    index = pd.Index(["a", "b"], name="A")
+
+    for how, value in [("first", 1), ("last", 2), ("min", 1), ("max", 2)]:
+        result = getattr(gb, how)()
+        expected = pd.Series(
+            integer_array([value, None], dtype=dtype), index=index, name="B"
+        )
+        tm.assert_series_equal(result, expected)
+
+    result = gb.mean()
+    expected = pd.Series([1.5, np.nan], index=index, name="B")
+    tm.assert_series_equal(result, expected)
+
+    result = gb.var()
+    expected = pd.Series([0.5, np.nan], index=index, name="B")
+    tm.assert_series_equal(result, expected)
+
+    result = gb.cumsum(skipna=False)
+    result_dtype = "UInt64" if dtype.startswith("U") else "Int64"
+    expected = pd.Series(
+        integer_array([1, None, None, None, None], dtype=result_dtype), name="B"
+    )
+    tm.assert_series_equal(result, expected)
+
+
 def test_astype_nansafe():
     # see gh-22343
     arr = integer_array([np.nan, 1, 2], dtype="Int8")
@@ -0,0 +1,170 @@
+import operator
+
+import numpy as np
+import pytest
+
+import pandas as pd
+from pandas.core.arrays.string_ import StringArray, StringDtype
+import pandas.util.testing as tm
+
+
+@pytest.fixture(
+    params=[
+        ["a", "bb", np.nan, "", "ccc", "abcabc", np.nan],
+        ["äb", "ü", np.nan, "", "日本語", "naïve café", "a€b"],
+    ],
+    ids=["ascii", "unicode"],
+)
+def values(request):
+    return np.array(request.param, dtype=object)
+
+
+def test_constructor():
+    arr = pd.array(["a", None, "bc"], dtype="string")
+    assert isinstance(arr, StringArray)
+    assert arr.dtype == StringDtype()
+    assert arr.dtype == "string"
+    tm.assert_numpy_array_equal(arr._offsets, np.array([0, 1, 1, 3]))
+    tm.assert_numpy_array_equal(arr._mask, np.array([False, True, False]))
+    assert arr._data.tobytes() == b"abc"
+
+    with pytest.raises(ValueError, match="sequence of strings"):
+        pd.array(["a", 1], dtype="string")
+
+    with pytest.raises(TypeError, match="uint8 numpy array"):
+        StringArray(np.array([1, 2]), np.array([0, 1, 2]), np.array([False, False]))
+
+
+def test_round_trip(values):
+    arr = StringArray._from_sequence(values)
+    tm.assert_numpy_array_equal(np.asarray(arr), values)
+    tm.assert_numpy_array_equal(arr.astype(object), values)
+    assert list(arr) == list(values)
+    for i, value in enumerate(values):
+        if isinstance(value, str):
+            assert arr[i] == value
+        else:
+            assert np.isnan(arr[i])
+
+
+def test_slice_shares_buffer(values):
+    arr = StringArray._from_sequence(values)
+    result = arr[2:5]
+    assert result._data is arr._data
+    tm.assert_numpy_array_equal(np.asarray(result), values[2:5])
+
+    # kernels and concatenation handle offsets not starting at zero
+    s = pd.Series(result)
+    expected = pd.Series(values[2:5])
+    tm.assert_series_equal(s.str.len(), expected.str.len())
+
+    result = StringArray._concat_same_type([arr[4:], arr[:3]])
+    expected = np.concatenate([values[4:], values[:3]])
+    tm.assert_numpy_array_equal(np.asarray(result), expected)
+    tm.assert_numpy_array_equal(np.asarray(arr[4:].copy()), values[4:])
+
+
+@pytest.mark.parametrize(
+    "method, args, kwargs",
+    [
+        ("len", [], {}),
+        ("contains", ["b"], {}),
+        ("contains", ["b"], {"na": False}),
+        ("contains", ["bc"], {"regex": False}),
+        ("contains", ["a.c"], {}),
+        ("contains", ["ü"], {}),
+        ("contains", [""], {}),
+        ("startswith", ["a"], {}),
+        ("startswith", ["na"], {"na": False}),
+        ("endswith", ["c"], {}),
+        ("endswith", ["語"], {"na": True}),
+        ("slice", [1, 3], {}),
+        ("slice", [None, None, -1], {}),
+        ("slice", [-3, None, 2], {}),
+        ("slice", [5, 1, -2], {}),
+        ("slice", [-100, 100], {}),
+        ("upper", [], {}),
+        ("lower", [], {}),
+    ],
+)
+def test_string_methods(values, method, args, kwargs):
+    s = pd.Series(values, dtype="string")
+    expected = getattr(pd.Series(values).str, method)(*args, **kwargs)
+
+    result = getattr(s.str, method)(*args, **kwargs)
+    tm.assert_series_equal(result, expected, check_dtype=False)
+    if expected.dtype == object and method not in [
+        "contains",
+        "startswith",
+        "endswith",
+    ]:
+        assert result.dtype == "string"
+
+
+def test_string_methods_all_missing():
+    s = pd.Series([np.nan, np.nan], dtype="string")
+    expected = pd.Series([np.nan, np.nan], dtype=object)
+
+    tm.assert_series_equal(s.str.len(), expected.str.len())
+    tm.assert_series_equal(s.str.startswith("a"), expected.str.startswith("a"))
+
+
+def test_factorize(values):
+    arr = StringArray._from_sequence(values)
+    codes, uniques = arr.factorize()
+    expected_codes, expected_uniques = pd.factorize(values)
+    tm.assert_numpy_array_equal(codes, expected_codes)
+    assert isinstance(uniques, StringArray)
+    tm.assert_numpy_array_equal(np.asarray(uniques), expected_uniques)
+
+    tm.assert_numpy_array_equal(
+        np.asarray(arr.unique()), pd.unique(values), check_dtype=False
+    )
+
+
+def test_groupby(values):
+    df = pd.DataFrame({"key": pd.array(values, dtype="string"), "x": range(7)})
+    result = df.groupby("key").x.sum()
+    expected = pd.DataFrame({"key": values, "x": range(7)}).groupby("key").x.sum()
+    tm.assert_series_equal(result, expected, check_index_type=False)
+
+
+@pytest.mark.parametrize("op", [operator.eq, operator.ne, operator.lt, operator.ge])
+def test_comparison(values, op):
+    arr = StringArray._from_sequence(values)
+    for other in ["bb", "", values[::-1]]:
+        result = op(arr, other)
+        expected = op(pd.Series(values), other).values
+        tm.assert_numpy_array_equal(result, expected)
+
+
+def test_add():
+    arr = pd.array(["a", None, "c"], dtype="string")
+    result = arr + "x"
+    expected = pd.array(["ax", None, "cx"], dtype="string")
+    tm.assert_extension_array_equal(result, expected)
+
+    result = "x" + arr
+    expected = pd.array(["xa", None, "xc"], dtype="string")
+    tm.assert_extension_array_equal(result, expected)
+
+    with pytest.raises(TypeError, match="unsupported operand"):
+        arr - "x"
+
+
+def test_arrow_round_trip():
+    pa = pytest.importorskip("pyarrow", minversion="0.15.0")
+    arr = pd.array(["a", None, "日本語", ""], dtype="string")
+
+    result = pa.array(arr)
+    assert result.type == pa.large_string()
+    assert result.to_pylist() == ["a", None, "日本語", ""]
+
+    data = pa.array(["a", None, "日本語", ""])
+    result = StringDtype().__from_arrow__(data)
+    tm.assert_extension_array_equal(result, arr)
+    # a single chunk is not copied
+    assert np.shares_memory(result._data, np.frombuffer(data.buffers()[2], np.uint8))
+
+    result = StringDtype().__from_arrow__(pa.chunked_array([data[:2], data[2:]]))
+    tm.assert_extension_array_equal(result, arr)
@@ -15,7 +15,7 @@ from pandas.core.dtypes.common import is_bool, is_list_like, is_scalar
 
 import pandas as pd
 from pandas import DataFrame, Series, compat, date_range
-from pandas.core.computation import pytables
+from pandas.core.computation import numba_, pytables
 from pandas.core.computation.check import _NUMEXPR_VERSION
 from pandas.core.computation.engines import NumExprClobberingError, _engines
 import pandas.core.computation.expr as expr
@@ -28,6 +28,7 @@ from pandas.core.computation.ops import (
     _special_case_arith_ops_syms,
     _unary_math_ops,
 )
+from pandas.core.computation.scope import _ensure_scope
 import pandas.util.testing as tm
 from pandas.util.testing import (
     assert_frame_equal,
@@ -38,18 +39,26 @@ from pandas.util.testing import (
     randbool,
 )
 
+_NUMBA_INSTALLED = bool(td.safe_import("numba", "0.46.0"))
+
 
 @pytest.fixture(
     params=(
         pytest.param(
             engine,
-            marks=pytest.mark.skipif(
-                engine == "numexpr" and not _USE_NUMEXPR,
-                reason="numexpr enabled->{enabled}, "
-                "installed->{installed}".format(
-                    enabled=_USE_NUMEXPR, installed=_NUMEXPR_INSTALLED
+            marks=[
+                pytest.mark.skipif(
+                    engine == "numexpr" and not _USE_NUMEXPR,
+                    reason="numexpr enabled->{enabled}, "
+                    "installed->{installed}".format(
+                        enabled=_USE_NUMEXPR, installed=_NUMEXPR_INSTALLED
+                    ),
                 ),
-            ),
+                pytest.mark.skipif(
+                    engine == "numba" and not _NUMBA_INSTALLED,
+                    reason="numba not installed",
+                ),
+            ],
         )
         for engine in _engines
     )
@@ -173,7 +182,9 @@ class TestEvalNumexprPandas:
     def setup_method(self, method):
         self.setup_ops()
         self.setup_data()
-        self.current_engines = filter(lambda x: x != self.engine, _engines)
+        self.current_engines = filter(
+            lambda x: x != self.engine and (x != "numba" or _NUMBA_INSTALLED), _engines
+        )
 
     def teardown_method(self, method):
         del self.lhses, self.rhses, self.scalar_rhses, self.scalar_lhses
@@ -1776,6 +1787,12 @@ class TestMathPythonPython:
         expect = np.sin(df.a + df.b)
         tm.assert_series_equal(got, expect, check_names=False)
 
+    def test_where_function(self):
+        df = DataFrame({"a": np.random.randn(10), "b": np.arange(10)})
+        got = df.eval("where(a > 0, b, -b)", engine=self.engine, parser=self.parser)
+        expect = np.where(df.a > 0, df.b, -df.b)
+        tm.assert_numpy_array_equal(np.asarray(got), expect)
+
     def check_result_type(self, dtype, expect_dtype):
         df = DataFrame({"a": np.random.randn(10).astype(dtype)})
         assert df.a.dtype == dtype
@@ -2019,3 +2036,202 @@ class TestValidate:
         for value in invalid_values:
             with pytest.raises(ValueError):
                 pd.eval("2+2", inplace=value)
+
+
+class TestExprCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        expr._expr_cache.clear()
+        yield
+        expr._expr_cache.clear()
+
+    def test_reuse(self, engine, parser):
+        df = DataFrame({"a": [1, 2, 3], "b": [0.5, 1.5, 2.5]})
+        result = df.eval("a + b * 2", engine=engine, parser=parser)
+        assert len(expr._expr_cache) == 1
+        tm.assert_series_equal(result, df.a + df.b * 2)
+
+        # same dtypes, new values
+        df = DataFrame({"a": [4, 5], "b": [1.0, 3.0]}, index=[5, 6])
+        result = df.eval("a + b * 2", engine=engine, parser=parser)
+        assert len(expr._expr_cache) == 1
+        tm.assert_series_equal(result, df.a + df.b * 2)
+
+        # new dtypes
+        df = df.astype({"a": "int32"})
+        result = df.eval("a + b * 2", engine=engine, parser=parser)
+        assert len(expr._expr_cache) == 2
+        tm.assert_series_equal(result, df.a + df.b * 2)
+
+    def test_reuse_div(self, engine, parser):
+        df = DataFrame({"a": [1, 2, 3], "b": [2, 4, 8]})
+        for _ in range(2):
+            result = df.eval("a / b + 1", engine=engine, parser=parser)
+            tm.assert_series_equal(result, df.a / df.b + 1)
+            df = df * 3
+        assert len(expr._expr_cache) == 1
+
+    def test_reuse_locals(self, engine):
+        df = DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+        for limit in [2, 5]:
+            result = df.query("a + b > @limit", engine=engine)
+            tm.assert_frame_equal(result, df[df.a + df.b > limit])
+        assert len(expr._expr_cache) == 1
+
+    def test_reuse_assignment(self, engine, parser):
+        df = DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+        for _ in range(2):
+            result = df.eval("c = a - b", engine=engine, parser=parser)
+            tm.assert_frame_equal(result, df.assign(c=df.a - df.b))
+        assert len(expr._expr_cache) == 1
+
+    def test_not_cached_when_evaluated(self, engine):
+        # the terms depend on the values of the evaluated parts
+        df = DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+
+        def f(x):
+            return x * 2
+
+        for exp in ["a + @f(b)", "a + b[1]", "a + b.values"]:
+            df.eval(exp, engine=engine)
+            result = (df * 2).eval(exp, engine=engine)
+            expected = (df * 2).eval(exp, engine=engine)
+            tm.assert_equal(result, expected)
+        assert len(expr._expr_cache) == 0
+
+    def test_option(self):
+        df = DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+        with pd.option_context("compute.eval_cache_size", 0):
+            df.eval("a + b")
+            assert len(expr._expr_cache) == 0
+
+        df.eval("a + b")
+        df.eval("a - b")
+        assert len(expr._expr_cache) == 2
+        with pd.option_context("compute.eval_cache_size", 1):
+            assert len(expr._expr_cache) == 1
+            df.eval("a * b")
+            assert len(expr._expr_cache) == 1
+
+
+class TestCompileExpr:
+    def test_eval(self, engine, parser):
+        df = DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+        compiled = pd.compile_expr("a * b", engine=engine, parser=parser)
+        tm.assert_series_equal(compiled(df), df.a * df.b)
+
+        a = np.arange(3)
+        b = 2
+        result = compiled()
+        tm.assert_numpy_array_equal(result, a * b)
+
+    def test_query(self, engine):
+        df = DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+        compiled = pd.compile_expr("a > 1 and b < @limit", engine=engine)
+        limit = 6
+        tm.assert_frame_equal(compiled.query(df), df.iloc[[1]])
+        limit = 7
+        tm.assert_frame_equal(compiled.query(df), df.iloc[1:])
+        assert limit == 7
+
+    @pytest.mark.parametrize(
+        "exp, kwargs, exc",
+        [
+            ("a +", {}, SyntaxError),
+            ("", {}, ValueError),
+            ("a + b", {"parser": "foo"}, KeyError),
+            ("a + b", {"engine": "foo"}, KeyError),
+            (1, {}, ValueError),
+        ],
+    )
+    def test_invalid(self, exp, kwargs, exc):
+        with pytest.raises(exc):
+            pd.compile_expr(exp, **kwargs)
+
+
+@pytest.fixture
+def python_kernel(monkeypatch):
+    # run the kernels of the numba engine as plain python functions
+    def get_eval_kernel(source, engine_kwargs=None):
+        return numba_.exec_kernel_source(source)
+
+    monkeypatch.setattr(numba_, "get_eval_kernel", get_eval_kernel)
+
+
+class TestNumbaEngine:
+    @pytest.fixture
+    def df(self):
+        df = DataFrame(
+            {
+                "a": np.arange(10),
+                "b": np.random.randn(10),
+                "c": date_range("2019", periods=10),
+                "d": list("abcdefghij"),
+            }
+        )
+        df.loc[3, "c"] = pd.NaT
+        return df
+
+    @pytest.mark.parametrize(
+        "exp",
+        [
+            "a + b * 2 - a ** 2",
+            "a / (a - 3) + a // 3 - a % 4",
+            "(a > 2) & (b < 0.5) | ~(a < 5)",
+            "-a + sqrt(a) + arctan2(a, b)",
+            "c > '2019-01-04'",
+            "(c != '2019-01-04') & (a != 5)",
+            "c - c > '1h'",
+            "(d == 'c') & (a > 1)",
+        ],
+    )
+    def test_matches_python(self, python_kernel, df, exp):
+        with np.errstate(all="ignore"):
+            result = df.eval(exp, engine="numba")
+            expected = df.eval(exp, engine="python")
+        tm.assert_series_equal(result, expected, check_names=False)
+
+    def test_query(self, python_kernel, df):
+        limit = pd.Timestamp("2019-01-06")
+        result = df.query("c < @limit and b < 5", engine="numba")
+        tm.assert_frame_equal(result, df[(df.c < limit) & (df.b < 5)])
+
+    def test_where(self, python_kernel, df):
+        result = df.eval("where(a > 4, b, a)", engine="numba")
+        expected = Series(np.where(df.a > 4, df.b, df.a))
+        tm.assert_series_equal(result, expected)
+
+    def test_frames(self, python_kernel):
+        df1 = DataFrame(np.random.randn(5, 3))
+        df2 = DataFrame(np.random.randn(5, 3))
+        s = Series(np.random.randn(3))
+        for exp in ["df1 + df2 * 2 > 0", "df1 * s"]:
+            result = pd.eval(exp, engine="numba")
+            expected = pd.eval(exp, engine="python")
+            tm.assert_frame_equal(result, expected)
+
+    def test_lower_terms(self):
+        df = DataFrame({"a": [1, 2, 3], "b": [4.0, 5.0, 6.0]})
+        env = _ensure_scope(0, resolvers=(df,))
+        parsed = expr.Expr("a * 2 + a * b + 2", engine="numba", env=env)
+        body, args = numba_.lower_terms(parsed.terms)
+        # each column is passed once, each constant separately
+        assert len(args) == 4
+        assert body == "(((a0[i] * s1) + (a0[i] * a2[i])) + s3)"
+
+    def test_not_lowered(self, monkeypatch):
+        # object dtype expressions are evaluated in python space
+        def get_eval_kernel(source, engine_kwargs=None):
+            raise AssertionError("no kernel")
+
+        monkeypatch.setattr(numba_, "get_eval_kernel", get_eval_kernel)
+        df = DataFrame({"a": ["x", "y"], "b": [1, 2]})
+        result = df.eval("a + a", engine="numba")
+        tm.assert_series_equal(result, df.a + df.a)
+
+    @td.skip_if_no("numba", "0.46.0")
+    def test_cache(self, df):
+        pd.core.util.numba_._numba_func_cache.clear()
+        df.eval("a + b > 1", engine="numba")
+        (df * 2).eval("a + b > 3", engine="numba")
+        assert len(pd.core.util.numba_._numba_func_cache) == 1
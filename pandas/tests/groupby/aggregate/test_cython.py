@@ -236,3 +236,19 @@ def test_cython_with_timestamp_and_nat(op, data):
 
     result = df.groupby("a").aggregate(op)
     tm.assert_frame_equal(expected, result)
+
+
+@pytest.mark.parametrize("nthreads", [2, 3, 64])
+@pytest.mark.parametrize(
+    "op", ["sum", "mean", "std", "var", "min", "max", "first", "last", "median"]
+)
+def test_cython_agg_groupby_threads(monkeypatch, nthreads, op):
+    monkeypatch.setattr("pandas.core.groupby.ops._MIN_THREADED_SIZE", 0)
+    df = DataFrame(np.random.randn(1000, 10))
+    df.iloc[::7, 3] = np.nan
+    key = np.random.randint(0, 20, size=len(df))
+
+    expected = df.groupby(key).agg(op)
+    with pd.option_context("compute.groupby_threads", nthreads):
+        result = df.groupby(key).agg(op)
+    tm.assert_frame_equal(result, expected)
@@ -0,0 +1,155 @@
+import numpy as np
+import pytest
+
+import pandas.util._test_decorators as td
+
+from pandas import DataFrame, Series
+import pandas.core.groupby.numba_ as numba_
+import pandas.util.testing as tm
+
+
+def _python_agg(func, args, engine_kwargs):
+    # pure python stand-ins for the compiled kernels, so that the groups
+    # handed to the numba engine can be checked without numba
+    def kernel(values, starts, ends):
+        return np.array(
+            [func(values[s:e], *args) for s, e in zip(starts, ends)], dtype=float
+        )
+
+    return kernel
+
+
+def _python_transform(func, args, engine_kwargs):
+    def kernel(values, starts, ends):
+        result = np.full(len(values), np.nan)
+        for s, e in zip(starts, ends):
+            result[s:e] = func(values[s:e], *args)
+        return result
+
+    return kernel
+
+
+@pytest.fixture
+def python_kernels(monkeypatch):
+    monkeypatch.setattr(numba_, "get_groupby_agg", _python_agg)
+    monkeypatch.setattr(numba_, "get_groupby_transform", _python_transform)
+
+
+@pytest.fixture
+def df():
+    return DataFrame(
+        {
+            "key": ["b", "a", np.nan, "b", "c", "a", "b"],
+            "x": [1.0, 2.0, 3.0, np.nan, 5.0, 6.0, 7.0],
+            "y": np.arange(7),
+            "s": list("abcdefg"),
+        }
+    )
+
+
+def f_agg(x, offset=0):
+    return np.nansum(x) * 2 + offset
+
+
+def f_transform(x, offset=0):
+    return x - np.nanmean(x) + offset
+
+
+@pytest.mark.parametrize("args", [(), (5,)])
+@pytest.mark.parametrize("as_index", [True, False])
+def test_agg_frame(python_kernels, df, args, as_index):
+    grouped = df.groupby("key", as_index=as_index)[["x", "y"]]
+    result = grouped.agg(f_agg, *args, engine="numba")
+    expected = grouped.agg(lambda x: f_agg(x.values, *args))
+    expected["y"] = expected["y"].astype(float)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_agg_frame_skips_non_numeric(python_kernels, df):
+    result = df.groupby("key").agg(f_agg, engine="numba")
+    expected = df[["key", "x", "y"]].groupby("key").agg(f_agg).astype(float)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_agg_series(python_kernels, df):
+    grouped = df.groupby("key")["x"]
+    result = grouped.agg(f_agg, engine="numba")
+    expected = grouped.agg(f_agg)
+    tm.assert_series_equal(result, expected)
+
+
+def test_agg_series_multiple_keys(python_kernels, df):
+    grouped = df.groupby(["key", df["y"] % 2])["x"]
+    result = grouped.agg(f_agg, engine="numba")
+    expected = grouped.agg(f_agg)
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("args", [(), (5,)])
+def test_transform(python_kernels, df, args):
+    df = df.dropna(subset=["key"])
+    grouped = df.groupby("key")
+    result = grouped[["x", "y"]].transform(f_transform, *args, engine="numba")
+    expected = DataFrame(
+        {
+            "x": grouped["x"].transform(f_transform, *args),
+            "y": grouped["y"].transform(f_transform, *args).astype(float),
+        }
+    )
+    tm.assert_frame_equal(result, expected)
+
+    result = grouped["x"].transform(f_transform, *args, engine="numba")
+    tm.assert_series_equal(result, expected["x"])
+
+
+def test_transform_scalar(python_kernels, df):
+    result = df.groupby("key")["x"].transform(f_agg, engine="numba")
+    expected = Series([16.0, 16.0, np.nan, 16.0, 10.0, 16.0, 16.0], name="x")
+    tm.assert_series_equal(result, expected)
+
+
+def test_engine_errors(df):
+    grouped = df.groupby("key")["x"]
+    with pytest.raises(ValueError, match="engine must be either"):
+        grouped.agg(f_agg, engine="foo")
+    with pytest.raises(ValueError, match="cython engine does not accept"):
+        grouped.transform(f_agg, engine_kwargs={"parallel": True})
+    with pytest.raises(ValueError, match="does not support kwargs"):
+        grouped.agg(f_agg, engine="numba", offset=1)
+
+
+def test_axis_1_not_implemented(df):
+    grouped = df[["x", "y"]].groupby([0, 1], axis=1)
+    with pytest.raises(NotImplementedError, match="only supports axis=0"):
+        grouped.agg(f_agg, engine="numba")
+
+
+@td.skip_if_no("numba", "0.46.0")
+@pytest.mark.parametrize("parallel", [True, False])
+def test_numba_vs_cython(df, parallel):
+    df = df.dropna(subset=["key"])
+
+    def g(x):
+        return np.nanmean(x) + 5
+
+    def h(x):
+        return x - np.nanmean(x)
+
+    engine_kwargs = {"parallel": parallel}
+    grouped = df.groupby("key")[["x", "y"]]
+
+    result = grouped.agg(g, engine="numba", engine_kwargs=engine_kwargs)
+    expected = grouped.agg(g)
+    expected["y"] = expected["y"].astype(float)
+    tm.assert_frame_equal(result, expected)
+
+    result = grouped.transform(h, engine="numba", engine_kwargs=engine_kwargs)
+    expected = grouped.transform(lambda x: h(x.astype(float))).astype(float)
+    tm.assert_frame_equal(result, expected)
+
+
+@td.skip_if_no("numba", "0.46.0")
+def test_series_result_dtype():
+    s = Series([1, 2, 3, 4])
+    result = s.groupby([1, 1, 2, 2]).agg(lambda x: x.sum(), engine="numba")
+    tm.assert_series_equal(result, Series([3.0, 7.0], index=[1, 2]))
@@ -0,0 +1,146 @@
+import numpy as np
+import pytest
+
+import pandas as pd
+from pandas import DataFrame, Series, combine_partials
+import pandas.util.testing as tm
+
+
+def _chunks(obj, n):
+    edges = np.linspace(0, len(obj), n + 1).astype(int)
+    return [obj.iloc[start:stop] for start, stop in zip(edges[:-1], edges[1:])]
+
+
+@pytest.fixture
+def df():
+    np.random.seed(1234)
+    df = DataFrame(
+        {
+            "key": np.random.randint(0, 10, 200),
+            "x": np.random.randn(200),
+            "y": np.random.randint(0, 5, 200),
+        }
+    )
+    df.loc[::7, "x"] = np.nan
+    return df
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        "sum",
+        "count",
+        "size",
+        "mean",
+        "var",
+        "std",
+        "min",
+        "max",
+        "first",
+        "last",
+        "nunique",
+        ["sum", "mean", "std", "max"],
+    ],
+)
+@pytest.mark.parametrize("nchunks", [1, 3, 7])
+def test_combine_partials_frame(df, func, nchunks):
+    funcs = func if isinstance(func, list) else [func]
+    partials = [
+        chunk.groupby("key").partial_agg(func) for chunk in _chunks(df, nchunks)
+    ]
+
+    result = combine_partials(partials)
+    expected = DataFrame(
+        {(col, f): getattr(df.groupby("key")[col], f)() for col in "xy" for f in funcs}
+    )
+    tm.assert_frame_equal(result, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("func", ["sum", "mean", "var", "nunique", "last"])
+def test_combine_partials_series(df, func):
+    partials = [chunk.groupby("key")["x"].partial_agg(func) for chunk in _chunks(df, 4)]
+
+    result = combine_partials(partials)
+    expected = df.groupby("key")["x"].agg([func])
+    tm.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_combine_partials_missing_groups():
+    # groups present in only some of the chunks
+    df = DataFrame({"key": ["a", "a", "b", "c", "c", "a"], "x": [1, 2, 3, 4, 5, 6]})
+    partials = [
+        chunk.groupby("key").partial_agg(["mean", "var"])
+        for chunk in [df.iloc[:2], df.iloc[2:3], df.iloc[3:]]
+    ]
+
+    result = combine_partials(partials)
+    expected = df.groupby("key").agg(["mean", "var"])
+    tm.assert_frame_equal(result, expected)
+
+
+def test_combine_partials_multiple_keys(df):
+    df["key2"] = df["y"] % 2
+    partials = [
+        chunk.groupby(["key", "key2"]).partial_agg(["sum", "std"])
+        for chunk in _chunks(df, 3)
+    ]
+
+    result = combine_partials(partials)
+    expected = df.groupby(["key", "key2"]).agg(["sum", "std"])
+    tm.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_combine_partials_not_finalized(df):
+    chunks = _chunks(df, 4)
+    partials = [chunk.groupby("key").partial_agg(["mean", "std"]) for chunk in chunks]
+
+    # combining in a tree gives the same result as combining all at once
+    left = combine_partials(partials[:2], finalize=False)
+    right = combine_partials(partials[2:], finalize=False)
+    result = combine_partials([left, right])
+    expected = combine_partials(partials)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_partial_agg_drops_nuisance_columns():
+    df = DataFrame({"key": [1, 1, 2], "x": [1.0, 2.0, 3.0], "s": ["a", "b", "c"]})
+    result = df.groupby("key").partial_agg(["mean", "first"])
+
+    assert ("x", "mean", "sum") in result
+    assert ("s", "first", "first") in result
+    assert ("s", "mean", "sum") not in result
+
+
+def test_partial_agg_invalid():
+    gb = Series([1, 2]).groupby([0, 1])
+
+    with pytest.raises(ValueError, match="not supported for 'median'"):
+        gb.partial_agg("median")
+
+    with pytest.raises(ValueError, match="requires as_index=True"):
+        DataFrame({"a": [1], "b": [2]}).groupby("a", as_index=False).partial_agg("sum")
+
+    with pytest.raises(ValueError, match="No partial aggregations"):
+        combine_partials([])
+
+
+def test_combine_partials_empty_chunk(df):
+    partials = [
+        chunk.groupby("key").partial_agg("mean")
+        for chunk in [df.iloc[:0], df, df.iloc[:0]]
+    ]
+    result = combine_partials(partials)
+    expected = df.groupby("key").agg(["mean"])
+    tm.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_combine_partials_read_csv_chunks(df):
+    with tm.ensure_clean() as path:
+        df.to_csv(path, index=False)
+        reader = pd.read_csv(path, chunksize=33)
+        result = combine_partials(
+            chunk.groupby("key").partial_agg(["count", "mean"]) for chunk in reader
+        )
+
+    expected = df.groupby("key").agg(["count", "mean"])
+    tm.assert_frame_equal(result, expected, check_dtype=False)
@@ -1319,3 +1319,134 @@ def test_make_block_no_pandas_array():
     result = make_block(arr.to_numpy(), slice(len(arr)), dtype=arr.dtype)
     assert result.is_integer is True
     assert result.is_extension is False
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        lambda df: df.copy(),
+        lambda df: df.rename(columns=str.upper),
+        lambda df: df.set_axis(list("abcde"), axis=0, inplace=False),
+        lambda df: df.reset_index(drop=True),
+        lambda df: df.reindex(df.index),
+    ],
+)
+def test_copy_on_write_shares_values(method):
+    df = DataFrame({"a": [1.0, 2.0, 3.0, 4.0, 5.0], "b": list("abcde")})
+    with pd.option_context("mode.copy_on_write", True):
+        result = method(df)
+    assert np.shares_memory(result.iloc[:, 0].values, df["a"].values)
+
+    with pd.option_context("mode.copy_on_write", False):
+        result = method(df)
+    assert not np.shares_memory(result.iloc[:, 0].values, df["a"].values)
+
+
+def _replace_list_inplace(df, new):
+    if not isinstance(new, float):
+        pytest.skip("replacing a list of datetimelike values is not supported")
+    df.replace(list(df["a"][:2]), [new, new], inplace=True)
+
+
+@pytest.mark.parametrize(
+    "setter",
+    [
+        lambda df, new: df.iloc.__setitem__((0, 0), new),
+        lambda df, new: df.loc.__setitem__((0, "a"), new),
+        lambda df, new: df.iat.__setitem__((0, 0), new),
+        lambda df, new: df.at.__setitem__((0, "a"), new),
+        lambda df, new: df.__setitem__("a", Series([new] * 3)),
+        lambda df, new: df.fillna({"a": new}, inplace=True),
+        lambda df, new: df.replace(df.iat[0, 0], new, inplace=True),
+        lambda df, new: _replace_list_inplace(df, new),
+        lambda df, new: df.update(DataFrame({"a": [new]})),
+    ],
+)
+@pytest.mark.parametrize(
+    "values, new",
+    [
+        ([1.0, 2.0, np.nan], 100.0),
+        (
+            pd.to_datetime(["2000-01-01", "2000-01-02", None]),
+            pd.Timestamp("1999-01-01"),
+        ),
+        (pd.to_timedelta([1, 2, None], unit="s"), pd.Timedelta("1 day")),
+    ],
+)
+@pytest.mark.parametrize("modify_copy", [True, False])
+def test_copy_on_write_copies_on_modification(setter, values, new, modify_copy):
+    df = DataFrame({"a": values, "b": [1, 2, 3], "c": list("abc")})
+    expected = df.copy()
+
+    with pd.option_context("mode.copy_on_write", True):
+        result = df.copy()
+        if modify_copy:
+            setter(result, new)
+            assert not result.equals(expected)
+            tm.assert_frame_equal(df, expected)
+        else:
+            setter(df, new)
+            assert not df.equals(expected)
+            tm.assert_frame_equal(result, expected)
+
+
+def test_copy_on_write_series():
+    s = Series([1.0, 2.0, 3.0])
+    with pd.option_context("mode.copy_on_write", True):
+        assert np.shares_memory(s.astype("float64").values, s.values)
+        result = s.copy()
+        result[0] = 10.0
+        s.iloc[1] = 20.0
+        s.at[2] = 30.0
+    tm.assert_series_equal(s, Series([1.0, 20.0, 30.0]))
+    tm.assert_series_equal(result, Series([10.0, 2.0, 3.0]))
+
+    # a column viewing shared values is copied as well
+    df = DataFrame({"a": [1.0, 2.0]})
+    with pd.option_context("mode.copy_on_write", True):
+        result = df.copy()
+        column = result["a"]
+        column.values  # the cached column views the shared values
+        result.iat[0, 0] = 10.0
+    tm.assert_frame_equal(df, DataFrame({"a": [1.0, 2.0]}))
+    assert result["a"][0] == 10.0
+
+
+@pytest.mark.parametrize(
+    "getter",
+    [lambda obj: obj.values, lambda obj: obj.to_numpy(), lambda obj: np.asarray(obj)],
+)
+def test_copy_on_write_values_are_read_only(getter):
+    # the arrays handed out can't modify the data shared with a copy
+    df = DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+    with pd.option_context("mode.copy_on_write", True):
+        result = df.copy()
+    for obj in [df, result, df["a"], result["a"]]:
+        arr = getter(obj)
+        assert not arr.flags.writeable
+        with pytest.raises(ValueError, match="read-only"):
+            arr[0] = 100.0
+    tm.assert_frame_equal(result, df)
+    assert result.to_numpy(copy=True).flags.writeable
+
+    # writeable again once the memory isn't shared anymore
+    result.iat[0, 0] = 100.0
+    assert getter(result).flags.writeable
+    assert getter(result["a"]).flags.writeable
+
+
+def test_copy_on_write_series_array_is_read_only():
+    s = Series([1.0, 2.0])
+    with pd.option_context("mode.copy_on_write", True):
+        result = s.copy()
+    with pytest.raises(ValueError, match="read-only"):
+        s.array[0] = 100.0
+    tm.assert_series_equal(result, Series([1.0, 2.0]))
+
+
+def test_copy_on_write_slice_is_copied():
+    # a copy of a part of the data doesn't keep the rest alive
+    df = DataFrame(np.ones((10, 2)))
+    with pd.option_context("mode.copy_on_write", True):
+        result = df.iloc[:5].copy()
+    assert not np.shares_memory(result.values, df.values)
@@ -555,3 +555,42 @@ z
             assert len(zp.filelist) == 1
             archived_file = os.path.basename(zp.filelist[0].filename)
             assert archived_file == expected_arcname
+
+    @pytest.mark.parametrize("num_threads", [1, 2, 3])
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"float_format": "%.3f", "na_rep": "NULL"},
+            {"index": False, "quoting": 1},
+            {"date_format": "%Y%m%d", "decimal": ","},
+        ],
+    )
+    def test_to_csv_num_threads(self, num_threads, kwargs):
+        df = DataFrame(
+            {
+                "a": np.random.randn(100),
+                "b": np.arange(100),
+                "c": pd.date_range("2019-01-01", periods=100),
+                "d": ["x", "y", None, 'q"uote'] * 25,
+            },
+            index=pd.MultiIndex.from_product([range(10), list("abcdefghij")]),
+        )
+        df.iloc[::7, 0] = np.nan
+
+        expected = df.to_csv(chunksize=7, **kwargs)
+        result = df.to_csv(chunksize=7, num_threads=num_threads, **kwargs)
+        assert result == expected
+
+    def test_to_csv_num_threads_compression(self, compression_only):
+        df = DataFrame({"a": np.random.randn(50), "b": np.arange(50)})
+        with tm.ensure_clean() as path:
+            df.to_csv(path, compression=compression_only, chunksize=3, num_threads=4)
+            result = pd.read_csv(path, index_col=0, compression=compression_only)
+        tm.assert_frame_equal(result, df)
+
+    @pytest.mark.parametrize("num_threads", [0, 1.5, "2"])
+    def test_to_csv_num_threads_invalid(self, num_threads):
+        df = DataFrame({"a": [1, 2]})
+        with pytest.raises(ValueError, match="'num_threads' must be an integer >=1"):
+            df.to_csv(num_threads=num_threads)
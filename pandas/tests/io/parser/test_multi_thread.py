@@ -2,10 +2,11 @@
 Tests multithreading behaviour for reading and
 parsing files for each parser defined in parsers.py
 """
-from io import BytesIO
+from io import BytesIO, StringIO
 from multiprocessing.pool import ThreadPool
 
 import numpy as np
+import pytest
 
 import pandas as pd
 from pandas import DataFrame
@@ -144,3 +145,98 @@ def test_multi_thread_path_multipart_read_csv(all_parsers):
             parser, path, num_rows, num_tasks
         )
         tm.assert_frame_equal(df, final_dataframe)
+
+
+@pytest.mark.parametrize("num_threads", [2, 4, 7])
+def test_num_threads_path(c_parser_only, num_threads):
+    parser = c_parser_only
+    df = _construct_dataframe(10000)
+
+    with tm.ensure_clean("__num_threads__.csv") as path:
+        df.to_csv(path)
+
+        expected = parser.read_csv(path, index_col=0, parse_dates=["date"])
+        result = parser.read_csv(
+            path, index_col=0, parse_dates=["date"], num_threads=num_threads
+        )
+        tm.assert_frame_equal(result, expected)
+
+
+def test_num_threads_quoted_newlines(c_parser_only):
+    parser = c_parser_only
+    rows = ['{i},"line one\nline ""two"", {i}",{i}.5'.format(i=i) for i in range(500)]
+    data = "a,b,c\n" + "\n".join(rows) + "\n"
+
+    expected = parser.read_csv(StringIO(data))
+    result = parser.read_csv(StringIO(data), num_threads=4)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_num_threads_reconcile_dtypes(c_parser_only):
+    # blocks infer int, float, bool and object for the same columns
+    parser = c_parser_only
+    a = [str(i) for i in range(300)] + ["1.5"] + [str(i) for i in range(300)]
+    b = [str(i) for i in range(300)] + ["x"] + [str(i) for i in range(300)]
+    c = ["True"] * 300 + [""] + ["False"] * 300
+    d = ["u"] * 300 + ["v"] + ["w"] * 300
+    data = "a,b,c,d\n" + "\n".join(",".join(row) for row in zip(a, b, c, d))
+
+    expected = parser.read_csv(StringIO(data), dtype={"d": "category"})
+    result = parser.read_csv(StringIO(data), dtype={"d": "category"}, num_threads=3)
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "data, kwargs",
+    [
+        ("a,b\n" + "2019-01-01,1\n" * 100 + "x,2\n" * 100, {"parse_dates": ["a"]}),
+        ("a,b\n" + "1,1\n" * 100 + "x,2\n" * 100, {"converters": {"a": str.strip}}),
+    ],
+)
+def test_num_threads_reconcile_converted(c_parser_only, data, kwargs):
+    # the blocks convert the column differently, the whole column is
+    # converted at once instead
+    parser = c_parser_only
+
+    expected = parser.read_csv(StringIO(data), **kwargs)
+    result = parser.read_csv(StringIO(data), num_threads=2, **kwargs)
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("data", ["a,b\n", "a,b\n1,2\n"])
+@pytest.mark.parametrize("num_threads", [2, 4])
+def test_num_threads_fallback_buffer(c_parser_only, data, num_threads):
+    # input that isn't split is read again from the start of the buffer
+    parser = c_parser_only
+    expected = parser.read_csv(StringIO(data))
+    result = parser.read_csv(StringIO(data), num_threads=num_threads)
+    tm.assert_frame_equal(result, expected)
+
+    result = parser.read_csv(BytesIO(data.encode()), num_threads=num_threads)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_num_threads_squeeze_and_header_none(c_parser_only):
+    parser = c_parser_only
+    data = "\n".join(str(i) for i in range(1000))
+
+    expected = parser.read_csv(StringIO(data), header=None, squeeze=True)
+    result = parser.read_csv(StringIO(data), header=None, squeeze=True, num_threads=3)
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("num_threads", [0, -1, 1.5])
+def test_num_threads_invalid(c_parser_only, num_threads):
+    parser = c_parser_only
+    msg = "'num_threads' must be an integer >=1"
+
+    with pytest.raises(ValueError, match=msg):
+        parser.read_csv(StringIO("a\n1"), num_threads=num_threads)
+
+
+def test_num_threads_python_engine(python_parser_only):
+    parser = python_parser_only
+    msg = "The 'num_threads' option is not supported with the 'python' engine"
+
+    with pytest.raises(ValueError, match=msg):
+        parser.read_csv(StringIO("a\n1\n2"), num_threads=2)
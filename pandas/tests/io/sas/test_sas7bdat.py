@@ -139,6 +139,40 @@ def test_encoding_options(datapath):
         assert x == y.decode()
 
 
+def test_text_options(datapath):
+    from pandas.io.sas.sas7bdat import SAS7BDATReader
+
+    fname = datapath("io", "sas", "data", "test1.sas7bdat")
+    expected = pd.read_sas(fname, encoding="utf-8")
+    text_cols = ["Column2", "Column18", "Column94"]
+
+    rdr = SAS7BDATReader(fname, encoding="utf-8", blank_missing=False)
+    df = rdr.read()
+    rdr.close()
+    for col in text_cols:
+        tm.assert_series_equal(df[col].replace("", np.nan), expected[col])
+
+    rdr = SAS7BDATReader(fname, encoding="utf-8", convert_text=False)
+    df = rdr.read()
+    rdr.close()
+    for col in text_cols:
+        assert df[col].isna().equals(expected[col].isna())
+        tm.assert_series_equal(df[col].str.decode("utf-8"), expected[col])
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 100])
+def test_chunks_compressed(datapath, chunksize):
+    # test12 and test14 are rle and rdc compressed, the decompressed row is
+    # reused between rows and chunks
+    for k in [12, 14]:
+        fname = datapath("io", "sas", "data", "test{k}.sas7bdat".format(k=k))
+        expected = pd.read_sas(fname, encoding="utf-8")
+        rdr = pd.read_sas(fname, encoding="utf-8", chunksize=chunksize)
+        result = pd.concat(list(rdr))
+        rdr.close()
+        tm.assert_frame_equal(result, expected)
+
+
 def test_productsales(datapath):
     fname = datapath("io", "sas", "data", "productsales.sas7bdat")
     df = pd.read_sas(fname, encoding="utf-8")
@@ -0,0 +1,100 @@
+""" test the native block format """
+import numpy as np
+import pytest
+
+import pandas as pd
+import pandas.util.testing as tm
+from pandas.util.testing import assert_frame_equal, ensure_clean
+
+from pandas.io.blocks import to_blocks
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "int": np.arange(5),
+            "uint": np.arange(5).astype("u1"),
+            "float": [1.0, np.nan, 3.0, 4.0, 5.0],
+            "float2": np.arange(5.0, dtype="f4"),
+            "bool": [True, False, True, True, False],
+            "string": list("abcde"),
+            "cat": pd.Categorical(list("aabbc")),
+            "dt": pd.date_range("20130101", periods=5),
+            "dttz": pd.date_range("20130101", periods=5, tz="US/Eastern"),
+            "td": pd.timedelta_range("1 day", periods=5),
+            "nullable": pd.array([1, None, 3, 4, 5], dtype="Int64"),
+        },
+        index=pd.Index(list("vwxyz"), name="idx"),
+    )
+
+
+def check_round_trip(df, **kwargs):
+    with ensure_clean() as path:
+        df.to_blocks(path)
+        result = pd.read_blocks(path, **kwargs)
+        assert_frame_equal(result, df)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_round_trip(df, mmap):
+    check_round_trip(df, mmap=mmap)
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame(),
+        pd.DataFrame({"a": []}),
+        pd.DataFrame(index=range(3)),
+        pd.DataFrame(np.random.randn(4, 3), columns=["a", "a", "b"]),
+        pd.DataFrame(
+            np.arange(6).reshape(3, 2),
+            columns=pd.MultiIndex.from_tuples([("a", 1), ("b", 2)]),
+            index=pd.date_range("2019", periods=3, freq="H"),
+        ),
+    ],
+)
+def test_round_trip_axes(df):
+    check_round_trip(df)
+
+
+def test_round_trip_unconsolidated():
+    df = pd.DataFrame({"a": [1.0, 2.0]})
+    df["b"] = [3.0, 4.0]
+    df["c"] = [1, 2]
+    assert not df._data.is_consolidated()
+    check_round_trip(df)
+
+
+def test_mmap_read_only():
+    df = pd.DataFrame({"a": np.arange(10.0), "b": np.arange(10)})
+    with ensure_clean() as path:
+        df.to_blocks(path)
+
+        result = pd.read_blocks(path)
+        assert not result["a"].values.flags.writeable
+        with pytest.raises(ValueError, match="read-only"):
+            result.iloc[0, 0] = 100
+
+        result = pd.read_blocks(path, mmap=False)
+        result.iloc[0, 0] = 100
+        assert result.iloc[0, 0] == 100
+
+
+def test_error():
+    for obj in [pd.Series([1, 2, 3]), 1, np.array([1, 2, 3])]:
+        with pytest.raises(ValueError, match="only supports IO with DataFrames"):
+            with ensure_clean() as path:
+                to_blocks(obj, path)
+
+    with ensure_clean() as path:
+        with open(path, "wb") as f:
+            f.write(b"not a block file")
+        with pytest.raises(ValueError, match="not a block format file"):
+            pd.read_blocks(path)
+
+
+def test_path_pathlib(df):
+    result = tm.round_trip_pathlib(df.to_blocks, pd.read_blocks)
+    assert_frame_equal(df, result)
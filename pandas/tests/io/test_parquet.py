@@ -13,7 +13,9 @@ from pandas.util import testing as tm
 
 from pandas.io.parquet import (
     FastParquetImpl,
+    ParquetFilter,
     PyArrowImpl,
+    _iter_chunks,
     get_engine,
     read_parquet,
     to_parquet,
@@ -401,6 +403,174 @@ class TestBasic(Base):
         check_round_trip(df, engine, write_kwargs=write_kwargs, expected=expected)
 
 
+class TestRowGroups(Base):
+    @pytest.fixture
+    def df(self):
+        return pd.DataFrame(
+            {"a": np.arange(10), "b": list("aabbccddee"), "c": np.arange(10.0) / 2,}
+        )
+
+    def write(self, df, path, engine):
+        # three rows per row group
+        if engine == "pyarrow":
+            kwargs = {"row_group_size": 3}
+        else:
+            kwargs = {"row_group_offsets": 3}
+        df.to_parquet(path, engine, compression=None, **kwargs)
+
+    @pytest.mark.parametrize(
+        "filters, expected",
+        [
+            ("a > 6", [7, 8, 9]),
+            ("a >= 2 & a < 4", [2, 3]),
+            ("b in ['a', 'e'] | c == 3", [0, 1, 6, 8, 9]),
+            ("~(a < 8)", [8, 9]),
+            ("4 < a", [5, 6, 7, 8, 9]),
+            ("a > 100", []),
+        ],
+    )
+    def test_filters(self, df, engine, filters, expected):
+        with tm.ensure_clean() as path:
+            self.write(df, path, engine)
+            result = read_parquet(path, engine, filters=filters)
+        tm.assert_frame_equal(result, df.iloc[expected])
+
+    def test_filters_missing_values(self, engine):
+        # the row group [5.0, 5.0, nan] has min == max == 5 but its missing
+        # value matches
+        df = pd.DataFrame({"a": [1.0, 2.0, 3.0, 5.0, 5.0, np.nan]})
+        with tm.ensure_clean() as path:
+            self.write(df, path, engine)
+            result = read_parquet(path, engine, filters="a != 5")
+        tm.assert_frame_equal(result, df.iloc[[0, 1, 2, 5]])
+
+    def test_filters_columns(self, df, engine):
+        threshold = 6
+        with tm.ensure_clean() as path:
+            self.write(df, path, engine)
+            result = read_parquet(path, engine, columns=["c"], filters="a > @threshold")
+        expected = df.loc[df["a"] > threshold, ["c"]]
+        tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize("chunksize", [1, 2, 3, 4, 100])
+    def test_chunksize(self, df, engine, chunksize):
+        with tm.ensure_clean() as path:
+            self.write(df, path, engine)
+            chunks = list(read_parquet(path, engine, chunksize=chunksize))
+        assert all(len(chunk) == chunksize for chunk in chunks[:-1])
+        result = pd.concat(chunks)
+        tm.assert_frame_equal(result, df)
+
+    def test_chunksize_filters(self, df, engine):
+        with tm.ensure_clean() as path:
+            self.write(df, path, engine)
+            chunks = list(read_parquet(path, engine, chunksize=2, filters="a > 2"))
+        assert [len(chunk) for chunk in chunks] == [2, 2, 2, 1]
+        result = pd.concat(chunks)
+        tm.assert_frame_equal(result, df.iloc[3:])
+
+    @pytest.mark.parametrize("chunksize", [0, 1.5, "a"])
+    def test_invalid_chunksize(self, df, engine, chunksize):
+        with tm.ensure_clean() as path:
+            self.write(df, path, engine)
+            with pytest.raises(ValueError, match="'chunksize' must be an integer"):
+                read_parquet(path, engine, chunksize=chunksize)
+
+    def test_unknown_column(self, df, engine):
+        with tm.ensure_clean() as path:
+            self.write(df, path, engine)
+            with pytest.raises(ValueError, match="refers to unknown columns"):
+                read_parquet(path, engine, filters="d > 1")
+
+
+class TestParquetFilter:
+    def make(self, expr, columns=("a", "b", "c d")):
+        filters = ParquetFilter(expr, level=1)
+        filters.bind(list(columns))
+        return filters
+
+    @pytest.mark.parametrize(
+        "expr",
+        [
+            "a > 1",
+            "a > 1 & b == 'x'",
+            "a > 1 and b == 'x' or a < 0",
+            "~(a > 1) | (b != 'y')",
+            "not a in [1, 2]",
+            "b not in ('x', 'y')",
+            "1 < a <= 3",
+            "`c d` >= 2",
+        ],
+    )
+    def test_mask(self, expr):
+        df = pd.DataFrame(
+            {"a": [0, 1, 2, 3, np.nan], "b": list("xyzxy"), "c d": np.arange(5)}
+        )
+        result = self.make(expr).mask(df)
+        expected = df.eval(expr).values
+        tm.assert_numpy_array_equal(result, expected)
+
+    def test_mask_index_level(self):
+        df = pd.DataFrame({"a": [1, 2, 3]}, index=pd.Index([4, 5, 6], name="b"))
+        result = self.make("b > 4").mask(df)
+        tm.assert_numpy_array_equal(result, np.array([False, True, True]))
+
+    def test_local(self):
+        values = [1, 2]
+        filters = self.make("a in @values")
+        assert filters.to_conjunction() == [("a", "in", [1, 2])]
+
+    @pytest.mark.parametrize(
+        "expr, statistics, expected",
+        [
+            ("a == 5", {"a": (0, 4, 0)}, False),
+            ("a == 5", {"a": (0, 5, 0)}, True),
+            ("a == 5", {"a": (None, None, 0)}, True),
+            ("a == 5", {}, True),
+            ("a != 5", {"a": (5, 5, 0)}, False),
+            ("a < 5", {"a": (5, 9, 0)}, False),
+            ("a <= 5", {"a": (5, 9, 0)}, True),
+            ("a > 5", {"a": (0, 5, 0)}, False),
+            ("a >= 5", {"a": (0, 5, 0)}, True),
+            ("5 > a", {"a": (5, 9, 0)}, False),
+            ("a in [1, 10]", {"a": (2, 9, 0)}, False),
+            ("a != 5", {"a": (5, 5, 1)}, True),
+            ("a != 5", {"a": (5, 5, None)}, True),
+            ("a not in [1]", {"a": (1, 1, 0)}, False),
+            ("a not in [1]", {"a": (1, 1, 2)}, True),
+            ("a > 5 & b == 'x'", {"a": (6, 9, 0), "b": ("y", "z", 0)}, False),
+            ("a > 5 | b == 'x'", {"a": (0, 5, 0), "b": ("a", "z", 0)}, True),
+            ("~(a < 5)", {"a": (0, 4, 0)}, False),
+            ("~(a < 5)", {"a": (0, 4, 1)}, True),
+            ("~(a < 5 | a > 8)", {"a": (0, 4, 0)}, False),
+            ("b == 'x'", {"b": (b"a", b"z", 0)}, True),
+        ],
+    )
+    def test_may_match(self, expr, statistics, expected):
+        assert self.make(expr).may_match(statistics) is expected
+
+    def test_to_conjunction(self):
+        filters = self.make("a > 1 & (b == 'x' | a < 0) & `c d` in [1]")
+        assert filters.to_conjunction() == [("a", ">", 1), ("c d", "in", [1])]
+        assert self.make("a > 1 | a < 0").to_conjunction() == []
+
+    @pytest.mark.parametrize("expr", ["a + 1 > 2", "a > b", "a", "f(a) > 1", "a > c"])
+    def test_unsupported(self, expr):
+        with pytest.raises(ValueError, match="unsupported parquet filter"):
+            self.make(expr)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="invalid parquet filter"):
+            self.make("a >")
+        with pytest.raises(ValueError, match="refers to unknown columns"):
+            self.make("e > 1")
+
+    def test_iter_chunks(self):
+        frames = [pd.DataFrame({"a": range(n)}) for n in [3, 0, 1, 4]]
+        result = [len(df) for df in _iter_chunks(frames, 3)]
+        assert result == [3, 3, 2]
+
+
 class TestParquetPyArrow(Base):
     def test_basic(self, pa, df_full):
 
@@ -852,6 +852,16 @@ class _TestSQLApi(PandasSQLTest):
         )
         tm.assert_frame_equal(df, result, check_index_type=True)
 
+    def test_to_sql_index_values(self):
+        index = MultiIndex.from_arrays(
+            [[1.5, np.nan, 3.0], ["x", None, "z"]], names=["A", "B"]
+        )
+        df = DataFrame({"C": [1, 2, 3], "D": [0.5, np.nan, 1.5]}, index=index)
+        df.to_sql("test_index_values", self.conn)
+        result = sql.read_sql_query("SELECT * FROM test_index_values", self.conn)
+        expected = df.reset_index()
+        tm.assert_frame_equal(result, expected)
+
     def test_integer_col_names(self):
         df = DataFrame([[1, 2], [3, 4]], columns=[0, 1])
         sql.to_sql(df, "test_frame_integer_col_names", self.conn, if_exists="replace")
@@ -916,6 +926,50 @@ class _TestSQLApi(PandasSQLTest):
 
             tm.assert_frame_equal(res1, res3)
 
+    def test_read_sql_query_dtype(self):
+        df = DataFrame(
+            {"a": [1, 2, None, 4, 5], "b": ["x", None, "z", "w", "v"], "c": range(5)}
+        )
+        df.to_sql("test_dtype", self.conn, index=False)
+        query = "SELECT * FROM test_dtype"
+
+        result = sql.read_sql_query(query, self.conn, dtype={"a": "Int64"})
+        expected = df.astype({"a": "Int64"})
+        tm.assert_frame_equal(result, expected)
+
+        result = sql.read_sql_query(query, self.conn, dtype={"c": np.float32})
+        expected = df.astype({"c": np.float32})
+        tm.assert_frame_equal(result, expected)
+
+        query_numeric = "SELECT a, c FROM test_dtype"
+        result = sql.read_sql_query(query_numeric, self.conn, dtype="float64")
+        expected = df[["a", "c"]].astype("float64")
+        tm.assert_frame_equal(result, expected)
+
+        # each chunk gets the dtype, and the buffer reused between chunks
+        # doesn't leak into the returned frames
+        chunks = list(
+            sql.read_sql_query(query, self.conn, chunksize=2, dtype={"a": "Int64"})
+        )
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        result = concat(chunks, ignore_index=True)
+        expected = df.astype({"a": "Int64"})
+        tm.assert_frame_equal(result, expected)
+        assert chunks[0]["b"].tolist() == ["x", None]
+
+    def test_read_sql_query_empty(self):
+        df = DataFrame({"a": [1.5], "b": ["x"]})
+        df.to_sql("test_empty", self.conn, index=False)
+        query = "SELECT * FROM test_empty WHERE a > 2"
+
+        result = sql.read_sql_query(query, self.conn)
+        expected = df.iloc[:0].astype(object)
+        tm.assert_frame_equal(result, expected)
+
+        result = sql.read_sql_query(query, self.conn, dtype={"a": "float64"})
+        expected = expected.astype({"a": "float64"})
+        tm.assert_frame_equal(result, expected)
+
     def test_categorical(self):
         # GH8624
         # test that categorical gets written correctly as dense column
@@ -1300,6 +1354,9 @@ class _TestSQLAlchemy(SQLAlchemyMixIn, PandasSQLTest):
     def test_to_sql_method_multi(self):
         self._to_sql(method="multi")
 
+    def test_to_sql_method_copy(self):
+        self._to_sql(method="copy")
+
     def test_to_sql_method_callable(self):
         self._to_sql_method_callable()
 
@@ -2068,6 +2125,23 @@ class _TestPostgreSQLAlchemy:
         result = sql.read_sql_table("test_copy_insert", self.conn)
         tm.assert_frame_equal(result, expected)
 
+    def test_copy_insertion_method(self):
+        expected = DataFrame(
+            {
+                "col1": [1.5, np.nan, 3.0, 4.0],
+                "col2": ["a", None, "", "d"],
+                "col3": ['quote"d', "comma,", "new\nline", "\\N"],
+                "col4": pd.to_datetime(
+                    ["2019-01-01", None, "2019-01-03 12:00", "2019-01-04"]
+                ),
+                "col5": [True, False, True, False],
+            },
+            index=Index([10, 20, 30, 40], name="idx"),
+        )
+        expected.to_sql("test_copy_insert", self.conn, method="copy", chunksize=2)
+        result = sql.read_sql_table("test_copy_insert", self.conn, index_col="idx")
+        tm.assert_frame_equal(result, expected)
+
 
 @pytest.mark.single
 @pytest.mark.db
@@ -2155,6 +2229,9 @@ class TestSQLiteFallback(SQLiteMixIn, PandasSQLTest):
     def test_to_sql_append(self):
         self._to_sql_append()
 
+    def test_to_sql_method_copy(self):
+        self._to_sql(method="copy")
+
     def test_create_and_drop_table(self):
         temp_frame = DataFrame(
             {"one": [1.0, 2.0, 3.0, 4.0], "two": [4.0, 3.0, 2.0, 1.0]}
@@ -1570,3 +1570,68 @@ def test_get_timestamp_range_edges(first, last, offset, exp_first, exp_last):
     result = _get_timestamp_range_edges(first, last, offset)
     expected = (exp_first, exp_last)
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    "freq, kwargs",
+    [
+        ("8min", {}),
+        ("90s", {"base": 3}),
+        ("H", {"closed": "right", "label": "right"}),
+        ("D", {}),
+        ("W", {}),
+        ("30min", {"loffset": "1s"}),
+    ],
+)
+@pytest.mark.parametrize("func", ["sum", "mean", "ohlc", "count", ["min", "max"]])
+def test_resample_stream(freq, kwargs, func):
+    # the bins emitted chunk by chunk are those of the whole data
+    rng = np.random.RandomState(0)
+    seconds = np.sort(rng.randint(0, 10 * 86400, 500)).astype("m8[s]")
+    index = DatetimeIndex(np.datetime64("2019-01-01") + seconds)
+    df = DataFrame({"A": rng.randn(500), "B": rng.randint(0, 9, 500)}, index=index)
+
+    expected = df.resample(freq, **kwargs).agg(func)
+
+    stream = df[:37].resample(freq, **kwargs).stream(func)
+    parts = [stream.update(df[i : i + 41]) for i in range(37, len(df), 41)]
+    result = pd.concat(parts + [stream.close()])
+    assert_frame_equal(result, expected)
+
+
+def test_resample_stream_series_tz():
+    index = date_range("2019-03-30", "2019-04-01", freq="7min", tz="Europe/London")
+    s = Series(np.arange(len(index)), index=index)
+    expected = s.resample("30min").max()
+
+    stream = s[:0].resample("30min").stream("max")
+    parts = [stream.update(s[i : i + 50]) for i in range(0, len(s), 50)]
+    result = pd.concat(parts + [stream.close()])
+    assert_series_equal(result, expected)
+
+    # the last bin is not emitted before the stream is closed
+    stream = s[:3].resample("30min").stream("max")
+    assert len(stream.update(s[3:5])) == 0
+    result = stream.close()
+    assert_series_equal(result, expected[:1])
+
+
+def test_resample_stream_invalid():
+    s = Series(range(5), index=date_range("2019-01-01", periods=5, freq="min"))
+
+    with pytest.raises(NotImplementedError, match="divides a day"):
+        s.resample("7min").stream("sum")
+    with pytest.raises(NotImplementedError, match="divides a day"):
+        s.resample("2D").stream("sum")
+    with pytest.raises(NotImplementedError, match="kind='period'"):
+        s.resample("min", kind="period").stream("sum")
+
+    stream = s.resample("2min").stream("sum")
+    with pytest.raises(ValueError, match="sorted by time"):
+        stream.update(s[::-1])
+    with pytest.raises(ValueError, match="follow the previous chunk"):
+        stream.update(s)
+    with pytest.raises(TypeError, match="must be a Series"):
+        stream.update(s.to_frame())
+    with pytest.raises(TypeError, match="DatetimeIndex"):
+        stream.update(s.reset_index(drop=True))
@@ -565,3 +565,44 @@ def test_agg_with_datetime_index_list_agg_func(col_name):
         columns=pd.MultiIndex(levels=[[col_name], ["mean"]], codes=[[0], [0]]),
     )
     assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "funcs",
+    [["first", "max", "min", "last", "sum"], ["mean", "count"], ["last", "first"]],
+)
+@pytest.mark.parametrize("kwargs", [{}, {"closed": "right", "label": "right"}])
+def test_agg_list_single_pass(funcs, kwargs):
+    # lists of these aggregations are computed in one pass over the bins
+    values = np.random.randn(500)
+    values[::7] = np.nan
+    df = DataFrame(
+        {
+            "A": values,
+            "B": np.arange(500) % 9,
+            "C": values.astype("float32"),
+            "D": np.full(500, 3),
+        },
+        index=date_range("2019-01-01", periods=500, freq="17s"),
+    )
+    df.iloc[100:150] = np.nan
+    df["B"] = df["B"].fillna(0).astype("int64")
+    df["D"] = df["D"].fillna(0).astype("int64")
+    df = df.drop(df.index[200:300])
+
+    result = df.resample("7min", **kwargs).agg(funcs)
+    keys = [(col, how) for col in df for how in funcs]
+    expected = pd.concat(
+        [getattr(df[col].resample("7min", **kwargs), how)() for col, how in keys],
+        axis=1,
+        keys=keys,
+    )
+    assert_frame_equal(result, expected)
+
+    result = df["A"].resample("7min", **kwargs).agg(funcs)
+    expected = pd.concat(
+        [getattr(df["A"].resample("7min", **kwargs), how)() for how in funcs],
+        axis=1,
+        keys=funcs,
+    )
+    assert_frame_equal(result, expected)
@@ -2094,3 +2094,101 @@ def test_merge_equal_cat_dtypes2():
 
     # Categorical is unordered, so don't check ordering.
     tm.assert_frame_equal(result, expected, check_categorical=False)
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [
+        np.arange(10),
+        np.arange(10.0),
+        list("abcdefghij"),
+        pd.date_range("2019-01-01", periods=10),
+        pd.date_range("2019-01-01", periods=10, tz="US/Eastern"),
+        pd.Categorical(list("abcdefghij")),
+    ],
+)
+def test_merge_hash_join_small_unique_side(monkeypatch, keys):
+    # the smaller right side with unique keys is hashed and the left side
+    # probed; results must match the factorizing join
+    np.random.seed(0)
+    keys = pd.Series(keys)
+    dim = DataFrame({"key": keys, "label": np.arange(len(keys))}).iloc[:7]
+    fact = DataFrame(
+        {
+            "key": keys.take(np.random.randint(0, 10, 100)).reset_index(drop=True),
+            "v": np.arange(100),
+        }
+    )
+
+    result = merge(fact, dim, on="key", how="left")
+    with monkeypatch.context() as m:
+        m.setattr("pandas.core.reshape.merge._HASH_JOIN_RATIO", np.inf)
+        expected = merge(fact, dim, on="key", how="left")
+    assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "dim_keys",
+    [
+        # duplicates fall back to the factorizing join
+        {"a": [1, 1, 2], "b": ["x", "x", "y"]},
+        # missing values fall back to the factorizing join
+        {"a": [1, np.nan, 2], "b": ["x", "y", None]},
+        {"a": [1, 1, 2], "b": ["x", "y", "x"]},
+    ],
+)
+def test_merge_hash_join_multiple_keys(monkeypatch, dim_keys):
+    np.random.seed(0)
+    dim = DataFrame(dim_keys).assign(label=lambda x: np.arange(len(x)))
+    fact = dim[["a", "b"]].take(np.random.randint(0, 3, 50)).reset_index(drop=True)
+    fact = fact.append(DataFrame({"a": [3, np.nan], "b": ["x", None]}))
+    fact["v"] = np.arange(len(fact))
+
+    result = merge(fact, dim, on=["a", "b"], how="left")
+    with monkeypatch.context() as m:
+        m.setattr("pandas.core.reshape.merge._HASH_JOIN_RATIO", np.inf)
+        expected = merge(fact, dim, on=["a", "b"], how="left")
+    assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+@pytest.mark.parametrize("sort", [True, False])
+@pytest.mark.parametrize(
+    "left_keys, right_keys",
+    [
+        ([0, 1, 1, 2, 4, 4, 4, 7], [1, 2, 3, 4, 5]),
+        ([1, 2, 3, 4, 5], [0, 1, 1, 2, 4, 4, 4, 7]),
+        ([0.5, 1.0, 1.0, 3.5], [-1.0, 1.0, 3.5]),
+        (
+            pd.to_datetime(["2019-01-01", "2019-01-02", "2019-01-02"]),
+            pd.to_datetime(["2019-01-02", "2019-01-03"]),
+        ),
+        ([], [1, 2]),
+        ([1, 1, 2, 2], [1, 1, 2]),
+    ],
+)
+def test_merge_sorted_keys(monkeypatch, how, sort, left_keys, right_keys):
+    # monotonic keys are joined with a merge-join instead of hashing;
+    # results must match the factorizing join
+    left = DataFrame({"key": left_keys, "a": np.arange(len(left_keys))})
+    right = DataFrame({"key": right_keys, "b": np.arange(len(right_keys))})
+
+    result = merge(left, right, on="key", how=how, sort=sort)
+    with monkeypatch.context() as m:
+        m.setattr("pandas.core.reshape.merge._sorted_join_indexers", lambda *args: None)
+        expected = merge(left, right, on="key", how=how, sort=sort)
+    assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_merge_sorted_multiple_keys(monkeypatch, how):
+    left = DataFrame(
+        {"a": [1, 1, 1, 2, 2, 3], "b": [-5, 0, 7, 0, 0, 1], "x": np.arange(6)}
+    )
+    right = DataFrame({"a": [1, 2, 2, 3, 4], "b": [7, -1, 0, 1, 0], "y": np.arange(5)})
+
+    result = merge(left, right, on=["a", "b"], how=how, sort=True)
+    with monkeypatch.context() as m:
+        m.setattr("pandas.core.reshape.merge._sorted_join_indexers", lambda *args: None)
+        expected = merge(left, right, on=["a", "b"], how=how, sort=True)
+    assert_frame_equal(result, expected)
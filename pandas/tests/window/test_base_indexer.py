@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from pandas import DataFrame, Series
+from pandas.api.indexers import BaseIndexer
+import pandas.util.testing as tm
+
+
+class ForwardIndexer(BaseIndexer):
+    # the current and the next window_size - 1 values
+    def get_window_bounds(self, num_values, min_periods, center, closed):
+        start = np.arange(num_values, dtype=np.int64)
+        end = np.minimum(start + self.window_size, num_values)
+        return start, end
+
+
+class BoundsIndexer(BaseIndexer):
+    # fixed bounds, passed as the start and end kwargs
+    def get_window_bounds(self, num_values, min_periods, center, closed):
+        return self.start, self.end
+
+
+def test_bad_get_window_bounds_signature():
+    s = Series(range(5))
+    with pytest.raises(NotImplementedError):
+        s.rolling(BaseIndexer()).sum()
+
+
+def test_indexer_kwargs_are_attributes():
+    indexer = BaseIndexer(window_size=3, foo="bar")
+    assert indexer.window_size == 3
+    assert indexer.foo == "bar"
+    assert indexer.index_array is None
+
+
+@pytest.mark.parametrize(
+    "f", ["sum", "mean", "median", "max", "min", "var", "std", "kurt", "skew", "count"]
+)
+def test_rolling_forward_window(f):
+    s = Series([1.0, 3.0, np.nan, 4.0, 2.0, 8.0, np.nan, np.nan, 5.0, 7.0])
+
+    result = getattr(s.rolling(ForwardIndexer(window_size=4), min_periods=1), f)()
+    expected = getattr(s[::-1].rolling(4, min_periods=1), f)()[::-1]
+    tm.assert_series_equal(result, expected)
+
+    result = s.rolling(ForwardIndexer(window_size=4), min_periods=1).quantile(0.4)
+    expected = s[::-1].rolling(4, min_periods=1).quantile(0.4)[::-1]
+    tm.assert_series_equal(result, expected)
+
+
+def test_rolling_forward_window_min_periods():
+    # min_periods defaults to the window_size
+    df = DataFrame({"A": [1.0, 2.0, 3.0, 4.0], "B": list("abcd")})
+    result = df.rolling(ForwardIndexer(window_size=2)).sum()
+    expected = DataFrame({"A": [3.0, 5.0, 7.0, np.nan]})
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "f", ["sum", "mean", "median", "max", "min", "var", "std", "count"]
+)
+def test_rolling_arbitrary_bounds(f):
+    # windows that move backwards, jump ahead or are empty are
+    # computed from scratch
+    start = np.array([0, 3, 1, 1, 4, 4, 0, 7, 2, 9], dtype=np.int64)
+    end = np.array([2, 6, 6, 3, 4, 8, 10, 9, 5, 10], dtype=np.int64)
+    s = Series([1.0, 3.0, np.nan, 4.0, 2.0, 8.0, np.nan, -1.0, 5.0, 7.0])
+
+    indexer = BoundsIndexer(start=start, end=end)
+
+    result = getattr(s.rolling(indexer, min_periods=1), f)()
+    expected = Series(
+        [
+            getattr(s.iloc[i:j], f)() if s.iloc[i:j].count() else np.nan
+            for i, j in zip(start, end)
+        ]
+    )
+    if f == "count":
+        expected = expected.fillna(0)
+    tm.assert_series_equal(result, expected)
+
+    result = s.rolling(indexer, min_periods=1).apply(np.nansum, raw=True)
+    expected = Series(
+        [
+            s.iloc[i:j].sum() if s.iloc[i:j].count() else np.nan
+            for i, j in zip(start, end)
+        ]
+    )
+    tm.assert_series_equal(result, expected)
+
+
+def test_rolling_window_bounds_arguments():
+    # the rolling arguments are passed to get_window_bounds
+    calls = []
+
+    class RecordingIndexer(ForwardIndexer):
+        def get_window_bounds(self, num_values, min_periods, center, closed):
+            calls.append((num_values, min_periods, center, closed))
+            return super().get_window_bounds(num_values, min_periods, center, closed)
+
+    s = Series(range(5))
+    s.rolling(RecordingIndexer(window_size=2), min_periods=1, center=True).sum()
+    s.rolling(RecordingIndexer(window_size=2), closed="left").mean()
+    assert calls == [(5, 1, True, None), (5, None, False, "left")]
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        ([0, 1, 2], [1, 2]),
+        ([0, -1, 2], [1, 2, 3]),
+        ([0, 2, 2], [1, 1, 3]),
+        ([0, 1, 2], [1, 2, 4]),
+    ],
+)
+def test_rolling_invalid_bounds(start, end):
+    s = Series(range(3))
+    indexer = BoundsIndexer(start=np.array(start), end=np.array(end))
+    with pytest.raises(ValueError, match="windows must"):
+        s.rolling(indexer).sum()
@@ -3,9 +3,12 @@ import pytest
 
 from pandas.errors import UnsupportedFunctionCall
 
+import pandas as pd
 from pandas import DataFrame, Series
+from pandas.core.base import DataError
 from pandas.core.window import EWM
 from pandas.tests.window.common import Base
+import pandas.util.testing as tm
 
 
 class TestEWM(Base):
@@ -68,3 +71,63 @@ class TestEWM(Base):
             getattr(e, method)(1, 2, 3)
         with pytest.raises(UnsupportedFunctionCall, match=msg):
             getattr(e, method)(dtype=np.float64)
+
+
+@pytest.mark.parametrize("adjust", [True, False])
+@pytest.mark.parametrize("ignore_na", [True, False])
+@pytest.mark.parametrize("min_periods", [0, 3])
+def test_ewm_online_series(adjust, ignore_na, min_periods):
+    s = Series(np.random.randn(50))
+    s[::3] = np.nan
+    s[:4] = np.nan
+
+    ewm = s.ewm(com=2, adjust=adjust, ignore_na=ignore_na, min_periods=min_periods)
+    expected = ewm.mean()
+
+    online = (
+        s[:2]
+        .ewm(com=2, adjust=adjust, ignore_na=ignore_na, min_periods=min_periods)
+        .online()
+    )
+    result = [expected[:2]]
+    for start, stop in [(2, 3), (3, 3), (3, 20), (20, 50)]:
+        result.append(online.update(s[start:stop]))
+    tm.assert_series_equal(pd.concat(result), expected)
+
+
+def test_ewm_online_frame():
+    df = DataFrame(
+        {"A": np.random.randn(10), "B": list("abcdefghij"), "C": np.arange(10)}
+    )
+    online = df[:4].ewm(span=3).online()
+    result = online.update(df[4:])
+    expected = df.ewm(span=3).mean()[4:]
+    tm.assert_frame_equal(result, expected)
+
+    with pytest.raises(ValueError, match="same columns"):
+        online.update(df[["A", "C"]])
+    with pytest.raises(TypeError, match="must be a DataFrame"):
+        online.update(df["A"])
+
+
+@pytest.mark.parametrize("start", [0, 4])
+def test_ewm_online_frame_non_numeric(start):
+    # non-numeric columns are excluded by dtype, whatever the initial rows
+    df = DataFrame(
+        {
+            "A": np.arange(10.0),
+            "B": list("abcdefghij"),
+            "C": [str(i) for i in range(10)],
+        }
+    )
+    online = df[:start].ewm(com=1).online()
+    result = online.update(df[start:])
+    expected = df[["A"]].ewm(com=1).mean()[start:]
+    tm.assert_frame_equal(result, expected)
+
+
+def test_ewm_online_invalid():
+    with pytest.raises(DataError, match="No numeric types"):
+        Series(list("abc")).ewm(com=1).online()
+    with pytest.raises(NotImplementedError, match="axis=0"):
+        DataFrame(np.ones((3, 2))).ewm(com=1, axis=1).online()
@@ -73,6 +73,59 @@ class TestGrouperGrouping:
         expected = g.apply(lambda x: x.rolling(4).quantile(0.5))
         tm.assert_frame_equal(result, expected)
 
+    @pytest.mark.parametrize(
+        "f", ["sum", "mean", "min", "max", "median", "std", "var", "skew", "kurt"]
+    )
+    @pytest.mark.parametrize("sort", [True, False])
+    def test_rolling_unsorted_groups(self, f, sort):
+        # the windows of all of the groups are computed at once over the
+        # rows sorted by group, rows with a missing key are not in any group
+        np.random.seed(0)
+        n = 200
+        df = DataFrame(
+            {
+                "A": np.random.randint(0, 15, n).astype(float),
+                "K": np.random.randint(0, 3, n),
+                "B": np.random.randn(n),
+                "C": ["foo", "bar"] * (n // 2),
+            }
+        )
+        df.loc[np.random.rand(n) < 0.1, "A"] = np.nan
+        df.loc[np.random.rand(n) < 0.1, "B"] = np.nan
+
+        for keys in ["A", ["A", "K"]]:
+            g = df.groupby(keys, sort=sort)
+            g_mutated = df.groupby(keys, sort=sort, mutated=True)
+
+            result = getattr(g.rolling(4, min_periods=2), f)()
+            expected = g_mutated.apply(
+                lambda x: getattr(x.rolling(4, min_periods=2), f)()
+            )
+            tm.assert_frame_equal(result, expected)
+
+            result = getattr(g.B.rolling(3), f)()
+            expected = g_mutated.B.apply(lambda x: getattr(x.rolling(3), f)())
+            tm.assert_series_equal(result, expected)
+
+    @pytest.mark.parametrize("closed", [None, "right", "left", "both", "neither"])
+    @pytest.mark.parametrize("f", ["sum", "mean", "max", "median", "std"])
+    def test_rolling_offset_unsorted_groups(self, f, closed):
+        np.random.seed(0)
+        n = 100
+        index = pd.to_datetime(np.sort(np.random.randint(0, 60, n)), unit="s")
+        df = DataFrame(
+            {"A": np.random.randint(0, 5, n), "B": np.random.randn(n)}, index=index
+        )
+        g = df.groupby("A")
+        g_mutated = df.groupby("A", mutated=True)
+
+        for window in ["2s", "10s"]:
+            result = getattr(g.rolling(window, closed=closed), f)()
+            expected = g_mutated.apply(
+                lambda x: getattr(x.rolling(window, closed=closed), f)()
+            )
+            tm.assert_frame_equal(result, expected)
+
     def test_rolling_corr_cov(self):
         g = self.frame.groupby("A")
         r = g.rolling(window=4)
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+import pandas.util._test_decorators as td
+
+from pandas import Series, date_range
+import pandas.core.util.numba_ as util_numba
+import pandas.core.window.numba_ as numba_
+import pandas.util.testing as tm
+
+
+def _python_kernel(func, args, engine_kwargs):
+    # pure python stand-in for the compiled kernel, so that the windows
+    # handed to the numba engine can be checked without numba
+    def kernel(values, start, end, counts, minp):
+        result = np.empty(len(start))
+        for i in range(len(start)):
+            if counts[i] >= minp:
+                result[i] = func(values[start[i] : end[i]], *args)
+            else:
+                result[i] = np.nan
+        return result
+
+    return kernel
+
+
+@pytest.fixture
+def python_kernel(monkeypatch):
+    monkeypatch.setattr(numba_, "get_rolling_apply", _python_kernel)
+
+
+@pytest.fixture
+def series():
+    values = np.arange(20, dtype=np.float64)
+    values[[3, 8, 9]] = np.nan
+    return Series(values, index=date_range("2019", periods=20, freq="s"))
+
+
+def f(x, *args):
+    return np.nansum(x) + sum(args)
+
+
+@pytest.mark.parametrize("window", [2, 3, 25])
+@pytest.mark.parametrize("center", [True, False])
+@pytest.mark.parametrize("min_periods", [None, 1, 2])
+@pytest.mark.parametrize("args", [(), (5,)])
+def test_windows_match_cython(python_kernel, series, window, center, min_periods, args):
+    roll = series.rolling(window, center=center, min_periods=min_periods)
+    result = roll.apply(f, raw=True, args=args, engine="numba")
+    expected = roll.apply(f, raw=True, args=args, engine="cython")
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("window", ["1s", "3s"])
+def test_variable_windows_match_cython(python_kernel, series, window, closed):
+    roll = series.rolling(window, closed=closed)
+    result = roll.apply(f, raw=True, engine="numba")
+    expected = roll.apply(f, raw=True, engine="cython")
+    tm.assert_series_equal(result, expected)
+
+
+def test_expanding_matches_cython(python_kernel, series):
+    result = series.expanding(2).apply(f, raw=True, engine="numba")
+    expected = series.expanding(2).apply(f, raw=True, engine="cython")
+    tm.assert_series_equal(result, expected)
+
+
+def test_invalid_engine():
+    s = Series(range(3))
+    with pytest.raises(ValueError, match="engine must be either"):
+        s.rolling(2).apply(f, raw=True, engine="foo")
+    with pytest.raises(ValueError, match="cython engine does not accept"):
+        s.rolling(2).apply(f, raw=True, engine_kwargs={"nopython": True})
+    with pytest.raises(ValueError, match="raw must be `True`"):
+        s.rolling(2).apply(f, raw=False, engine="numba")
+    with pytest.raises(ValueError, match="does not support kwargs"):
+        s.rolling(2).apply(f, raw=True, kwargs={"a": 1}, engine="numba")
+    with pytest.raises(ValueError, match="engine_kwargs only supports"):
+        util_numba.validate_engine_kwargs({"fastmath": True})
+
+
+@td.skip_if_no("numba", "0.46.0")
+@pytest.mark.parametrize("nogil", [True, False])
+@pytest.mark.parametrize("parallel", [True, False])
+@pytest.mark.parametrize("center", [True, False])
+def test_numba_vs_cython(series, nogil, parallel, center):
+    def g(x):
+        return np.nanmean(x) + 5
+
+    engine_kwargs = {"nogil": nogil, "parallel": parallel}
+    roll = series.rolling(3, center=center, min_periods=1)
+    result = roll.apply(g, raw=True, engine="numba", engine_kwargs=engine_kwargs)
+    expected = roll.apply(g, raw=True, engine="cython")
+    tm.assert_series_equal(result, expected)
+
+
+@td.skip_if_no("numba", "0.46.0")
+def test_cache():
+    def g(x):
+        return np.mean(x)
+
+    util_numba._numba_func_cache.clear()
+    s = Series(np.arange(10.0))
+    s.rolling(2).apply(g, raw=True, engine="numba")
+    assert len(util_numba._numba_func_cache) == 1
+
+    s.expanding().apply(g, raw=True, engine="numba")
+    assert len(util_numba._numba_func_cache) == 1
@@ -334,3 +334,68 @@ class TestRolling(Base):
         result = pd.Series(arr).rolling(2).mean()
         expected = pd.Series([np.nan, 2, np.nan, np.nan, 4])
         tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("window, min_periods", [(1, None), (3, None), (5, 2)])
+@pytest.mark.parametrize(
+    "func", ["sum", "mean", "std", "median", "max", "count", ["sum", "min"]]
+)
+def test_rolling_stateful(window, min_periods, func):
+    s = Series(np.random.randn(60))
+    s[::4] = np.nan
+
+    expected = s.rolling(window, min_periods=min_periods).agg(func)
+
+    stateful = s[:2].rolling(window, min_periods=min_periods).stateful(func)
+    result = [expected[:2]]
+    for start, stop in [(2, 3), (3, 3), (3, 20), (20, 60)]:
+        result.append(stateful.update(s[start:stop]))
+    tm.assert_almost_equal(pd.concat(result), expected)
+
+
+@pytest.mark.parametrize("closed", [None, "both", "left", "neither"])
+def test_rolling_stateful_offset(closed):
+    index = pd.date_range("2019-01-01", periods=30, freq="7min")
+    df = DataFrame({"A": np.random.randn(30), "B": np.arange(30)}, index=index)
+
+    expected = df.rolling("30min", closed=closed).sum()
+
+    stateful = df[:5].rolling("30min", closed=closed).stateful("sum")
+    result = [expected[:5], stateful.update(df[5:9]), stateful.update(df[9:])]
+    tm.assert_frame_equal(pd.concat(result), expected)
+
+    with pytest.raises(ValueError, match="monotonic"):
+        stateful.update(df[:3])
+
+
+def test_rolling_stateful_selection_and_on():
+    df = DataFrame(
+        {
+            "A": np.arange(10.0),
+            "B": np.arange(10.0) * 2,
+            "C": pd.date_range("2019-01-01", periods=10, freq="s"),
+        }
+    )
+
+    stateful = df[:4].rolling(3)["A"].stateful("mean")
+    result = stateful.update(df[4:])
+    expected = df.rolling(3)["A"].mean()[4:]
+    tm.assert_series_equal(result, expected)
+
+    stateful = df[:4].rolling("2s", on="C").stateful({"B": "sum"})
+    result = stateful.update(df[4:])
+    expected = df.rolling("2s", on="C").agg({"B": "sum"})[4:]
+    tm.assert_frame_equal(result, expected)
+
+    with pytest.raises(ValueError, match="same columns"):
+        stateful.update(df[["A", "B"]])
+    with pytest.raises(TypeError, match="must be a DataFrame"):
+        stateful.update(df["A"])
+
+
+def test_rolling_stateful_not_implemented():
+    s = Series(range(5))
+    with pytest.raises(NotImplementedError, match="center"):
+        s.rolling(2, center=True).stateful("sum")
+    with pytest.raises(NotImplementedError, match="groupby"):
+        DataFrame({"A": [1, 1], "B": [1, 2]}).groupby("A").rolling(2).stateful("sum")
@@ -613,6 +613,7 @@ ext_data = {
         "depends": ["pandas/_libs/src/skiplist.h"],
     },
     "_libs.sparse": {"pyxfile": "_libs/sparse", "depends": _pxi_dep["sparse"]},
+    "_libs.strings": {"pyxfile": "_libs/strings"},
     "_libs.tslib": {
         "pyxfile": "_libs/tslib",
         "include": ts_include,